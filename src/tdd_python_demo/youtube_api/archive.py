@@ -0,0 +1,236 @@
+"""Append-only archive of raw API responses with a random-access index.
+
+Each response is stored as its own gzip or zstd frame (a JSON header line
+with the status and headers, then the raw body) appended to a data file; a
+SQLite index next to it (``<path>.idx``) maps each request, and each
+resource ID found in its ``items``, to the frame's byte offset and length.
+Reading one response or resource back decompresses only its frame. The
+transports in ``transport`` use it to record a crawl and replay it without
+network access; ``YouTubeClient(archive=...)`` keeps every successful raw
+response for auditing. ``zstandard`` is optional and only needed for zstd
+frames.
+
+Every append writes its frame through to the OS and then commits its index
+rows, so other processes see it at once and a crash of the writer loses
+nothing; ``flush`` additionally syncs both files to disk.
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+from urllib.parse import urlencode
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+# Response headers the client looks at; everything else is dropped.
+KEPT_HEADERS = ("Content-Type", "Retry-After")
+
+CODECS = ("gzip", "zstd")
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    request TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resources (
+    resource_id TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+"""
+
+
+def request_key(url, params):
+    """Return the archive key of a GET: the URL plus sorted params, without the API key."""
+    query = urlencode(sorted((name, str(value)) for name, value in params.items() if name != "key"))
+    return f"{url}?{query}"
+
+
+def kept_headers(headers):
+    """Return the ``KEPT_HEADERS`` present in a response's headers."""
+    return {name: headers[name] for name in KEPT_HEADERS if name in headers}
+
+
+def item_id(item):
+    """Return the ID of an API resource (``id`` may be a search-result mapping)."""
+    resource_id = item.get("id")
+    if isinstance(resource_id, dict):
+        resource_id = next((value for name, value in resource_id.items() if name != "kind"), None)
+    return resource_id
+
+
+def resource_ids(data):
+    """Return the IDs of the resources in a decoded list response."""
+    if not isinstance(data, dict):
+        return []
+    return [rid for rid in (item_id(item) for item in data.get("items") or ()) if rid]
+
+
+def _decompress(frame):
+    if frame.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(frame)
+    return gzip.decompress(frame)
+
+
+class ArchivedResponse:
+    """Response read back from an archive, shaped like a ``requests`` response."""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    elapsed = None
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ResponseArchive:
+    """Compressed, indexed store of request → response pairs.
+
+    A request or resource recorded more than once (e.g. a 429 then a 200,
+    or a channel fetched on two days) resolves to its latest frame. Frames
+    of either codec may be mixed in one file. Safe to share between threads.
+
+    Args:
+        path: Data file; the index is kept in ``<path>.idx``
+        mode: ``"r"`` to read an existing archive, ``"a"`` to append
+        codec: ``"gzip"`` or ``"zstd"`` for new frames
+        compresslevel: Compression level (default 6 for gzip, 3 for zstd)
+
+    Raises:
+        RuntimeError: If zstd is requested but zstandard is not installed
+    """
+
+    def __init__(self, path, mode="r", codec="gzip", compresslevel=None):
+        if mode not in ("r", "a"):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        if codec not in CODECS:
+            raise ValueError(f"Unknown archive codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            raise RuntimeError("zstandard is not installed")
+        if mode == "r" and not os.path.exists(path):
+            raise RuntimeError(f"Archive not found: {path}")
+        self.path = path
+        self.mode = mode
+        self.codec = codec
+        self.compresslevel = compresslevel if compresslevel is not None else DEFAULT_LEVELS[codec]
+        self._lock = threading.Lock()
+        self._file = open(path, "ab+" if mode == "a" else "rb")
+        self._conn = sqlite3.connect(f"{path}.idx", check_same_thread=False)
+        if mode == "a":
+            # Per-append commits only need to survive a process crash; flush() syncs.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def _compress(self, payload):
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.compresslevel).compress(payload)
+        return gzip.compress(payload, compresslevel=self.compresslevel)
+
+    def append(self, key, status, headers, content, resource_ids=()):
+        """Append a response for request ``key``; returns its frame offset.
+
+        The frame is readable by other processes once this returns.
+
+        Args:
+            key: Request key (see ``request_key``)
+            status: HTTP status code
+            headers: Response headers to keep
+            content: Raw response body
+            resource_ids: IDs of the resources in the body, indexed for ``get_resource``
+        """
+        header = json.dumps({"status": status, "headers": headers}).encode()
+        frame = self._compress(header + b"\n" + content)
+        with self._lock:
+            self._file.seek(0, os.SEEK_END)
+            offset = self._file.tell()
+            self._file.write(frame)
+            self._file.flush()
+            self._conn.execute("INSERT OR REPLACE INTO responses (request, offset, length) VALUES (?, ?, ?)",
+                               (key, offset, len(frame)))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO resources (resource_id, offset, length) VALUES (?, ?, ?)",
+                [(resource_id, offset, len(frame)) for resource_id in resource_ids])
+            self._conn.commit()
+        return offset
+
+    def read_frame(self, offset, length):
+        """Decompress the frame at ``offset``; returns ``(status, headers, content)``."""
+        with self._lock:
+            self._file.seek(offset)
+            frame = self._file.read(length)
+        header, _, content = _decompress(frame).partition(b"\n")
+        meta = json.loads(header)
+        return meta["status"], meta["headers"], content
+
+    def get(self, key):
+        """Return the ``ArchivedResponse`` recorded for ``key``, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT offset, length FROM responses WHERE request = ?",
+                                     (key,)).fetchone()
+        if row is None:
+            return None
+        return ArchivedResponse(*self.read_frame(*row))
+
+    def find(self, resource_id):
+        """Return the latest ``ArchivedResponse`` containing ``resource_id``, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT offset, length FROM resources WHERE resource_id = ?",
+                                     (resource_id,)).fetchone()
+        if row is None:
+            return None
+        return ArchivedResponse(*self.read_frame(*row))
+
+    def get_resource(self, resource_id):
+        """Return the latest archived item (decoded dict) with ``resource_id``, or None."""
+        response = self.find(resource_id)
+        if response is None:
+            return None
+        return next((item for item in response.json().get("items") or ()
+                     if item_id(item) == resource_id), None)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM responses WHERE request = ?", (key,)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def flush(self):
+        """Sync every appended response and its index to disk."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._conn.commit()
+            self._conn.execute("PRAGMA wal_checkpoint")
+
+    def close(self):
+        """Flush (when appending) and release the files."""
+        if self.mode == "a":
+            self.flush()
+        self._file.close()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
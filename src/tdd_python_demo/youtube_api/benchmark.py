@@ -0,0 +1,114 @@
+"""Benchmark harness driving YouTubeClient against the local fake API server.
+
+Run with ``python -m tdd_python_demo.youtube_api.benchmark --workload comments``.
+"""
+
+import argparse
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import YouTubeClient
+from .fake_server import FakeYouTubeServer
+from .formatter import format_json
+
+WORKLOADS = {
+    "statistics": lambda client, i: client.get_video_statistics(f"vid{i}"),
+    "channel": lambda client, i: client.get_channel_profile(f"UC{i:06d}"),
+    "comments": lambda client, i: client.get_all_comments(f"vid{i}"),
+    "bulk": lambda client, i: client.get_recent_videos_bulk(
+        [f"UC{i:04d}{n:02d}" for n in range(50)], max_videos=5),
+}
+
+
+def percentile(sorted_values, pct):
+    """Return the nearest-rank percentile of an ascending list (None if empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_benchmark(operation, iterations=200, concurrency=8, server=None):
+    """Call ``operation(i)`` ``iterations`` times on ``concurrency`` threads.
+
+    Args:
+        operation: Callable taking the iteration index
+        iterations: Number of operations to run
+        concurrency: Worker threads
+        server: Optional ``FakeYouTubeServer`` whose request counter is used
+            to report HTTP requests per second
+
+    Returns:
+        Dict with operation and request throughput, error count and
+        p50/p99 operation latency in milliseconds
+    """
+    latencies = []
+    errors = 0
+
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            operation(i)
+            ok = True
+        except Exception:
+            ok = False
+        return ok, time.perf_counter() - start
+
+    requests_before = server.request_count if server is not None else 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for ok, elapsed in executor.map(timed, range(iterations)):
+            latencies.append(elapsed)
+            errors += not ok
+    seconds = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "operations": iterations,
+        "errors": errors,
+        "concurrency": concurrency,
+        "seconds": round(seconds, 4),
+        "operations_per_second": round(iterations / seconds, 2) if seconds else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+    }
+    if server is not None:
+        http_requests = server.request_count - requests_before
+        result["http_requests"] = http_requests
+        result["requests_per_second"] = round(http_requests / seconds, 2) if seconds else None
+    return result
+
+
+def main(argv=None):
+    """Entry point: start a fake server, run a workload and print JSON results."""
+    parser = argparse.ArgumentParser(description="Benchmark YouTubeClient against a local fake API")
+    parser.add_argument('--workload', choices=sorted(WORKLOADS), default='statistics', help='Client call to benchmark')
+    parser.add_argument('--iterations', type=int, default=200, help='Operations to run')
+    parser.add_argument('--concurrency', type=int, default=8, help='Worker threads')
+    parser.add_argument('--keys', type=int, default=3, help='Number of fake API keys')
+    parser.add_argument('--latency', type=float, default=0.0, help='Server latency in seconds')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Probability of 429 responses')
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help='Probability of 403 quotaExceeded')
+    parser.add_argument('--pages', type=int, default=3, help='Pages per paginated listing')
+    parser.add_argument('--comment-length', type=int, default=200, help='Characters per fake comment')
+    parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
+    args = parser.parse_args(argv)
+
+    server = FakeYouTubeServer(latency=args.latency, rate_limit_rate=args.rate_limit_rate,
+                               quota_error_rate=args.quota_error_rate, pages=args.pages,
+                               comment_length=args.comment_length)
+    with server:
+        keys = ",".join(f"bench-key-{i}" for i in range(args.keys))
+        client = YouTubeClient(keys, base_url=server.base_url)
+        workload = WORKLOADS[args.workload]
+        result = run_benchmark(lambda i: workload(client, i), iterations=args.iterations,
+                               concurrency=args.concurrency, server=server)
+
+    result["workload"] = args.workload
+    print(format_json(result, pretty=args.pretty))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
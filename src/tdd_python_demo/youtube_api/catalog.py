@@ -0,0 +1,135 @@
+"""Enumerate a channel's full video catalog with date-partitioned searches.
+
+``search`` stops paginating after about 500 results, and walking one query
+page by page is strictly sequential. ``CatalogEnumerator`` splits the time
+range into ``publishedAfter``/``publishedBefore`` windows, pages through
+them concurrently and halves any window whose result count reaches the
+cap, so large channels are enumerated as fast as the thread pool allows.
+
+Every ``search`` page costs 100 quota units; when only the newest uploads
+are needed, ``YouTubeClient.get_recent_videos_bulk`` is far cheaper.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+
+# Date of the first YouTube upload; nothing is published before it.
+YOUTUBE_EPOCH = datetime(2005, 4, 23, tzinfo=timezone.utc)
+# Results a single search query can page through.
+SEARCH_RESULT_CAP = 500
+SEARCH_FIELDS = "nextPageToken,pageInfo(totalResults),items(id(videoId),snippet(publishedAt))"
+
+
+def format_rfc3339(moment):
+    """Format an aware datetime as the RFC 3339 UTC string the API expects."""
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _split(after, before):
+    """Halve a window on a whole second (formatted bounds must not overlap)."""
+    middle = after + timedelta(seconds=int((before - after).total_seconds()) // 2)
+    return [(after, middle), (middle, before)]
+
+
+class CatalogEnumerator:
+    """List every video of a channel by searching date windows in parallel.
+
+    Args:
+        client: ``YouTubeClient`` shared by all workers
+        max_workers: Windows searched at the same time
+        initial_windows: Windows the range starts split into (default ``max_workers``)
+        page_size: Results per ``search`` page (at most 50)
+        result_cap: Results a query can return before it must be split
+        min_window: Seconds below which a window is no longer split
+    """
+
+    def __init__(self, client, max_workers=8, initial_windows=None, page_size=50,
+                 result_cap=SEARCH_RESULT_CAP, min_window=60):
+        self.client = client
+        self.max_workers = max_workers
+        self.initial_windows = initial_windows or max_workers
+        self.page_size = page_size
+        self.result_cap = result_cap
+        self.min_window = timedelta(seconds=min_window)
+        self.searches = 0
+        self.splits = 0
+        self._lock = threading.Lock()
+
+    def enumerate_channel(self, channel_id, start=None, end=None):
+        """Return every video published by a channel in ``[start, end)``.
+
+        Args:
+            channel_id: Channel ID (``UC...``)
+            start: Aware datetime of the earliest upload (default: YouTube's launch)
+            end: Aware datetime after the latest upload (default: now)
+
+        Returns:
+            List of ``{"video_id", "published_at"}`` dicts, newest first
+        """
+        start = start or YOUTUBE_EPOCH
+        end = end or datetime.now(timezone.utc)
+        step = (end - start) / self.initial_windows
+        bounds = [start + step * i for i in range(self.initial_windows)] + [end]
+        windows = [(after, before) for after, before in zip(bounds, bounds[1:]) if after < before]
+
+        videos = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending = {executor.submit(self._walk, channel_id, after, before) for after, before in windows}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    items, children = future.result()
+                    for item in items:
+                        videos[item["video_id"]] = item
+                    pending |= {executor.submit(self._walk, channel_id, after, before)
+                                for after, before in children}
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return sorted(videos.values(), key=lambda item: item["published_at"], reverse=True)
+
+    def _search(self, params):
+        with self._lock:
+            self.searches += 1
+        return self.client.request(f"{self.client.base_url}/search", params)
+
+    def _walk(self, channel_id, after, before):
+        """Page through one window; returns ``(items, child windows)``.
+
+        A window is split instead of paged when the API reports more
+        results than the cap, and split after paging when the cap was
+        reached anyway (items found so far are kept).
+        """
+        splittable = before - after >= 2 * self.min_window
+        params = {
+            "part": "id,snippet",
+            "channelId": channel_id,
+            "type": "video",
+            "order": "date",
+            "maxResults": self.page_size,
+            "publishedAfter": format_rfc3339(after),
+            "publishedBefore": format_rfc3339(before),
+            "fields": SEARCH_FIELDS,
+        }
+        items = []
+        response = self._search(params)
+        if splittable and response.get("pageInfo", {}).get("totalResults", 0) > self.result_cap:
+            return items, self._children(after, before)
+        while True:
+            items.extend(
+                {"video_id": item["id"]["videoId"], "published_at": item["snippet"]["publishedAt"]}
+                for item in response.get("items", [])
+            )
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+            response = self._search(dict(params, pageToken=page_token))
+        if splittable and len(items) >= self.result_cap:
+            return items, self._children(after, before)
+        return items, []
+
+    def _children(self, after, before):
+        with self._lock:
+            self.splits += 1
+        return _split(after, before)
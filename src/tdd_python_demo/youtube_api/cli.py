@@ -0,0 +1,136 @@
+"""CLI tool for YouTube video information and comments."""
+
+import sys
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+from .client import YouTubeClient
+from .formatter import format_comment, format_human, format_json, format_summary, format_table
+from .resolver import parse_video_id
+
+
+def _format_video(details, comments, args, comments_error=None):
+    """Render video details (and comments) in the requested format."""
+    if args.format == 'json':
+        data = dict(details)
+        if comments is not None:
+            data['comments'] = comments
+        if comments_error is not None:
+            data['comments_error'] = str(comments_error)
+        return format_json(data, pretty=args.pretty)
+    if args.format == 'table':
+        return format_table(details, comments)
+    if args.format == 'summary':
+        return format_summary(details)
+    lines = [format_human(details)]
+    if comments:
+        lines.append("")
+        lines.append("Comments:")
+        lines.extend(format_comment(comment) for comment in comments)
+    return "\n".join(lines)
+
+
+def _fetch_video(client, video_id, args):
+    """Fetch details and comments concurrently, so both cost about one round trip.
+
+    Returns ``(details, comments, comments_error)``: a failed comment fetch
+    (e.g. 403 ``commentsDisabled``) leaves the details usable.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        details = executor.submit(client.get_video_details, video_id)
+        comments = None
+        if args.max_comments > 0:
+            comments = executor.submit(client.get_all_comments, video_id,
+                                       page_size=args.page_size, max_comments=args.max_comments)
+        details = details.result()
+        if comments is None:
+            return details, [], None
+        try:
+            return details, comments.result(), None
+        except RuntimeError as e:
+            return details, [], e
+
+
+def _stream_all_comments(client, video_id, args):
+    """Print the video, then every comment page as it arrives.
+
+    JSON output is NDJSON: a ``{"video": ...}`` line followed by one
+    ``{"comment": ...}`` line per comment. The details call runs while the
+    first comment page is fetched.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        details = executor.submit(client.get_video_details, video_id)
+        page_token = None
+        first_page = True
+        while True:
+            comments, page_token = client.list_comments(video_id, page_size=args.page_size,
+                                                        max_comments=None, page_token=page_token)
+            if first_page:
+                if args.format == 'json':
+                    print(format_json({"video": details.result()}), flush=True)
+                else:
+                    print(_format_video(details.result(), None, args), flush=True)
+                first_page = False
+            for comment in comments:
+                if args.format == 'json':
+                    print(format_json({"comment": comment}))
+                else:
+                    print(format_comment(comment))
+            sys.stdout.flush()
+            if not page_token:
+                return 0
+
+
+def main():
+    """Main entry point for yt-fetch CLI."""
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Get YouTube video information and comments")
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument('--url', help='Video URL')
+    input_group.add_argument('--id', help='Video ID')
+
+    parser.add_argument('--max-comments', type=int, default=200, help='Max comments (0 for none)')
+    parser.add_argument('--page-size', type=int, default=100, help='Comments per page')
+    parser.add_argument('--all-comments', action='store_true', help='Stream every comment')
+    parser.add_argument('--stats-only', action='store_true', help='Only fetch statistics')
+    parser.add_argument('--format', choices=['json', 'human', 'table', 'summary'], default='json',
+                        help='Output format')
+    parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
+    parser.add_argument('--keys', help='API keys')
+
+    args = parser.parse_args()
+
+    api_keys = args.keys or os.getenv('YOUTUBE_API_KEYS') or os.getenv('YOUTUBE_API_KEY')
+    if not api_keys:
+        print("Error: No API key provided", file=sys.stderr)
+        return 1
+
+    try:
+        video_id = parse_video_id(args.url or args.id)
+        client = YouTubeClient(api_keys, records=True)
+
+        if args.stats_only:
+            stats = client.get_video_statistics(video_id)
+            if args.format == 'json':
+                output = format_json(stats, pretty=args.pretty)
+            else:
+                output = _format_video({"id": video_id, "views": stats["view_count"],
+                                        "likes": stats["like_count"]}, None, args)
+            print(output)
+            return 0
+
+        if args.all_comments:
+            return _stream_all_comments(client, video_id, args)
+
+        details, comments, comments_error = _fetch_video(client, video_id, args)
+        if comments_error is not None:
+            print(f"Warning: comments unavailable: {comments_error}", file=sys.stderr)
+        print(_format_video(details, comments, args, comments_error))
+        return 0
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
@@ -3,10 +3,104 @@
 import sys
 import argparse
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dotenv import load_dotenv
 
-from .client import YouTubeClient
+from .client import MAX_IDS_PER_REQUEST, YouTubeClient
 from .formatter import format_json, format_channel_profile
+from .resolver import HandleCache
+
+
+def read_inputs(source):
+    """Read channel inputs, one per line, from a file path or ``-`` for stdin.
+
+    Blank lines and lines starting with ``#`` are skipped.
+    """
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith('#')]
+
+
+def stream_profiles(client, inputs, concurrency=8, include_videos=False, max_videos=5):
+    """Resolve and fetch many channels concurrently, yielding results as they complete.
+
+    Inputs are resolved in parallel; resolved IDs are fetched in 50-ID
+    ``channels`` batches (plus ``get_recent_videos_bulk`` when videos are
+    requested) as soon as a batch fills or resolution finishes.
+
+    Args:
+        client: ``YouTubeClient`` to use
+        inputs: Channel IDs, handles or URLs (duplicates are fetched once)
+        concurrency: Worker threads
+        include_videos: Attach ``recent_videos`` to each profile
+        max_videos: Recent videos per channel
+
+    Yields:
+        ``(input, profile, error)`` tuples; exactly one of profile/error is None
+    """
+    def fetch(batch):
+        profiles = client.get_channel_profiles([channel_id for _, channel_id in batch])
+        errors = {}
+        if include_videos and profiles:
+            videos = client.get_recent_videos_bulk(list(profiles), max_videos=max_videos,
+                                                   max_workers=concurrency, errors=errors)
+            for channel_id, profile in profiles.items():
+                profile['recent_videos'] = videos.get(channel_id, [])
+        return profiles, errors
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = {executor.submit(client.resolve_channel_id, item): ('resolve', item)
+                   for item in dict.fromkeys(inputs)}
+        resolved = []
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, payload = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if kind == 'resolve':
+                        yield payload, None, e
+                    else:
+                        for item, _ in payload:
+                            yield item, None, e
+                    continue
+                if kind == 'resolve':
+                    resolved.append((payload, result))
+                    continue
+                profiles, errors = result
+                for item, channel_id in payload:
+                    if channel_id in errors:
+                        yield item, None, errors[channel_id]
+                    elif channel_id in profiles:
+                        yield item, profiles[channel_id], None
+                    else:
+                        yield item, None, RuntimeError(f"Channel not found: {item}")
+
+            resolving = any(kind == 'resolve' for kind, _ in pending.values())
+            while len(resolved) >= MAX_IDS_PER_REQUEST or (resolved and not resolving):
+                batch, resolved = resolved[:MAX_IDS_PER_REQUEST], resolved[MAX_IDS_PER_REQUEST:]
+                pending[executor.submit(fetch, batch)] = ('fetch', batch)
+
+
+def _run_many(client, inputs, args):
+    """Stream one result per input; returns 1 if any input failed."""
+    failed = False
+    for item, profile, error in stream_profiles(client, inputs, concurrency=args.concurrency,
+                                                include_videos=args.include_videos,
+                                                max_videos=args.max_videos):
+        failed = failed or error is not None
+        if args.format == 'json':
+            line = {"input": item, "channel": profile} if error is None else {"input": item, "error": str(error)}
+            print(format_json(line), flush=True)
+        elif error is None:
+            print(format_channel_profile(profile), flush=True)
+        else:
+            print(f"Error: {item}: {error}", file=sys.stderr, flush=True)
+    return 1 if failed else 0
 
 
 def main():
@@ -14,30 +108,47 @@ def main():
     load_dotenv()
 
     parser = argparse.ArgumentParser(description="Get YouTube channel information")
-    input_group = parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument('--id', help='Channel ID')
-    input_group.add_argument('--handle', help='Channel handle')
-    input_group.add_argument('--url', help='Channel URL')
+    parser.add_argument('--id', dest='inputs', action='append', help='Channel ID (repeatable)')
+    parser.add_argument('--handle', dest='inputs', action='append', help='Channel handle (repeatable)')
+    parser.add_argument('--url', dest='inputs', action='append', help='Channel URL (repeatable)')
+    parser.add_argument('--input', dest='input_file',
+                        help="File with one channel per line ('-' for stdin)")
 
     parser.add_argument('--include-videos', action='store_true', help='Include recent videos')
     parser.add_argument('--max-videos', type=int, default=5, help='Max recent videos')
     parser.add_argument('--format', choices=['json', 'human'], default='json', help='Output format')
     parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Worker threads when fetching several channels')
+    parser.add_argument('--handle-cache', help='SQLite file caching handle/URL lookups across runs')
     parser.add_argument('--keys', help='API keys')
 
     args = parser.parse_args()
 
+    inputs = list(args.inputs or [])
+    if args.input_file:
+        try:
+            inputs.extend(read_inputs(args.input_file))
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    if not inputs and not args.input_file:
+        parser.error("one of the arguments --id --handle --url --input is required")
+
     api_keys = args.keys or os.getenv('YOUTUBE_API_KEYS') or os.getenv('YOUTUBE_API_KEY')
     if not api_keys:
         print("Error: No API key provided", file=sys.stderr)
         return 1
 
-    channel_input = args.id or args.handle or args.url
-
     try:
-        client = YouTubeClient(api_keys)
+        handle_cache = HandleCache(args.handle_cache) if args.handle_cache else None
+        client = YouTubeClient(api_keys, handle_cache=handle_cache)
+        if len(inputs) != 1 or args.input_file:
+            # Several channels: one NDJSON line (or human block) per input.
+            return _run_many(client, inputs, args)
+
         channel_data = client.get_channel_profile(
-            channel_input,
+            inputs[0],
             include_recent_videos=args.include_videos,
             max_videos=args.max_videos
         )
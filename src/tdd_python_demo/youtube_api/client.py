@@ -1,56 +1,393 @@
 """YouTube Data API v3 client implementation."""
 
+import threading
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
+
+from .archive import kept_headers, request_key, resource_ids
+from .decoding import JSONDecoder
+from .key_pool import KeyPool
+from .metrics import EVENTS
+from .models import ChannelRecord, CommentRecord, VideoRecord, VideoStatistics, to_int
+from .quota import endpoint_cost, endpoint_name
+from .resolver import HandleCache, parse_channel_input
+from .retry import CircuitOpenError, RetryPolicy, parse_retry_after
+from .singleflight import SingleFlight
+from .transport import RequestsTransport
+
+API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# (connect, read) timeouts in seconds: fail fast on unreachable hosts, allow slow bodies.
+DEFAULT_TIMEOUT = (5.0, 20.0)
+
+# Most list endpoints accept at most 50 comma-separated IDs per call.
+MAX_IDS_PER_REQUEST = 50
+
+# Error reasons meaning a key's daily quota is spent (as opposed to a short rate limit).
+QUOTA_EXCEEDED_REASONS = ("quotaExceeded", "dailyLimitExceeded")
+# 403 reasons meaning the key is sending too fast; other 403s concern the resource.
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+# Parts fetched together by get_video_details (one request, 1 quota unit).
+VIDEO_DETAILS_PARTS = "snippet,contentDetails,status,topicDetails,statistics"
+
+# Partial-response selectors for the ``fields`` argument of the client methods.
+COMMENT_FIELDS = (
+    "nextPageToken,"
+    "items(id,snippet(videoId,totalReplyCount,topLevelComment(id,snippet("
+    "authorDisplayName,authorChannelId,textDisplay,likeCount,publishedAt,updatedAt))))"
+)
+VIDEO_STATISTICS_FIELDS = "items(statistics(viewCount,likeCount,commentCount))"
+CHANNEL_PROFILE_FIELDS = (
+    "items(snippet(title,description,customUrl,thumbnails),"
+    "statistics(viewCount,subscriberCount,videoCount))"
+)
+
+
+class ApiError(RuntimeError):
+    """Non-retryable error response; ``status`` and ``reason`` say which."""
+
+    def __init__(self, message, status, reason=None):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+
+
+def _chunks(items, size):
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
 
 class YouTubeClient:
-    def __init__(self, api_keys):
+    """YouTube Data API v3 client, safe to share between threads.
+
+    One client per process is the intended use: worker threads share its
+    connection pool, key pool, quota ledger, retry budget, circuit breaker
+    and caches. Key selection (and the quota reservation that comes with a
+    ledger) is a single locked step, so concurrent requests never hand out
+    the same last units of budget twice. ``key`` only reports the key most
+    recently used by any thread. Register hooks before sharing the client;
+    hook callbacks run on the calling worker threads.
+    """
+
+    def __init__(self, api_keys, rate_limiter=None, quota_ledger=None, key_pool=None,
+                 retry_policy=None, retry_budget=None, circuit_breaker=None,
+                 base_url=API_BASE_URL, decoder="auto", records=False, handle_cache=None,
+                 coalesce=False, pool_size=10, session=None, transport=None,
+                 archive=None, timeout=DEFAULT_TIMEOUT, hedging=None):
+        """Create a client for one or more comma-separated API keys.
+
+        Args:
+            api_keys: API key or comma-separated list of keys
+            rate_limiter: Optional ``TokenBucket`` pacing outgoing requests
+            quota_ledger: Optional ``QuotaLedger``; when set, each request goes
+                to the key with the most remaining budget for its endpoint
+            key_pool: Optional ``KeyPool`` to share between clients; by default
+                a round-robin pool (weighted by budget with a ledger) is built
+            retry_policy: ``RetryPolicy`` for backoff; defaults to decorrelated jitter
+            retry_budget: Optional ``RetryBudget``, typically shared process-wide
+            circuit_breaker: Optional ``CircuitBreaker`` shedding requests while
+                the backend keeps failing
+            base_url: API root, e.g. a local ``FakeYouTubeServer`` for load tests
+            decoder: JSON backend name (``"auto"`` picks orjson or msgspec when
+                installed, else the stdlib) or a ``JSONDecoder`` instance
+            records: Return slotted ``models`` records (read-only mappings with
+                lazy int conversion) instead of dicts, to save memory
+            handle_cache: ``HandleCache`` for handle/URL lookups; pass one with a
+                file path to keep them across runs (default: in-memory)
+            coalesce: Share one in-flight request between threads making the
+                same call at the same time (they then share the decoded
+                response, which must not be mutated); a ``SingleFlight`` may
+                be passed to coalesce across clients
+            pool_size: Keep-alive connections kept per host; match it to the
+                number of threads sharing the client
+            session: Optional ``requests.Session`` to use instead of a new
+                pooled one (its adapters are left untouched)
+            transport: Optional ``transport.Transport`` sending the requests;
+                defaults to a ``RequestsTransport`` over ``session`` (pass an
+                ``HTTPXTransport`` to multiplex calls over HTTP/2)
+            archive: Optional ``archive.ResponseArchive`` (append mode) keeping
+                the raw body of every successful response, indexed by
+                request and by the IDs of the resources it contains
+            timeout: ``(connect, read)`` timeouts in seconds (or one number for both)
+            hedging: Optional ``hedging.HedgingPolicy`` (closed with the client);
+                a request slower than its recent p95 is raced against one
+                duplicate, whose quota units are charged too
+        """
         if ',' in api_keys:
             self.keys = [k.strip() for k in api_keys.split(',')]
         else:
             self.keys = [api_keys]
         self.key = self.keys[0]
-        self._current_key_index = 0
+        self.rate_limiter = rate_limiter
+        self.quota_ledger = quota_ledger
+        if key_pool is None:
+            strategy = "weighted" if quota_ledger is not None else "round_robin"
+            key_pool = KeyPool(self.keys, strategy=strategy, quota_ledger=quota_ledger)
+        self.key_pool = key_pool
+        # Reserve quota atomically with key selection when the pool charges our ledger.
+        self._reserve = quota_ledger is not None and key_pool.quota_ledger is quota_ledger
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
+        self.base_url = base_url.rstrip("/")
+        self.decoder = decoder if isinstance(decoder, JSONDecoder) else JSONDecoder(decoder)
+        self.records = records
+        self.handle_cache = handle_cache if handle_cache is not None else HandleCache()
+        if coalesce is True:
+            coalesce = SingleFlight()
+        self.single_flight = coalesce or None
+        self._hooks = {}
+        self._hooks_lock = threading.Lock()
+        if transport is None:
+            transport = RequestsTransport(session, pool_size)
+        self.transport = transport
+        self.session = getattr(transport, "session", None)
+        self.archive = archive
+        self.timeout = timeout
+        self.hedging = hedging
+
+    def add_hook(self, event, callback):
+        """Register ``callback(event_data)`` for one of ``metrics.EVENTS``."""
+        if event not in EVENTS:
+            raise ValueError(f"Unknown hook event: {event}")
+        with self._hooks_lock:
+            # Copy on write: requests in flight keep iterating the old mapping.
+            hooks = {name: list(callbacks) for name, callbacks in self._hooks.items()}
+            hooks.setdefault(event, []).append(callback)
+            self._hooks = hooks
+
+    def add_hooks(self, target):
+        """Register every ``on_*`` event method of ``target`` (e.g. a ``MetricsCollector``)."""
+        for event in EVENTS:
+            callback = getattr(target, event, None)
+            if callback is not None:
+                self.add_hook(event, callback)
+
+    def close(self):
+        """Close the pooled HTTP connections and hedging workers, and flush the response archive."""
+        self.transport.close()
+        if self.hedging is not None:
+            self.hedging.close()
+        if self.archive is not None:
+            self.archive.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _emit(self, event, **data):
+        for callback in self._hooks.get(event, ()):
+            callback(data)
+
+    def _with_fields(self, params, fields):
+        """Add the partial-response ``fields`` selector to params when given."""
+        if fields:
+            params["fields"] = fields
+        return params
 
     def _to_int(self, value):
         """Convert string to int, return None if conversion fails."""
+        return to_int(value)
+
+    def _result(self, record):
+        """Return ``record`` itself in records mode, else as a plain dict."""
+        return record if self.records else record.to_dict()
+
+    def _error_reason(self, response):
+        """Return the first error reason of an API error response, if any."""
         try:
-            return int(value)
-        except (ValueError, TypeError):
+            error = response.json().get("error", {})
+        except (ValueError, AttributeError):
             return None
+        errors = error.get("errors") or [{}]
+        return errors[0].get("reason") or error.get("message")
+
+    def _acquire_key(self, cost):
+        """Take a key from the pool, briefly waiting for one to cool down if allowed."""
+        key = self.key_pool.acquire(cost, reserve=self._reserve)
+        if key is None and self.key_pool.next_available_in(cost) <= self.retry_policy.max_key_wait:
+            key = self.key_pool.wait_for_key(cost, timeout=self.retry_policy.max_key_wait,
+                                             sleep=time.sleep, reserve=self._reserve)
+        if key is None:
+            raise Exception("All API keys exhausted. Quota limit reached.")
+        return key
+
+    def _backoff(self, previous, retry_after=None, **event):
+        """Sleep before a retry and return the delay used."""
+        if self.retry_budget is not None and not self.retry_budget.try_withdraw():
+            raise RuntimeError("Retry budget exhausted; not retrying")
+        delay = self.retry_policy.next_delay(previous, retry_after)
+        if self._hooks:
+            self._emit("on_retry", delay=delay, **event)
+        time.sleep(delay)
+        return delay
+
+    def _record_outcome(self, success):
+        """Report an attempt's outcome to the circuit breaker; returns True once recorded."""
+        if self.circuit_breaker is None:
+            return True
+        if success:
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+        return True
 
     def request(self, url, params, max_retries=5):
-        """Make GET request with timeout and retry logic."""
+        """Make GET request with timeout and retry logic.
+
+        Keys come from ``key_pool``: a key answering 403 quotaExceeded is
+        parked until the daily reset; a 429 or 403 rate-limit error cools it
+        down for at least its ``Retry-After``. Any other 403 (e.g.
+        commentsDisabled, forbidden) is about the resource, not the key, and
+        raises ``RuntimeError`` with the reason. Network errors and 5xx responses are retried
+        with jittered backoff, subject to the retry budget and circuit breaker.
+        Registered hooks are notified of each step; without hooks no timing
+        or event data is collected. With ``coalesce`` enabled, concurrent
+        calls with the same URL and params (ignoring the key) share one request.
+        """
+        if self.single_flight is not None:
+            flight_key = (url, tuple(sorted((name, str(value)) for name, value in params.items()
+                                            if name != "key")), max_retries)
+            return self.single_flight.do(flight_key, lambda: self._request(url, params, max_retries))
+        return self._request(url, params, max_retries)
+
+    def _request(self, url, params, max_retries):
+        """Perform one logical request (see ``request``)."""
         params = params.copy()
+        cost = self.quota_ledger.cost(url) if self.quota_ledger is not None else endpoint_cost(url)
+        endpoint = endpoint_name(url)
+        hooks = self._hooks
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+        delay = None
 
         for attempt in range(max_retries):
-            params['key'] = self.key
+            last_attempt = attempt == max_retries - 1
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+                raise CircuitOpenError(f"Circuit open, shedding request to {url}")
+            recorded = False
             try:
-                response = requests.get(url, params=params, timeout=20)
-                if response.status_code in (403, 429):
-                    if self._rotate_key():
-                        continue
+                key = self._acquire_key(cost)
+                self.key = key
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                params['key'] = key
+                if hooks:
+                    self._emit("on_request", endpoint=endpoint, url=url, attempt=attempt, key=key)
+                    started = time.perf_counter()
+                try:
+                    response = self._send(url, params, key, cost)
+                except self.transport.errors:
+                    if self._reserve:
+                        self.quota_ledger.refund(key, cost)
+                    recorded = self._record_outcome(False)
+                    if last_attempt:
+                        raise
+                    delay = self._backoff(delay, endpoint=endpoint, reason="network", status=None,
+                                          attempt=attempt)
+                    continue
+
+                if self.quota_ledger is not None and not self._reserve:
+                    self.quota_ledger.charge(key, cost)
+                status = response.status_code
+                if status in (403, 429):
+                    if hooks:
+                        self._emit_response(response, endpoint, attempt, cost, time.perf_counter() - started)
+                    # The backend answered; key health is the pool's business.
+                    recorded = self._record_outcome(True)
+                    error_reason = self._error_reason(response) if status == 403 else None
+                    if status == 403 and error_reason not in QUOTA_EXCEEDED_REASONS + RATE_LIMIT_REASONS:
+                        raise ApiError(f"Request to {url} forbidden (403): {error_reason}", status, error_reason)
+                    if error_reason in QUOTA_EXCEEDED_REASONS:
+                        reason = "quota_exceeded"
+                        self.key_pool.report_quota_exceeded(key)
                     else:
-                        raise Exception(f"All API keys exhausted. Quota limit reached.")
-                return response.json()
-            except requests.exceptions.RequestException:
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                        reason = "rate_limited"
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        self.key_pool.report_rate_limited(key, retry_after)
+                    if hooks:
+                        self._emit("on_rotate", endpoint=endpoint, key=key, status=status, reason=reason,
+                                   attempt=attempt)
+                    continue
+                if status in self.retry_policy.retry_statuses:
+                    if hooks:
+                        self._emit_response(response, endpoint, attempt, cost, time.perf_counter() - started)
+                    recorded = self._record_outcome(False)
+                    if last_attempt:
+                        break
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    delay = self._backoff(delay, retry_after, endpoint=endpoint, reason="status",
+                                          status=status, attempt=attempt)
+                    continue
+                if status >= 400:
+                    if hooks:
+                        self._emit_response(response, endpoint, attempt, cost, time.perf_counter() - started)
+                    if status >= 500:
+                        recorded = self._record_outcome(False)
+                    error_reason = self._error_reason(response)
+                    raise ApiError(f"Request to {url} failed ({status}): {error_reason}", status, error_reason)
+
+                if hooks:
+                    seconds = time.perf_counter() - started
+                    data = self.decoder.decode_response(response)
+                    decode_seconds = time.perf_counter() - started - seconds
+                    self._emit_response(response, endpoint, attempt, cost, seconds, decode_seconds)
                 else:
-                    raise
+                    data = self.decoder.decode_response(response)
+                recorded = self._record_outcome(True)
+                self.key_pool.report_success(key)
+                if self.archive is not None:
+                    self.archive.append(request_key(url, params), status, kept_headers(response.headers),
+                                        response.content, resource_ids(data))
+                return data
+            finally:
+                # A half-open trial that ended without a verdict (no key, an
+                # exception) must give its slot back or the circuit stays shut.
+                if self.circuit_breaker is not None and not recorded:
+                    self.circuit_breaker.release()
 
-    def _rotate_key(self):
-        """Rotate to next API key. Returns True if rotated, False if no more keys."""
-        if len(self.keys) > 1 and self._current_key_index < len(self.keys) - 1:
-            self._current_key_index += 1
-            self.key = self.keys[self._current_key_index]
-            return True
-        return False
+        raise RuntimeError(f"Request to {url} failed after {max_retries} attempts")
 
-    def list_comments(self, video_id, page_size=100, max_comments=200, page_token=None):
-        """Fetch comments for a video with pagination support."""
-        url = "https://www.googleapis.com/youtube/v3/commentThreads"
+    def _send(self, url, params, key, cost):
+        """Send one attempt through the transport, hedged when a policy is set."""
+        if self.hedging is None:
+            return self.transport.get(url, params, self.timeout)
+        params = dict(params)
+        response, hedged = self.hedging.call(lambda: self.transport.get(url, params, self.timeout), cost)
+        if hedged and self.quota_ledger is not None:
+            self.quota_ledger.charge(key, cost)
+        return response
+
+    def _emit_response(self, response, endpoint, attempt, units, seconds, decode_seconds=0.0):
+        """Notify ``on_response`` hooks about a received response."""
+        elapsed = getattr(response, "elapsed", None)
+        self._emit(
+            "on_response",
+            endpoint=endpoint,
+            status=response.status_code,
+            seconds=seconds,
+            server_seconds=elapsed.total_seconds() if hasattr(elapsed, "total_seconds") else None,
+            decode_seconds=decode_seconds,
+            bytes=len(response.content or b""),
+            units=units,
+            attempt=attempt,
+        )
+
+    def list_comments(self, video_id, page_size=100, max_comments=200, page_token=None, fields=None,
+                      order=None):
+        """Fetch one page of comments for a video, capped at max_comments.
+
+        Pass ``fields`` (e.g. ``COMMENT_FIELDS``) to request a partial response
+        and ``order="time"`` for newest-first threads.
+        """
+        url = f"{self.base_url}/commentThreads"
+        if max_comments is not None:
+            if max_comments <= 0:
+                return [], None
+            page_size = min(page_size, max_comments)
         params = {
             "part": "snippet",
             "videoId": video_id,
@@ -59,18 +396,62 @@ class YouTubeClient:
         }
         if page_token:
             params["pageToken"] = page_token
-        response = self.request(url, params)
+        if order:
+            params["order"] = order
+        response = self.request(url, self._with_fields(params, fields))
         comments = response.get("items", [])
+        if max_comments is not None:
+            comments = comments[:max_comments]
+        if self.records:
+            comments = [CommentRecord.from_item(item) for item in comments]
         next_page_token = response.get("nextPageToken")
         return comments, next_page_token
 
-    def get_all_comments(self, video_id, page_size=100):
-        """Fetch all comments for a video using pagination."""
+    def list_comment_replies(self, parent_id, page_size=100, page_token=None, fields=None):
+        """Fetch one page of replies to a top-level comment via the ``comments`` endpoint."""
+        params = {
+            "part": "snippet",
+            "parentId": parent_id,
+            "maxResults": page_size,
+            "textFormat": "plainText"
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        response = self.request(f"{self.base_url}/comments", self._with_fields(params, fields))
+        replies = response.get("items", [])
+        if self.records:
+            replies = [CommentRecord.from_comment(item) for item in replies]
+        return replies, response.get("nextPageToken")
+
+    def get_all_comment_replies(self, parent_id, page_size=100, fields=None):
+        """Fetch every reply to a top-level comment."""
+        replies = []
+        page_token = None
+        while True:
+            page, page_token = self.list_comment_replies(parent_id, page_size=page_size,
+                                                         page_token=page_token, fields=fields)
+            replies.extend(page)
+            if not page_token:
+                return replies
+
+    def get_all_comments(self, video_id, page_size=100, max_comments=None, fields=None):
+        """Fetch all comments for a video using pagination.
+
+        Stops exactly at ``max_comments`` when given, requesting only the
+        remaining number of comments on the last page.
+        """
         all_comments = []
         page_token = None
 
-        while True:
-            comments, page_token = self.list_comments(video_id, page_size=page_size, page_token=page_token)
+        while max_comments is None or len(all_comments) < max_comments:
+            kwargs = {}
+            size = page_size
+            if max_comments is not None:
+                size = min(page_size, max_comments - len(all_comments))
+                kwargs["max_comments"] = size
+            if fields:
+                kwargs["fields"] = fields
+            comments, page_token = self.list_comments(video_id, page_size=size, page_token=page_token, **kwargs)
             all_comments.extend(comments)
 
             if not page_token:
@@ -78,49 +459,144 @@ class YouTubeClient:
 
         return all_comments
 
-    def get_video_statistics(self, video_id):
+    def get_video_statistics(self, video_id, fields=None):
         """Get video statistics (view, like, comment counts)."""
-        url = "https://www.googleapis.com/youtube/v3/videos"
+        url = f"{self.base_url}/videos"
         params = {"part": "statistics", "id": video_id}
-        response = self.request(url, params)
+        response = self.request(url, self._with_fields(params, fields))
 
         if not response.get("items"):
             raise RuntimeError("Video not found")
 
-        stats = response["items"][0]["statistics"]
+        return self._result(VideoStatistics.from_item(response["items"][0]))
+
+    def get_video_details(self, video_id, fields=None):
+        """Get full video details from one ``videos`` call with every needed part.
+
+        Returns:
+            Flat dict of snippet, contentDetails, status, topicDetails and
+            statistics fields; counts are ints (``views``, ``likes``,
+            ``comment_count``)
+        """
+        params = {"part": VIDEO_DETAILS_PARTS, "id": video_id}
+        response = self.request(f"{self.base_url}/videos", self._with_fields(params, fields))
+
+        if not response.get("items"):
+            raise RuntimeError(f"Video not found: {video_id}")
+
+        item = response["items"][0]
+        snippet = item.get("snippet", {})
+        content = item.get("contentDetails", {})
+        status = item.get("status", {})
+        statistics = item.get("statistics", {})
         return {
-            "view_count": self._to_int(stats.get("viewCount")),
-            "like_count": self._to_int(stats.get("likeCount")),
-            "comment_count": self._to_int(stats.get("commentCount"))
+            "id": item.get("id", video_id),
+            "title": snippet.get("title"),
+            "description": snippet.get("description"),
+            "channel": snippet.get("channelTitle"),
+            "channel_id": snippet.get("channelId"),
+            "published_at": snippet.get("publishedAt"),
+            "tags": snippet.get("tags", []),
+            "category_id": snippet.get("categoryId"),
+            "thumbnails": snippet.get("thumbnails", {}),
+            "duration": content.get("duration"),
+            "definition": content.get("definition"),
+            "caption": content.get("caption"),
+            "privacy_status": status.get("privacyStatus"),
+            "license": status.get("license"),
+            "embeddable": status.get("embeddable"),
+            "made_for_kids": status.get("madeForKids"),
+            "topic_categories": item.get("topicDetails", {}).get("topicCategories", []),
+            "views": self._to_int(statistics.get("viewCount")),
+            "likes": self._to_int(statistics.get("likeCount")),
+            "comment_count": self._to_int(statistics.get("commentCount")),
         }
 
-    def resolve_channel_id(self, input_str):
-        """Resolve channel input to channel ID."""
-        # If it's already a channel ID (starts with UC), return it
-        if input_str.startswith("UC"):
-            return input_str
-
-        # If it's a handle (starts with @), resolve it via API
-        if input_str.startswith("@"):
-            handle = input_str[1:]
-            response = self.request("https://www.googleapis.com/youtube/v3/channels",
-                                   {"part": "id", "forHandle": handle})
+    def resolve_channel_id(self, input_str, fields=None):
+        """Resolve a channel ID, @handle or channel URL to a channel ID.
+
+        Handle, ``/c/`` and ``/user/`` lookups go through ``handle_cache``,
+        including negative results for unknown names.
+        """
+        kind, value = parse_channel_input(input_str)
+        if kind == "id":
+            return value
+        channel_id = self._resolve_cached(kind, value, fields)
+        if channel_id is None:
+            raise RuntimeError(f"Channel not found for {kind}: {input_str}")
+        return channel_id
+
+    def resolve_channel_ids(self, inputs, max_workers=8, fields=None):
+        """Resolve many inputs, looking up each distinct uncached name once, concurrently.
+
+        Returns:
+            Dict mapping each input to its channel ID, or None if it is
+            unrecognised or unknown
+        """
+        lookups = {}
+        for input_str in inputs:
+            try:
+                kind, value = parse_channel_input(input_str)
+            except RuntimeError:
+                continue
+            lookups.setdefault(HandleCache.key(kind, value), (kind, value))
+
+        def resolve(lookup):
+            kind, value = lookup
+            return value if kind == "id" else self._resolve_cached(kind, value, fields)
+
+        resolved = {}
+        if lookups:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(lookups))) as executor:
+                resolved = dict(zip(lookups, executor.map(resolve, lookups.values())))
+
+        result = {}
+        for input_str in inputs:
+            try:
+                result[input_str] = resolved[HandleCache.key(*parse_channel_input(input_str))]
+            except RuntimeError:
+                result[input_str] = None
+        return result
+
+    def _resolve_cached(self, kind, value, fields=None):
+        """Return the channel ID of a name lookup (None if unknown), using the cache."""
+        hit, channel_id = self.handle_cache.get(kind, value)
+        if hit:
+            return channel_id
+        channel_id = self._lookup_channel(kind, value, fields)
+        self.handle_cache.set(kind, value, channel_id)
+        return channel_id
+
+    def _lookup_channel(self, kind, value, fields=None):
+        """Look a handle, custom name or username up via ``channels``; None if unknown.
+
+        Custom ``/c/`` names were migrated to handles, so they are tried as a
+        handle first and as a legacy username second.
+        """
+        filters = {"handle": ["forHandle"], "username": ["forUsername"],
+                   "custom": ["forHandle", "forUsername"]}[kind]
+        for name in filters:
+            response = self.request(f"{self.base_url}/channels",
+                                    self._with_fields({"part": "id", name: value}, fields))
             if response.get("items"):
                 return response["items"][0]["id"]
-            raise RuntimeError(f"Channel not found for handle: {input_str}")
+        return None
 
-        raise RuntimeError(f"Unable to resolve channel ID from: {input_str}")
+    def _get_recent_videos(self, channel_id, max_videos=5, fields=None):
+        """Get recent videos for a channel.
 
-    def _get_recent_videos(self, channel_id, max_videos=5):
-        """Get recent videos for a channel."""
+        ``fields`` applies to the ``videos`` lookup; the search call always
+        requests only the video IDs.
+        """
         search_response = self.request(
-            "https://www.googleapis.com/youtube/v3/search",
+            f"{self.base_url}/search",
             {
                 "part": "id",
                 "channelId": channel_id,
                 "order": "date",
                 "type": "video",
-                "maxResults": max_videos
+                "maxResults": max_videos,
+                "fields": "items(id(videoId))"
             }
         )
 
@@ -129,52 +605,153 @@ class YouTubeClient:
             return []
 
         videos_response = self.request(
-            "https://www.googleapis.com/youtube/v3/videos",
-            {
+            f"{self.base_url}/videos",
+            self._with_fields({
                 "part": "snippet,statistics",
                 "id": ",".join(video_ids)
+            }, fields)
+        )
+
+        return [self._parse_recent_video(item) for item in videos_response.get("items", [])]
+
+    def _parse_recent_video(self, item):
+        """Build the recent-video result from a ``videos`` resource."""
+        return self._result(VideoRecord.from_item(item))
+
+    def _get_uploads_playlists(self, channel_ids):
+        """Map up to 50 channel IDs to their uploads playlist ID in one ``channels`` call."""
+        response = self.request(
+            f"{self.base_url}/channels",
+            {
+                "part": "contentDetails",
+                "id": ",".join(channel_ids),
+                "maxResults": MAX_IDS_PER_REQUEST,
+                "fields": "items(id,contentDetails(relatedPlaylists(uploads)))"
             }
         )
+        playlists = {}
+        for item in response.get("items", []):
+            uploads = item.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+            if uploads:
+                playlists[item["id"]] = uploads
+        return playlists
 
-        results = []
-        for item in videos_response.get("items", []):
-            snippet = item.get("snippet", {})
-            statistics = item.get("statistics", {})
-            results.append({
-                "id": item.get("id"),
-                "title": snippet.get("title"),
-                "description": snippet.get("description"),
-                "view_count": self._to_int(statistics.get("viewCount")),
-                "like_count": self._to_int(statistics.get("likeCount"))
-            })
-
-        return results
-
-    def get_channel_profile(self, channel_input, include_recent_videos=False, max_videos=5):
+    def _get_playlist_video_ids(self, playlist_id, max_videos):
+        """Return up to ``max_videos`` video IDs from the head of a playlist."""
+        video_ids = []
+        page_token = None
+        while len(video_ids) < max_videos:
+            params = {
+                "part": "contentDetails",
+                "playlistId": playlist_id,
+                "maxResults": min(MAX_IDS_PER_REQUEST, max_videos - len(video_ids)),
+                "fields": "nextPageToken,items(contentDetails(videoId))"
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            response = self.request(f"{self.base_url}/playlistItems", params)
+            video_ids.extend(item["contentDetails"]["videoId"] for item in response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+        return video_ids[:max_videos]
+
+    def get_recent_videos_bulk(self, channel_ids, max_videos=5, max_workers=8, fields=None, errors=None):
+        """Get recent videos for many channels at a fraction of the search quota.
+
+        Looks up uploads playlists in 50-ID ``channels`` calls, reads each
+        playlist (1 unit per page instead of 100 for ``search``), then fetches
+        statistics for all collected videos in combined 50-ID ``videos`` calls.
+        Each stage runs concurrently across channels.
+
+        Args:
+            channel_ids: Channel IDs (``UC...``)
+            max_videos: Recent videos per channel
+            max_workers: Threads used for the playlist and ``videos`` calls
+            fields: Optional partial-response selector for the ``videos`` calls
+            errors: Optional dict filled with ``{channel_id: exception}`` for
+                channels whose uploads could not be read
+
+        Returns:
+            Dict mapping each channel ID to its list of recent videos, newest
+            first; channels without uploads (including a 404 uploads
+            playlist) map to an empty list, channels that failed are left out
+        """
+        channel_ids = list(dict.fromkeys(channel_ids))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            playlists = {}
+            for batch_playlists in executor.map(self._get_uploads_playlists,
+                                                _chunks(channel_ids, MAX_IDS_PER_REQUEST)):
+                playlists.update(batch_playlists)
+
+            futures = {
+                channel_id: executor.submit(self._get_playlist_video_ids, playlists[channel_id], max_videos)
+                for channel_id in channel_ids if channel_id in playlists
+            }
+            ids_by_channel = {}
+            failed = set()
+            for channel_id, future in futures.items():
+                try:
+                    ids_by_channel[channel_id] = future.result()
+                except Exception as exc:
+                    if isinstance(exc, ApiError) and exc.status == 404:  # no public uploads
+                        ids_by_channel[channel_id] = []
+                        continue
+                    failed.add(channel_id)
+                    if errors is not None:
+                        errors[channel_id] = exc
+
+            all_ids = list(dict.fromkeys(vid for ids in ids_by_channel.values() for vid in ids))
+            responses = executor.map(
+                lambda batch: self.request(
+                    f"{self.base_url}/videos",
+                    self._with_fields({"part": "snippet,statistics", "id": ",".join(batch)}, fields)
+                ),
+                _chunks(all_ids, MAX_IDS_PER_REQUEST)
+            )
+            videos = {
+                item.get("id"): self._parse_recent_video(item)
+                for response in responses for item in response.get("items", [])
+            }
+
+        return {
+            channel_id: [videos[vid] for vid in ids_by_channel.get(channel_id, []) if vid in videos]
+            for channel_id in channel_ids if channel_id not in failed
+        }
+
+    def get_channel_profile(self, channel_input, include_recent_videos=False, max_videos=5, fields=None):
         """Get channel profile information."""
         channel_id = self.resolve_channel_id(channel_input)
-        response = self.request("https://www.googleapis.com/youtube/v3/channels",
-                               {"part": "snippet,statistics", "id": channel_id})
+        response = self.request(f"{self.base_url}/channels",
+                               self._with_fields({"part": "snippet,statistics", "id": channel_id}, fields))
 
         if not response.get("items"):
             raise RuntimeError(f"Channel not found: {channel_input}")
 
-        item = response["items"][0]
-        snippet = item.get("snippet", {})
-        statistics = item.get("statistics", {})
+        record = ChannelRecord.from_item(channel_id, response["items"][0])
+        if include_recent_videos:
+            record.recent_videos = self._get_recent_videos(channel_id, max_videos=max_videos)
 
-        result = {
-            "id": channel_id,
-            "title": snippet.get("title"),
-            "description": snippet.get("description"),
-            "custom_url": snippet.get("customUrl"),
-            "thumbnails": snippet.get("thumbnails", {}),
-            "view_count": self._to_int(statistics.get("viewCount")),
-            "subscriber_count": self._to_int(statistics.get("subscriberCount")),
-            "video_count": self._to_int(statistics.get("videoCount"))
-        }
+        return self._result(record)
 
-        if include_recent_videos:
-            result["recent_videos"] = self._get_recent_videos(channel_id, max_videos=max_videos)
+    def get_channel_profiles(self, channel_ids, fields=None):
+        """Get profiles of many channels in 50-ID ``channels`` calls.
 
-        return result
+        Args:
+            channel_ids: Channel IDs (``UC...``)
+            fields: Optional partial-response selector; it must keep ``items(id)``
+
+        Returns:
+            Dict mapping each found channel ID to its profile; unknown IDs are omitted
+        """
+        profiles = {}
+        for batch in _chunks(list(dict.fromkeys(channel_ids)), MAX_IDS_PER_REQUEST):
+            response = self.request(
+                f"{self.base_url}/channels",
+                self._with_fields({"part": "snippet,statistics", "id": ",".join(batch),
+                                   "maxResults": MAX_IDS_PER_REQUEST}, fields)
+            )
+            for item in response.get("items", []):
+                profiles[item["id"]] = self._result(ChannelRecord.from_item(item["id"], item))
+        return profiles
@@ -0,0 +1,166 @@
+"""Concurrent comment crawler that walks top-level threads and fetches their replies."""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .models import CommentRecord
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+def _thread_info(thread):
+    """Return (thread ID, total reply count) for a raw thread or a CommentRecord."""
+    if isinstance(thread, CommentRecord):
+        return thread.id, thread.reply_count or 0
+    return thread.get("id"), thread.get("snippet", {}).get("totalReplyCount", 0)
+
+
+class CommentCrawler:
+    """Crawl full comment threads (top-level comment plus every reply) of videos.
+
+    Top-level pages are walked per video in API order while reply pages are
+    fanned out to a bounded thread pool. At most ``max_pending`` reply fetches
+    are in flight, threads waiting to be emitted per video and results
+    buffered for the consumer; walking blocks once a bound is reached, so
+    memory stays flat however large the video is.
+
+    Args:
+        client: ``YouTubeClient`` shared by all workers
+        max_workers: Threads fetching reply pages
+        max_pending: Reply fetches in flight / threads and results buffered ahead of the consumer
+        per_video_concurrency: Reply fetches in flight for any one video
+        max_concurrent_videos: Videos walked at the same time by ``crawl_many``
+        ordered: Yield each video's threads in API order (True) or as soon as
+            their replies arrive (False)
+        page_size: Page size for ``commentThreads`` and ``comments`` calls
+    """
+
+    def __init__(self, client, max_workers=8, max_pending=64, per_video_concurrency=4,
+                 max_concurrent_videos=4, ordered=True, page_size=100):
+        self.client = client
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.per_video_concurrency = per_video_concurrency
+        self.max_concurrent_videos = max_concurrent_videos
+        self.ordered = ordered
+        self.page_size = page_size
+
+    def crawl(self, video_id, include_replies=True):
+        """Yield ``{"video_id", "thread", "replies"}`` for every thread of one video."""
+        return self.crawl_many([video_id], include_replies=include_replies)
+
+    def crawl_many(self, video_ids, include_replies=True):
+        """Yield ``{"video_id", "thread", "replies"}`` for every thread of many videos.
+
+        Videos are walked concurrently, so threads of different videos
+        interleave; ``ordered`` only applies within a video. Errors raised
+        while crawling are re-raised to the consumer. Closing the generator
+        early stops the crawl.
+        """
+        results = queue.Queue(maxsize=self.max_pending)
+        in_flight = threading.BoundedSemaphore(self.max_pending)
+        stop = threading.Event()
+        reply_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        video_pool = ThreadPoolExecutor(max_workers=self.max_concurrent_videos)
+        try:
+            for video_id in video_ids:
+                video_pool.submit(self._walk_video, video_id, include_replies, reply_pool,
+                                  in_flight, results, stop)
+            remaining = len(video_ids)
+            while remaining:
+                item = results.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            reply_pool.shutdown(wait=False, cancel_futures=True)
+            video_pool.shutdown(wait=True)
+            reply_pool.shutdown(wait=True)
+
+    def _wait(self, acquire, stop):
+        """Retry a blocking step until it succeeds or the crawl is stopped."""
+        while not stop.is_set():
+            if acquire():
+                return True
+        return False
+
+    def _put(self, results, item, stop):
+        def put():
+            try:
+                results.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                return False
+        return self._wait(put, stop)
+
+    def _walk_video(self, video_id, include_replies, reply_pool, in_flight, results, stop):
+        video_slots = threading.BoundedSemaphore(self.per_video_concurrency)
+        pending = deque()
+
+        def release(_future):
+            video_slots.release()
+            in_flight.release()
+
+        try:
+            page_token = None
+            while not stop.is_set():
+                threads, page_token = self.client.list_comments(
+                    video_id, page_size=self.page_size, max_comments=None, page_token=page_token)
+                for thread in threads:
+                    thread_id, reply_count = _thread_info(thread)
+                    future = None
+                    if include_replies and reply_count:
+                        if not self._wait(lambda: video_slots.acquire(timeout=_POLL_SECONDS), stop):
+                            return
+                        if not self._wait(lambda: in_flight.acquire(timeout=_POLL_SECONDS), stop):
+                            video_slots.release()
+                            return
+                        future = reply_pool.submit(self.client.get_all_comment_replies,
+                                                   thread_id, self.page_size)
+                        future.add_done_callback(release)
+                    pending.append((thread, future))
+                    if not self._flush(video_id, pending, results, stop, limit=self.max_pending - 1):
+                        return
+                if not page_token:
+                    break
+            self._flush(video_id, pending, results, stop, limit=0)
+        except Exception as exc:
+            self._put(results, exc, stop)
+        finally:
+            self._put(results, _DONE, stop)
+
+    def _flush(self, video_id, pending, results, stop, limit):
+        """Emit finished threads, waiting while more than ``limit`` remain. Returns False if stopped."""
+        if self.ordered:
+            while pending and (len(pending) > limit or pending[0][1] is None or pending[0][1].done()):
+                if not self._emit(video_id, *pending.popleft(), results, stop):
+                    return False
+            return True
+
+        while pending:
+            ready = [entry for entry in pending if entry[1] is None or entry[1].done()]
+            if not ready:
+                if len(pending) <= limit:
+                    return True
+                wait([entry[1] for entry in pending], timeout=_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                if stop.is_set():
+                    return False
+                continue
+            for entry in ready:
+                pending.remove(entry)
+                if not self._emit(video_id, *entry, results, stop):
+                    return False
+            if len(pending) <= limit:
+                return True
+        return True
+
+    def _emit(self, video_id, thread, future, results, stop):
+        replies = future.result() if future is not None else []
+        return self._put(results, {"video_id": video_id, "thread": thread, "replies": replies}, stop)
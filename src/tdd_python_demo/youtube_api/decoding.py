@@ -0,0 +1,54 @@
+"""Pluggable JSON decoders for API responses.
+
+``orjson`` and ``msgspec`` are optional; when neither is installed the
+standard library ``json`` module is used.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+DECODERS = ("auto", "orjson", "msgspec", "json")
+
+
+class JSONDecoder:
+    """Decode response bodies with a named JSON backend.
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"``, ``"json"`` or ``"auto"`` (fastest installed)
+    """
+
+    def __init__(self, name="auto"):
+        if name not in DECODERS:
+            raise ValueError(f"Unknown JSON decoder: {name}")
+        if name == "auto":
+            name = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+        if name == "orjson" and orjson is None:
+            raise RuntimeError("orjson is not installed")
+        if name == "msgspec" and msgspec is None:
+            raise RuntimeError("msgspec is not installed")
+        self.name = name
+        if name == "orjson":
+            self.decode = orjson.loads
+        elif name == "msgspec":
+            self.decode = msgspec.json.Decoder().decode
+        else:
+            self.decode = json.loads
+
+    def decode_response(self, response):
+        """Decode a ``requests`` response body.
+
+        The stdlib backend defers to ``response.json()`` so requests keeps
+        handling charset detection; the fast backends parse the raw bytes.
+        """
+        if self.name == "json":
+            return response.json()
+        return self.decode(response.content)
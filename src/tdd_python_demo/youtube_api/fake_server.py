@@ -0,0 +1,375 @@
+"""Local stand-in for the YouTube Data API v3, for load tests and benchmarks.
+
+Serves ``channels``, ``search``, ``videos``, ``playlistItems``,
+``commentThreads`` and ``comments`` with deterministic generated data::
+
+    with FakeYouTubeServer(latency=0.01, rate_limit_rate=0.05) as server:
+        client = YouTubeClient("k1,k2", base_url=server.base_url)
+        client.get_all_comments("vid1")
+"""
+
+import json
+import random
+import socketserver
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # optional dependency
+    h2 = None
+
+# Generated catalog videos are published hourly from this moment on.
+CATALOG_START = datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()
+CATALOG_INTERVAL = 3600
+
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs under concurrent load (1 s client retransmits).
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class _H2Server(socketserver.ThreadingTCPServer):
+    request_queue_size = 1024
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _H2Handler(socketserver.BaseRequestHandler):
+    """Serve the streams of one HTTP/2 connection (one after another, multiplexed on the wire)."""
+
+    def handle(self):
+        fake = self.server.fake
+        with fake._lock:
+            fake.connection_count += 1
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False,
+                                                                    header_encoding="utf-8"))
+        conn.initiate_connection()
+        self.request.sendall(conn.data_to_send())
+        pending = {}
+        while True:
+            try:
+                data = self.request.recv(65535)
+            except OSError:
+                return
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    status, headers, payload = fake._respond(dict(event.headers)[":path"])
+                    conn.send_headers(event.stream_id, [(":status", str(status))] + [
+                        (name.lower(), value) for name, value in headers])
+                    pending[event.stream_id] = payload
+                elif isinstance(event, h2.events.StreamReset):
+                    pending.pop(event.stream_id, None)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            for stream_id in list(pending):
+                self._send_body(conn, pending, stream_id)
+            self.request.sendall(conn.data_to_send())
+
+    @staticmethod
+    def _send_body(conn, pending, stream_id):
+        """Send as much of a stream's body as flow control allows; end it when done."""
+        payload = pending[stream_id]
+        while payload:
+            size = min(len(payload), conn.local_flow_control_window(stream_id),
+                       conn.max_outbound_frame_size)
+            if size <= 0:
+                pending[stream_id] = payload
+                return
+            conn.send_data(stream_id, payload[:size])
+            payload = payload[size:]
+        conn.end_stream(stream_id)
+        del pending[stream_id]
+
+
+class FakeYouTubeServer:
+    """Threaded HTTP server emulating the YouTube Data API endpoints the client uses.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        latency: Seconds each response is delayed
+        rate_limit_rate: Probability of answering 429 rateLimitExceeded
+        quota_error_rate: Probability of answering 403 quotaExceeded
+        retry_after: ``Retry-After`` seconds sent with injected 429s (None to omit)
+        pages: Pages served by paginated endpoints (comment threads, search, playlists)
+        comment_length: Characters of text in each generated comment
+        seed: Seed for error injection
+        catalog_size: Videos per channel served to date-filtered searches
+            (``publishedAfter``/``publishedBefore``), one per hour from 2020
+        search_cap: Results a date-filtered search pages through at most
+        ssl_context: Optional server-side ``ssl.SSLContext``; serves HTTPS
+            so TLS transports can be exercised locally
+        http2: Serve HTTP/2 instead of HTTP/1.1 (needs ``ssl_context`` and
+            the ``h2`` package); ``connection_count`` then counts connections
+
+    Raises:
+        RuntimeError: If ``http2`` is requested but h2 is not installed
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, rate_limit_rate=0.0,
+                 quota_error_rate=0.0, retry_after=1, pages=3, comment_length=200, seed=0,
+                 ssl_context=None, catalog_size=0, search_cap=500, http2=False):
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.quota_error_rate = quota_error_rate
+        self.retry_after = retry_after
+        self.pages = pages
+        self.comment_length = comment_length
+        self.catalog_size = catalog_size
+        self.search_cap = search_cap
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.request_count = 0
+        self.endpoint_counts = {}
+        self.connection_count = 0
+        if http2:
+            if h2 is None:
+                raise RuntimeError("h2 is not installed")
+            if ssl_context is None:
+                raise ValueError("HTTP/2 needs an ssl_context")
+            ssl_context.set_alpn_protocols(["h2"])
+            self._httpd = _H2Server((host, port), _H2Handler)
+            self._httpd.fake = self
+        else:
+            self._httpd = _Server((host, port), self._make_handler())
+        self.scheme = "http"
+        if ssl_context is not None:
+            self._httpd.socket = ssl_context.wrap_socket(self._httpd.socket, server_side=True)
+            self.scheme = "https"
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"{self.scheme}://{host}:{port}/youtube/v3"
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _record(self, endpoint):
+        with self._lock:
+            self.request_count += 1
+            self.endpoint_counts[endpoint] = self.endpoint_counts.get(endpoint, 0) + 1
+            roll = self._rng.random()
+        if roll < self.quota_error_rate:
+            return 403, {"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}}
+        if roll < self.quota_error_rate + self.rate_limit_rate:
+            return 429, {"error": {"code": 429, "errors": [{"reason": "rateLimitExceeded"}]}}
+        return None
+
+    def _respond(self, path):
+        """Answer a GET of ``path``; returns ``(status, headers, payload)``."""
+        parsed = urlparse(path)
+        endpoint = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        if self.latency:
+            time.sleep(self.latency)
+
+        status, body = 200, None
+        injected = self._record(endpoint)
+        if injected:
+            status, body = injected
+        elif "key" not in params:
+            status, body = 400, {"error": {"code": 400, "message": "API key missing"}}
+        else:
+            build = _ENDPOINTS.get(endpoint)
+            if build is None:
+                status, body = 404, {"error": {"code": 404, "message": f"Unknown endpoint {endpoint}"}}
+            else:
+                body = build(self, params)
+
+        payload = json.dumps(body).encode()
+        headers = [("Content-Type", "application/json; charset=UTF-8"), ("Content-Length", str(len(payload)))]
+        if status == 429 and self.retry_after is not None:
+            headers.append(("Retry-After", str(self.retry_after)))
+        return status, headers, payload
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, headers, payload = server._respond(self.path)
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _page(server, params, build_items):
+    """Paginate ``server.pages`` pages of generated items via numeric page tokens."""
+    page = int(params.get("pageToken", "1"))
+    size = int(params.get("maxResults", 5))
+    body = {"items": build_items(page, size)}
+    if page < server.pages:
+        body["nextPageToken"] = str(page + 1)
+    return body
+
+
+def _statistics(seed):
+    return {
+        "viewCount": str(1000 * seed + 7),
+        "likeCount": str(10 * seed + 1),
+        "commentCount": str(seed + 3),
+        "subscriberCount": str(50 * seed + 11),
+        "videoCount": str(seed % 500 + 1),
+    }
+
+
+def _channels(server, params):
+    if "forHandle" in params:
+        handle = params["forHandle"].lstrip("@")
+        return {"items": [{"id": f"UC{handle}"}]}
+    items = []
+    for i, channel_id in enumerate(params.get("id", "").split(",")):
+        items.append({
+            "id": channel_id,
+            "snippet": {"title": f"Channel {channel_id}", "description": "Fake channel",
+                        "customUrl": f"@{channel_id.lower()}", "thumbnails": {}},
+            "statistics": _statistics(i + len(channel_id)),
+            "contentDetails": {"relatedPlaylists": {"uploads": "UU" + channel_id[2:]}},
+        })
+    return {"items": items}
+
+
+def _timestamp(value):
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+def _dated_search(server, params):
+    """Search the generated catalog like the API: newest first, capped, with totalResults."""
+    channel_id = params.get("channelId", "UCany")
+    after = _timestamp(params["publishedAfter"]) if "publishedAfter" in params else float("-inf")
+    before = _timestamp(params["publishedBefore"]) if "publishedBefore" in params else float("inf")
+    matching = [i for i in range(server.catalog_size - 1, -1, -1)
+                if after <= CATALOG_START + i * CATALOG_INTERVAL < before]
+    page = int(params.get("pageToken", "1"))
+    size = int(params.get("maxResults", 5))
+    reachable = matching[:server.search_cap]
+    body = {
+        "pageInfo": {"totalResults": len(matching), "resultsPerPage": size},
+        "items": [
+            {"id": {"kind": "youtube#video", "videoId": f"{channel_id}_v{i}"},
+             "snippet": {"publishedAt": datetime.fromtimestamp(CATALOG_START + i * CATALOG_INTERVAL, timezone.utc)
+                         .strftime("%Y-%m-%dT%H:%M:%SZ")}}
+            for i in reachable[(page - 1) * size:page * size]
+        ],
+    }
+    if page * size < len(reachable):
+        body["nextPageToken"] = str(page + 1)
+    return body
+
+
+def _search(server, params):
+    if server.catalog_size and ("publishedAfter" in params or "publishedBefore" in params):
+        return _dated_search(server, params)
+    channel_id = params.get("channelId", "UCany")
+    return _page(server, params, lambda page, size: [
+        {"id": {"kind": "youtube#video", "videoId": f"{channel_id}_p{page}_{i}"}} for i in range(size)
+    ])
+
+
+def _playlist_items(server, params):
+    playlist_id = params.get("playlistId", "UUany")
+    return _page(server, params, lambda page, size: [
+        {"contentDetails": {"videoId": f"{playlist_id}_p{page}_{i}"}} for i in range(size)
+    ])
+
+
+def _videos(server, params):
+    items = []
+    for i, video_id in enumerate(params.get("id", "").split(",")):
+        items.append({
+            "id": video_id,
+            "snippet": {"title": f"Video {video_id}", "description": "Fake video",
+                        "publishedAt": "2024-01-01T00:00:00Z"},
+            "statistics": _statistics(i + len(video_id)),
+        })
+    return {"items": items}
+
+
+def _comment_threads(server, params):
+    video_id = params.get("videoId", "vid")
+    text = ("lorem ipsum " * (server.comment_length // 12 + 1))[:server.comment_length]
+    return _page(server, params, lambda page, size: [
+        {
+            "id": f"{video_id}_c{page}_{i}",
+            "snippet": {
+                "videoId": video_id,
+                "totalReplyCount": i % 3,
+                "topLevelComment": {
+                    "id": f"{video_id}_c{page}_{i}",
+                    "snippet": {
+                        "authorDisplayName": f"user{i}",
+                        "textDisplay": text,
+                        "likeCount": i,
+                        "publishedAt": "2024-01-01T00:00:00Z",
+                    },
+                },
+            },
+        }
+        for i in range(size)
+    ])
+
+
+def _comments(server, params):
+    """Replies to ``parentId``; threads generated above have ``index % 3`` replies."""
+    parent_id = params.get("parentId", "thread_0")
+    suffix = parent_id.rsplit("_", 1)[-1]
+    count = int(suffix) % 3 if suffix.isdigit() else 1
+    text = ("reply text " * (server.comment_length // 11 + 1))[:server.comment_length]
+    return {"items": [
+        {
+            "id": f"{parent_id}.r{i}",
+            "snippet": {
+                "parentId": parent_id,
+                "authorDisplayName": f"replier{i}",
+                "textDisplay": text,
+                "likeCount": i,
+                "publishedAt": "2024-01-02T00:00:00Z",
+            },
+        }
+        for i in range(count)
+    ]}
+
+
+_ENDPOINTS = {
+    "channels": _channels,
+    "search": _search,
+    "playlistItems": _playlist_items,
+    "videos": _videos,
+    "commentThreads": _comment_threads,
+    "comments": _comments,
+}
@@ -7,14 +7,21 @@ def format_json(data, pretty=False):
     """Format data as JSON string.
 
     Args:
-        data: Data to format (dict, list, etc.)
+        data: Data to format (dict, list, ``models`` records, etc.)
         pretty: If True, format with indentation
 
     Returns:
         JSON string representation of data
     """
     indent = 2 if pretty else None
-    return json.dumps(data, indent=indent, ensure_ascii=False)
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=_to_serializable)
+
+
+def _to_serializable(value):
+    """Serialize record objects (anything with ``to_dict``) for ``json.dumps``."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def format_human(video_info):
@@ -63,6 +70,23 @@ def format_summary(video_info):
     return f"{title} - {views} views"
 
 
+def format_comment(comment, width=100):
+    """Format a comment as a single human-readable line.
+
+    Args:
+        comment: Comment record or dict with ``author``, ``text`` and ``like_count``
+        width: Maximum characters of comment text before truncating with "..."
+
+    Returns:
+        Single-line string
+    """
+    text = " ".join((comment.get('text') or '').split())
+    if len(text) > width:
+        text = text[:width - 3] + "..."
+    likes = comment.get('like_count')
+    return f"[{likes if likes is not None else 'N/A'} likes] {comment.get('author') or 'N/A'}: {text}"
+
+
 def format_channel_profile(channel_data):
     """Format channel profile as human-readable text.
 
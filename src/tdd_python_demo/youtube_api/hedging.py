@@ -0,0 +1,144 @@
+"""Hedged requests: race a duplicate against a slow call to cut tail latency.
+
+``HedgingPolicy.call`` sends a request and, if it has not answered within
+the recent p95 latency (or another quantile), sends one duplicate and
+returns whichever answers first. The loser is left to finish in the
+background and its response is discarded. Duplicates are capped to a
+fraction of calls and only made for cheap endpoints, so hedging cannot
+burn more than a few percent of extra quota.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _Race:
+    """Outcomes of the attempts of one hedged call, in the order they finished."""
+
+    def __init__(self):
+        self._done = threading.Condition()
+        self._outcomes = []
+
+    def run(self, send, name):
+        started = time.perf_counter()
+        try:
+            outcome = (name, send(), time.perf_counter() - started, None)
+        except Exception as exc:
+            outcome = (name, None, None, exc)
+        with self._done:
+            self._outcomes.append(outcome)
+            self._done.notify_all()
+
+    def wait(self, timeout):
+        """Return True once any attempt has finished, waiting up to ``timeout``."""
+        with self._done:
+            return self._done.wait_for(lambda: self._outcomes, timeout)
+
+    def first_success(self, attempts):
+        """Return ``(name, response, seconds)`` of the first attempt to succeed.
+
+        Raises the primary's error when all ``attempts`` failed.
+        """
+        with self._done:
+            self._done.wait_for(lambda: len(self._outcomes) == attempts
+                                or any(error is None for *_, error in self._outcomes))
+            for name, response, seconds, error in self._outcomes:
+                if error is None:
+                    return name, response, seconds
+            raise next(error for name, *_, error in self._outcomes if name == "primary")
+
+
+class HedgingPolicy:
+    """Fire one duplicate request after a latency-quantile delay.
+
+    Args:
+        quantile: Latency quantile of recent calls used as the hedge delay
+        min_delay: Lower bound of the hedge delay in seconds
+        max_delay: Upper bound of the hedge delay in seconds
+        max_ratio: Hedges allowed per call (e.g. 0.05 = at most 5% extra requests)
+        max_cost: Calls costing more quota units than this are never hedged
+        window: Number of recent latencies kept
+        min_samples: Latencies needed before hedging starts
+        max_workers: Threads sending duplicates
+    """
+
+    def __init__(self, quantile=0.95, min_delay=0.05, max_delay=5.0, max_ratio=0.05, max_cost=1,
+                 window=200, min_samples=20, max_workers=32):
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_ratio = max_ratio
+        self.max_cost = max_cost
+        self.min_samples = min_samples
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+
+    def observe(self, seconds):
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def delay(self):
+        """Return the current hedge delay, or None until enough latencies are known."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        value = ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+        return min(self.max_delay, max(self.min_delay, value))
+
+    def _try_hedge(self):
+        with self._lock:
+            if self.hedged + 1 > self.max_ratio * self.calls:
+                return False
+            self.hedged += 1
+            return True
+
+    def call(self, send, cost=1):
+        """Return ``(response, hedged)`` for ``send()``, hedging it when it is slow.
+
+        ``hedged`` is True when a duplicate was sent (and so ``cost`` was
+        spent twice). If the first call to finish raised, the other one is
+        awaited; an exception is raised only when every call failed. Only
+        the latency of the answer returned is recorded, so an abandoned
+        slow call does not inflate the hedge delay.
+        """
+        with self._lock:
+            self.calls += 1
+        delay = self.delay()
+        if delay is None or cost > self.max_cost:
+            started = time.perf_counter()
+            response = send()
+            self.observe(time.perf_counter() - started)
+            return response, False
+
+        race = _Race()
+        # Its own thread rather than the pool, so primaries never queue behind each other.
+        threading.Thread(target=race.run, args=(send, "primary"), daemon=True).start()
+        hedged = not race.wait(delay) and self._try_hedge()
+        if hedged:
+            self._executor.submit(race.run, send, "hedge")
+        name, response, seconds = race.first_success(2 if hedged else 1)
+        self.observe(seconds)
+        if name == "hedge":
+            with self._lock:
+                self.hedge_wins += 1
+        return response, hedged
+
+    def stats(self):
+        """Return call, hedge and hedge-win counts and the current delay."""
+        with self._lock:
+            calls, hedged, wins = self.calls, self.hedged, self.hedge_wins
+        return {"calls": calls, "hedged": hedged, "hedge_wins": wins, "delay": self.delay()}
+
+    def close(self):
+        """Stop the duplicate workers (requests in flight still finish)."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,240 @@
+"""Thread-safe pool of API keys with health tracking and load spreading."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+try:
+    from zoneinfo import ZoneInfo
+    _QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:  # zoneinfo/tzdata unavailable: fall back to Pacific Standard Time
+    _QUOTA_TZ = timezone(timedelta(hours=-8))
+
+STRATEGIES = ("round_robin", "weighted")
+
+
+def next_daily_reset(now):
+    """Return the epoch time of the next YouTube quota reset (midnight Pacific) after ``now``."""
+    local = datetime.fromtimestamp(now, _QUOTA_TZ)
+    midnight = datetime.combine(local.date() + timedelta(days=1), datetime.min.time(), _QUOTA_TZ)
+    return midnight.timestamp()
+
+
+class _KeyState:
+    __slots__ = ("key", "weight", "current", "cooldown_until", "exhausted",
+                 "consecutive_failures", "successes", "failures")
+
+    def __init__(self, key, weight):
+        self.key = key
+        self.weight = weight
+        self.current = 0
+        self.cooldown_until = 0.0
+        self.exhausted = False
+        self.consecutive_failures = 0
+        self.successes = 0
+        self.failures = 0
+
+
+class KeyPool:
+    """Hand out API keys round-robin or weighted, skipping unhealthy keys.
+
+    Rate-limited keys cool down for the server's ``Retry-After`` or else
+    ``cooldown`` seconds, doubling with each consecutive failure up to
+    ``max_cooldown``. Keys that ran out of quota stay
+    out until the next daily reset, when all keys (and the optional ledger)
+    are restored. All methods are safe to call from many threads; the lock is
+    never held across I/O, so coroutines may call them directly as well.
+
+    Args:
+        keys: API keys to serve
+        strategy: ``"round_robin"`` or ``"weighted"``
+        weights: Optional key → weight mapping for the weighted strategy
+        quota_ledger: Optional ``QuotaLedger``; keys that cannot afford a
+            request are skipped and, when weighted, remaining budget is the weight
+        cooldown: Base cooldown in seconds after a rate-limit error (short, like
+            the retry backoff, so a lone key is waited out rather than failed)
+        max_cooldown: Upper bound for the cooldown
+        clock: Wall-clock time source (epoch seconds)
+    """
+
+    def __init__(self, keys, strategy="round_robin", weights=None, quota_ledger=None,
+                 cooldown=1.0, max_cooldown=60.0, clock=time.time):
+        if not keys:
+            raise ValueError("KeyPool needs at least one key")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown key pool strategy: {strategy}")
+        weights = weights or {}
+        self.strategy = strategy
+        self.quota_ledger = quota_ledger
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._clock = clock
+        self._states = [_KeyState(key, weights.get(key, 1)) for key in keys]
+        self._by_key = {state.key: state for state in self._states}
+        self._cursor = 0
+        self._next_reset = next_daily_reset(clock())
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self):
+        return [state.key for state in self._states]
+
+    def _maybe_reset(self, now):
+        if now < self._next_reset:
+            return
+        for state in self._states:
+            state.exhausted = False
+            state.cooldown_until = 0.0
+            state.consecutive_failures = 0
+        if self.quota_ledger is not None:
+            self.quota_ledger.reset()
+        self._next_reset = next_daily_reset(now)
+
+    def _available(self, state, now, units):
+        if state.exhausted or state.cooldown_until > now:
+            return False
+        if self.quota_ledger is not None and self.quota_ledger.remaining(state.key) < units:
+            return False
+        return True
+
+    def _weight(self, state):
+        if self.quota_ledger is not None:
+            return self.quota_ledger.remaining(state.key)
+        return state.weight
+
+    def acquire(self, units=1, reserve=False):
+        """Return the next healthy key able to spend ``units``, or None if none is.
+
+        With ``reserve`` the units are charged to the ledger in the same locked
+        step, so concurrent callers can never both spend a key's last budget.
+        """
+        with self._lock:
+            now = self._clock()
+            self._maybe_reset(now)
+            candidates = [s for s in self._states if self._available(s, now, units)]
+            if not candidates:
+                return None
+            key = self._pick(candidates)
+            if reserve and self.quota_ledger is not None:
+                self.quota_ledger.charge(key, units)
+            return key
+
+    def _pick(self, candidates):
+        if self.strategy == "round_robin":
+            count = len(self._states)
+            for offset in range(count):
+                state = self._states[(self._cursor + offset) % count]
+                if state in candidates:
+                    self._cursor = (self._cursor + offset + 1) % count
+                    return state.key
+
+        # Smooth weighted round-robin: spreads picks in proportion to weight.
+        total = 0
+        best = None
+        for state in candidates:
+            weight = self._weight(state)
+            state.current += weight
+            total += weight
+            if best is None or state.current > best.current:
+                best = state
+        best.current -= total
+        return best.key
+
+    def _wait_delay(self, units, deadline):
+        """Seconds to wait before retrying ``acquire``, or None once ``deadline`` passed."""
+        delay = self.next_available_in(units)
+        if deadline is not None:
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                return None
+            delay = min(delay, remaining)
+        return max(delay, 0.01)
+
+    def wait_for_key(self, units=1, timeout=None, sleep=time.sleep, reserve=False):
+        """Block until a key is available and return it; None after ``timeout`` seconds."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            key = self.acquire(units, reserve)
+            if key is not None:
+                return key
+            delay = self._wait_delay(units, deadline)
+            if delay is None:
+                return None
+            sleep(delay)
+
+    async def acquire_async(self, units=1, timeout=None, reserve=False):
+        """Coroutine version of ``wait_for_key`` that yields to the event loop while waiting."""
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            key = self.acquire(units, reserve)
+            if key is not None:
+                return key
+            delay = self._wait_delay(units, deadline)
+            if delay is None:
+                return None
+            await asyncio.sleep(delay)
+
+    def next_available_in(self, units=1):
+        """Return seconds until a key able to spend ``units`` is free (0 if one is now).
+
+        Keys out of quota recover at the next daily reset.
+        """
+        with self._lock:
+            now = self._clock()
+            self._maybe_reset(now)
+            waits = []
+            for state in self._states:
+                out_of_budget = (self.quota_ledger is not None
+                                 and self.quota_ledger.remaining(state.key) < units)
+                if state.exhausted or out_of_budget:
+                    waits.append(self._next_reset - now)
+                else:
+                    waits.append(max(0.0, state.cooldown_until - now))
+            return min(waits)
+
+    def report_success(self, key):
+        """Record a successful call on ``key``."""
+        with self._lock:
+            state = self._by_key[key]
+            state.successes += 1
+            state.consecutive_failures = 0
+
+    def report_rate_limited(self, key, retry_after=None):
+        """Cool ``key`` down for ``retry_after`` seconds, or an exponential cooldown without it."""
+        with self._lock:
+            state = self._by_key[key]
+            state.failures += 1
+            state.consecutive_failures += 1
+            if retry_after is not None:
+                delay = retry_after
+            else:
+                delay = min(self.max_cooldown, self.cooldown * 2 ** (state.consecutive_failures - 1))
+            state.cooldown_until = self._clock() + delay
+
+    def report_quota_exceeded(self, key):
+        """Take ``key`` out of rotation until the next daily quota reset."""
+        with self._lock:
+            state = self._by_key[key]
+            state.failures += 1
+            state.consecutive_failures += 1
+            state.exhausted = True
+        if self.quota_ledger is not None:
+            self.quota_ledger.exhaust(key)
+
+    def health(self):
+        """Return a key → health snapshot mapping."""
+        with self._lock:
+            now = self._clock()
+            self._maybe_reset(now)
+            return {
+                state.key: {
+                    "available": self._available(state, now, 1),
+                    "exhausted": state.exhausted,
+                    "cooldown_remaining": max(0.0, state.cooldown_until - now),
+                    "consecutive_failures": state.consecutive_failures,
+                    "successes": state.successes,
+                    "failures": state.failures,
+                }
+                for state in self._states
+            }
@@ -0,0 +1,151 @@
+"""Request instrumentation hooks and a built-in metrics collector for YouTubeClient.
+
+Hooks are plain callables receiving a dict of event data; register them with
+``YouTubeClient.add_hook(event, callback)`` or pass an object implementing any
+of the ``on_*`` methods (such as ``MetricsCollector``) to ``add_hooks``.
+
+Events:
+    on_request: ``endpoint``, ``url``, ``attempt``, ``key``
+    on_response: ``endpoint``, ``status``, ``seconds`` (HTTP round trip),
+        ``server_seconds`` (until headers, if known), ``decode_seconds``,
+        ``bytes``, ``units`` (quota cost), ``attempt``
+    on_retry: ``endpoint``, ``reason`` (``"network"`` or ``"status"``),
+        ``status``, ``delay`` (backoff sleep), ``attempt``
+    on_rotate: ``endpoint``, ``key``, ``status``, ``reason``
+        (``"quota_exceeded"`` or ``"rate_limited"``), ``attempt``
+"""
+
+import json
+import threading
+
+EVENTS = ("on_request", "on_response", "on_retry", "on_rotate")
+
+# Upper bounds (seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _EndpointStats:
+    __slots__ = ("buckets", "count", "seconds", "decode_seconds", "bytes", "units",
+                 "statuses", "retries", "backoff_seconds", "rotations")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.decode_seconds = 0.0
+        self.bytes = 0
+        self.units = 0
+        self.statuses = {}
+        self.retries = {}
+        self.backoff_seconds = 0.0
+        self.rotations = 0
+
+
+class MetricsCollector:
+    """Aggregate per-endpoint latency histograms, bytes, quota units, retries and rotations."""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, name):
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _EndpointStats()
+        return stats
+
+    def on_response(self, event):
+        seconds = event.get("seconds", 0.0)
+        with self._lock:
+            stats = self._endpoint(event["endpoint"])
+            index = len(LATENCY_BUCKETS)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    index = i
+                    break
+            stats.buckets[index] += 1
+            stats.count += 1
+            stats.seconds += seconds
+            stats.decode_seconds += event.get("decode_seconds", 0.0)
+            stats.bytes += event.get("bytes", 0)
+            stats.units += event.get("units", 0)
+            status = str(event.get("status"))
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def on_retry(self, event):
+        with self._lock:
+            stats = self._endpoint(event["endpoint"])
+            reason = event.get("reason", "unknown")
+            stats.retries[reason] = stats.retries.get(reason, 0) + 1
+            stats.backoff_seconds += event.get("delay") or 0.0
+
+    def on_rotate(self, event):
+        with self._lock:
+            self._endpoint(event["endpoint"]).rotations += 1
+
+    def snapshot(self):
+        """Return the collected metrics as a JSON-serializable dict keyed by endpoint."""
+        with self._lock:
+            result = {}
+            for name, stats in sorted(self._stats.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), stats.buckets):
+                    cumulative += count
+                    buckets[str(bound)] = cumulative
+                result[name] = {
+                    "requests": stats.count,
+                    "latency_seconds_sum": stats.seconds,
+                    "latency_buckets": buckets,
+                    "decode_seconds_sum": stats.decode_seconds,
+                    "bytes": stats.bytes,
+                    "quota_units": stats.units,
+                    "statuses": dict(stats.statuses),
+                    "retries": dict(stats.retries),
+                    "backoff_seconds_sum": stats.backoff_seconds,
+                    "key_rotations": stats.rotations,
+                }
+            return result
+
+    def to_json(self, pretty=False):
+        """Dump the snapshot as JSON."""
+        return json.dumps(self.snapshot(), indent=2 if pretty else None)
+
+    def to_prometheus(self, prefix="youtube_api"):
+        """Dump the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds HTTP round-trip time per endpoint.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for name, stats in snapshot.items():
+            for bound, count in stats["latency_buckets"].items():
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{endpoint="{name}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{name}"}} {stats["latency_seconds_sum"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{name}"}} {stats["requests"]}')
+
+        counters = (
+            ("decode_seconds_total", "decode_seconds_sum", "Seconds spent decoding JSON responses."),
+            ("response_bytes_total", "bytes", "Response body bytes received."),
+            ("quota_units_total", "quota_units", "Quota units consumed."),
+            ("backoff_seconds_total", "backoff_seconds_sum", "Seconds slept in retry backoff."),
+            ("key_rotations_total", "key_rotations", "Keys rotated away after 403/429."),
+        )
+        for metric, field, help_text in counters:
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, stats in snapshot.items():
+                lines.append(f'{prefix}_{metric}{{endpoint="{name}"}} {stats[field]}')
+
+        lines.append(f"# HELP {prefix}_responses_total Responses by HTTP status.")
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for name, stats in snapshot.items():
+            for status, count in sorted(stats["statuses"].items()):
+                lines.append(f'{prefix}_responses_total{{endpoint="{name}",status="{status}"}} {count}')
+
+        lines.append(f"# HELP {prefix}_retries_total Retries by reason.")
+        lines.append(f"# TYPE {prefix}_retries_total counter")
+        for name, stats in snapshot.items():
+            for reason, count in sorted(stats["retries"].items()):
+                lines.append(f'{prefix}_retries_total{{endpoint="{name}",reason="{reason}"}} {count}')
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,214 @@
+"""Compact record types for channel, video and comment results.
+
+Records keep one ``__slots__`` entry per field instead of a per-object dict,
+convert API count strings to int lazily on first access, and behave as
+read-only mappings with the same keys as the dicts the client returns, so
+``record["view_count"]``, ``record.get(...)`` and ``format_json`` keep working.
+``to_dict()`` gives back a plain dict.
+"""
+
+from collections.abc import Mapping
+
+
+def to_int(value):
+    """Convert string to int, return None if conversion fails."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class _LazyInt:
+    """Descriptor holding the raw API string in ``slot`` until first read."""
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        raw = getattr(obj, self.slot)
+        if raw is None or isinstance(raw, int):
+            return raw
+        value = to_int(raw)
+        setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+class _Record(Mapping):
+    __slots__ = ()
+    _fields = ()
+
+    def __getitem__(self, name):
+        if name in self:
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def to_dict(self):
+        """Return the record as a plain dict."""
+        return {name: self[name] for name in self}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={self[name]!r}" for name in self)
+        return f"{type(self).__name__}({fields})"
+
+
+class VideoStatistics(_Record):
+    """View, like and comment counts of a video (``get_video_statistics``)."""
+
+    __slots__ = ("_view_count", "_like_count", "_comment_count")
+    _fields = ("view_count", "like_count", "comment_count")
+
+    view_count = _LazyInt("_view_count")
+    like_count = _LazyInt("_like_count")
+    comment_count = _LazyInt("_comment_count")
+
+    def __init__(self, view_count=None, like_count=None, comment_count=None):
+        self._view_count = view_count
+        self._like_count = like_count
+        self._comment_count = comment_count
+
+    @classmethod
+    def from_item(cls, item):
+        """Build from a ``videos`` resource with the ``statistics`` part."""
+        stats = item.get("statistics", {})
+        return cls(stats.get("viewCount"), stats.get("likeCount"), stats.get("commentCount"))
+
+
+class VideoRecord(_Record):
+    """A recent video of a channel (``_get_recent_videos``)."""
+
+    __slots__ = ("id", "title", "description", "_view_count", "_like_count")
+    _fields = ("id", "title", "description", "view_count", "like_count")
+
+    view_count = _LazyInt("_view_count")
+    like_count = _LazyInt("_like_count")
+
+    def __init__(self, id=None, title=None, description=None, view_count=None, like_count=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self._view_count = view_count
+        self._like_count = like_count
+
+    @classmethod
+    def from_item(cls, item):
+        """Build from a ``videos`` resource with ``snippet,statistics`` parts."""
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+        return cls(item.get("id"), snippet.get("title"), snippet.get("description"),
+                   statistics.get("viewCount"), statistics.get("likeCount"))
+
+
+class ChannelRecord(_Record):
+    """A channel profile (``get_channel_profile``); ``recent_videos`` is only a key when set."""
+
+    __slots__ = ("id", "title", "description", "custom_url", "thumbnails",
+                 "_view_count", "_subscriber_count", "_video_count", "recent_videos")
+    _fields = ("id", "title", "description", "custom_url", "thumbnails",
+               "view_count", "subscriber_count", "video_count", "recent_videos")
+
+    view_count = _LazyInt("_view_count")
+    subscriber_count = _LazyInt("_subscriber_count")
+    video_count = _LazyInt("_video_count")
+
+    def __init__(self, id=None, title=None, description=None, custom_url=None, thumbnails=None,
+                 view_count=None, subscriber_count=None, video_count=None, recent_videos=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.custom_url = custom_url
+        self.thumbnails = thumbnails if thumbnails is not None else {}
+        self._view_count = view_count
+        self._subscriber_count = subscriber_count
+        self._video_count = video_count
+        self.recent_videos = recent_videos
+
+    @classmethod
+    def from_item(cls, channel_id, item):
+        """Build from a ``channels`` resource with ``snippet,statistics`` parts."""
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+        return cls(channel_id, snippet.get("title"), snippet.get("description"),
+                   snippet.get("customUrl"), snippet.get("thumbnails", {}),
+                   statistics.get("viewCount"), statistics.get("subscriberCount"),
+                   statistics.get("videoCount"))
+
+    def __contains__(self, name):
+        return name in self._fields and (name != "recent_videos" or self.recent_videos is not None)
+
+    def __iter__(self):
+        if self.recent_videos is None:
+            return iter(self._fields[:-1])
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields) - (self.recent_videos is None)
+
+    def to_dict(self):
+        result = super().to_dict()
+        if self.recent_videos is not None:
+            result["recent_videos"] = [
+                video.to_dict() if isinstance(video, _Record) else video for video in self.recent_videos
+            ]
+        return result
+
+
+class CommentRecord(_Record):
+    """A top-level comment thread from ``commentThreads`` or a reply from ``comments``."""
+
+    __slots__ = ("id", "video_id", "author", "author_channel_id", "text",
+                 "_like_count", "_reply_count", "published_at", "updated_at", "parent_id")
+    _fields = ("id", "video_id", "author", "author_channel_id", "text",
+               "like_count", "reply_count", "published_at", "updated_at", "parent_id")
+
+    like_count = _LazyInt("_like_count")
+    reply_count = _LazyInt("_reply_count")
+
+    def __init__(self, id=None, video_id=None, author=None, author_channel_id=None, text=None,
+                 like_count=None, reply_count=None, published_at=None, updated_at=None,
+                 parent_id=None):
+        self.id = id
+        self.video_id = video_id
+        self.author = author
+        self.author_channel_id = author_channel_id
+        self.text = text
+        self._like_count = like_count
+        self._reply_count = reply_count
+        self.published_at = published_at
+        self.updated_at = updated_at
+        self.parent_id = parent_id
+
+    @classmethod
+    def from_item(cls, item):
+        """Build from a ``commentThreads`` resource with the ``snippet`` part."""
+        thread = item.get("snippet", {})
+        snippet = thread.get("topLevelComment", {}).get("snippet", {})
+        return cls(item.get("id"), thread.get("videoId") or snippet.get("videoId"),
+                   snippet.get("authorDisplayName"),
+                   snippet.get("authorChannelId", {}).get("value"),
+                   snippet.get("textDisplay"), snippet.get("likeCount"),
+                   thread.get("totalReplyCount"), snippet.get("publishedAt"),
+                   snippet.get("updatedAt"))
+
+    @classmethod
+    def from_comment(cls, item):
+        """Build from a ``comments`` resource (a reply) with the ``snippet`` part."""
+        snippet = item.get("snippet", {})
+        return cls(item.get("id"), snippet.get("videoId"), snippet.get("authorDisplayName"),
+                   snippet.get("authorChannelId", {}).get("value"),
+                   snippet.get("textDisplay"), snippet.get("likeCount"), None,
+                   snippet.get("publishedAt"), snippet.get("updatedAt"),
+                   snippet.get("parentId"))
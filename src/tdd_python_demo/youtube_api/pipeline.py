@@ -0,0 +1,171 @@
+"""Resumable multi-video comment ingestion into a batched sink.
+
+Videos are fetched concurrently; their comment pages flow through a bounded
+queue to a single writer that flattens them into rows and feeds the sink.
+Each video's next page token is checkpointed to a JSON file, but only after
+the sink has flushed the rows of the pages before it, so an interrupted run
+resumes where the last durable batch ended. Delivery is at-least-once: a
+crash between a sink flush and the checkpoint write refetches those pages.
+"""
+
+import json
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .models import CommentRecord
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+def comment_row(comment, video_id=None):
+    """Flatten a ``commentThreads`` item or ``CommentRecord`` into a sink row.
+
+    ``video_id`` (the video the comment was fetched for) takes precedence
+    over the item's own, which partial responses may leave out.
+    """
+    if not isinstance(comment, CommentRecord):
+        comment = CommentRecord.from_item(comment)
+    row = comment.to_dict()
+    if video_id is not None:
+        row["video_id"] = video_id
+    return row
+
+
+class Checkpoint:
+    """Per-video ingestion progress persisted as JSON.
+
+    ``update`` stages changes in memory; ``commit`` writes them atomically
+    (temp file + rename), so the file is never left half written.
+
+    Args:
+        path: Checkpoint file (None keeps progress in memory only)
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.videos = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.videos = json.load(f).get("videos", {})
+
+    def get(self, video_id):
+        """Return ``{"page_token", "done", "comments"}`` for a video."""
+        return self.videos.get(video_id, {"page_token": None, "done": False, "comments": 0})
+
+    def update(self, video_id, page_token, done, comments):
+        """Stage a video's progress: next page token, completion and comments added."""
+        state = self.get(video_id)
+        self.videos[video_id] = {
+            "page_token": page_token,
+            "done": done,
+            "comments": state["comments"] + comments,
+        }
+
+    def commit(self):
+        """Write the staged progress to disk."""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"videos": self.videos}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class CommentPipeline:
+    """Stream the comments of many videos into a sink, resumably.
+
+    Args:
+        client: ``YouTubeClient`` shared by the fetch workers
+        sink: Sink from ``sinks`` (anything with ``write(rows)`` and ``flush()``)
+        checkpoint: ``Checkpoint`` or checkpoint file path (None disables resume)
+        max_workers: Videos fetched concurrently
+        page_size: ``commentThreads`` page size
+        max_pending_pages: Pages buffered between the fetch workers and the writer
+        fields: Optional partial-response selector passed to ``list_comments``
+    """
+
+    def __init__(self, client, sink, checkpoint=None, max_workers=4, page_size=100,
+                 max_pending_pages=32, fields=None):
+        self.client = client
+        self.sink = sink
+        self.checkpoint = checkpoint if isinstance(checkpoint, Checkpoint) else Checkpoint(checkpoint)
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.max_pending_pages = max_pending_pages
+        self.fields = fields
+
+    def run(self, video_ids):
+        """Ingest every video not already completed in the checkpoint.
+
+        A failing video is reported and left resumable; the others carry on.
+        The sink is flushed but not closed.
+
+        Returns:
+            Dict with ``comments`` written, ``completed`` and ``skipped`` video
+            IDs, and ``errors`` mapping failed video IDs to messages
+        """
+        summary = {"comments": 0, "completed": [], "skipped": [], "errors": {}}
+        pending = []
+        for video_id in dict.fromkeys(video_ids):
+            if self.checkpoint.get(video_id)["done"]:
+                summary["skipped"].append(video_id)
+            else:
+                pending.append(video_id)
+
+        pages = queue.Queue(maxsize=self.max_pending_pages)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for video_id in pending:
+                executor.submit(self._fetch_video, video_id, pages, stop)
+            remaining = len(pending)
+            while remaining:
+                video_id, comments, page_token = pages.get()
+                if comments is _DONE:
+                    remaining -= 1
+                elif isinstance(comments, Exception):
+                    summary["errors"][video_id] = str(comments)
+                else:
+                    rows = [comment_row(comment, video_id) for comment in comments]
+                    self.checkpoint.update(video_id, page_token, page_token is None, len(rows))
+                    summary["comments"] += len(rows)
+                    if page_token is None:
+                        summary["completed"].append(video_id)
+                    if self.sink.write(rows):
+                        self.checkpoint.commit()
+            self.sink.flush()
+            self.checkpoint.commit()
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+        return summary
+
+    def _fetch_video(self, video_id, pages, stop):
+        """Walk one video's pages from its checkpointed token onto the queue."""
+        page_token = self.checkpoint.get(video_id)["page_token"]
+        try:
+            while not stop.is_set():
+                comments, page_token = self.client.list_comments(
+                    video_id, page_size=self.page_size, max_comments=None,
+                    page_token=page_token, fields=self.fields)
+                if not self._put(pages, (video_id, comments, page_token), stop) or not page_token:
+                    break
+        except Exception as exc:
+            self._put(pages, (video_id, exc, None), stop)
+        finally:
+            self._put(pages, (video_id, _DONE, None), stop)
+
+    def _put(self, pages, item, stop):
+        """Block until the writer takes ``item``; give up if the run stops."""
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
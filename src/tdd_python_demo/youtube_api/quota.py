@@ -0,0 +1,141 @@
+"""Client-side rate limiting and quota accounting for the YouTube Data API."""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+# Quota units charged per call, keyed by the last path segment of the endpoint.
+# See https://developers.google.com/youtube/v3/determine_quota_cost
+ENDPOINT_COSTS = {
+    "search": 100,
+    "videos": 1,
+    "channels": 1,
+    "playlistItems": 1,
+    "playlists": 1,
+    "commentThreads": 1,
+    "comments": 1,
+}
+DEFAULT_DAILY_QUOTA = 10000
+
+
+def endpoint_name(url):
+    """Return the endpoint name (last path segment) of an API URL."""
+    return urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def endpoint_cost(url, costs=None):
+    """Return the quota units a GET on ``url`` costs (1 for unknown endpoints)."""
+    return (costs or ENDPOINT_COSTS).get(endpoint_name(url), 1)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces calls to ``rate`` per second.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size (defaults to ``rate``, at least 1)
+        clock: Monotonic time source
+        sleep: Sleep function used while waiting for tokens
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens without waiting. Returns True on success."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1):
+        """Take tokens, sleeping until they are available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class QuotaLedger:
+    """Thread-safe per-key record of quota units spent against a daily budget.
+
+    Args:
+        keys: API keys to track
+        daily_quota: Units each key may spend per day
+        costs: Optional endpoint → units mapping overriding ``ENDPOINT_COSTS``
+    """
+
+    def __init__(self, keys, daily_quota=DEFAULT_DAILY_QUOTA, costs=None):
+        self.daily_quota = daily_quota
+        self.costs = dict(ENDPOINT_COSTS, **(costs or {}))
+        self._used = {key: 0 for key in keys}
+        self._lock = threading.Lock()
+
+    def cost(self, url):
+        """Return the quota cost of a request to ``url``."""
+        return endpoint_cost(url, self.costs)
+
+    def used(self, key):
+        """Return units spent by ``key``."""
+        with self._lock:
+            return self._used.get(key, 0)
+
+    def remaining(self, key):
+        """Return units ``key`` may still spend."""
+        with self._lock:
+            return max(0, self.daily_quota - self._used.get(key, 0))
+
+    def charge(self, key, units):
+        """Record ``units`` spent by ``key``."""
+        with self._lock:
+            self._used[key] = self._used.get(key, 0) + units
+
+    def refund(self, key, units):
+        """Give back ``units`` reserved for a call that never reached the API."""
+        with self._lock:
+            self._used[key] = max(0, self._used.get(key, 0) - units)
+
+    def exhaust(self, key):
+        """Mark ``key`` as having no budget left (e.g. after a quotaExceeded error)."""
+        with self._lock:
+            self._used[key] = max(self._used.get(key, 0), self.daily_quota)
+
+    def reset(self):
+        """Forget all spending, e.g. at the daily quota reset."""
+        with self._lock:
+            for key in self._used:
+                self._used[key] = 0
+
+    def best_key(self, keys, units=1):
+        """Return the key in ``keys`` with the most remaining budget that can afford ``units``.
+
+        Returns None when no key has enough budget left.
+        """
+        with self._lock:
+            best, best_remaining = None, units - 1
+            for key in keys:
+                remaining = self.daily_quota - self._used.get(key, 0)
+                if remaining > best_remaining:
+                    best, best_remaining = key, remaining
+            return best
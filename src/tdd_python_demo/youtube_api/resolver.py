@@ -0,0 +1,151 @@
+"""Channel/video input parsing and a persistent handle-to-channel-ID cache.
+
+``parse_video_id`` extracts video IDs from watch, short-link, shorts, embed
+and live URLs. ``parse_channel_input`` turns the forms users paste (``UC...`` IDs,
+``@handle``, and ``/channel/``, ``/@``, ``/c/`` and ``/user/`` URLs) into a
+lookup kind and value. ``HandleCache`` remembers API lookups in SQLite:
+resolved handles for a long TTL (handles almost never move) and unknown
+handles for a shorter one, so neither costs a request again soon.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlparse
+
+DEFAULT_TTL = 30 * 86400
+DEFAULT_NEGATIVE_TTL = 86400
+
+_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channel_lookups (
+    lookup TEXT PRIMARY KEY,
+    channel_id TEXT,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def parse_video_id(input_str):
+    """Extract the 11-character video ID from a bare ID or a YouTube video URL.
+
+    Raises:
+        RuntimeError: If no video ID can be found
+    """
+    value = input_str.strip()
+    if _VIDEO_ID.match(value):
+        return value
+
+    parsed = urlparse(value if "://" in value else f"https://{value}")
+    host = (parsed.hostname or "").lower()
+    segments = [s for s in parsed.path.split("/") if s]
+    candidate = None
+    if host == "youtu.be" and segments:
+        candidate = segments[0]
+    elif host == "youtube.com" or host.endswith(".youtube.com"):
+        if segments[:1] == ["watch"]:
+            candidate = parse_qs(parsed.query).get("v", [None])[0]
+        elif len(segments) >= 2 and segments[0] in ("shorts", "embed", "live", "v"):
+            candidate = segments[1]
+    if candidate and _VIDEO_ID.match(candidate):
+        return candidate
+    raise RuntimeError(f"Unable to parse video ID from: {input_str}")
+
+
+def parse_channel_input(input_str):
+    """Classify a channel input.
+
+    Returns:
+        ``(kind, value)`` where kind is ``"id"`` (value is the channel ID),
+        ``"handle"`` (without ``@``), ``"custom"`` (``/c/`` name) or
+        ``"username"`` (legacy ``/user/`` name)
+
+    Raises:
+        RuntimeError: If the input is not a recognised form
+    """
+    value = input_str.strip()
+    if value.startswith("UC"):
+        return "id", value
+    if value.startswith("@"):
+        return "handle", unquote(value[1:])
+
+    parsed = urlparse(value if "://" in value else f"https://{value}")
+    host = (parsed.hostname or "").lower()
+    if host == "youtube.com" or host.endswith(".youtube.com"):
+        segments = [unquote(s) for s in parsed.path.split("/") if s]
+        if segments and segments[0].startswith("@") and len(segments[0]) > 1:
+            return "handle", segments[0][1:]
+        if len(segments) >= 2:
+            kind = {"channel": "id", "c": "custom", "user": "username"}.get(segments[0])
+            if kind == "id" and segments[1].startswith("UC"):
+                return "id", segments[1]
+            if kind in ("custom", "username"):
+                return kind, segments[1]
+
+    raise RuntimeError(f"Unable to resolve channel ID from: {input_str}")
+
+
+class HandleCache:
+    """SQLite cache of channel lookups with positive and negative TTLs.
+
+    Keys are ``kind:value`` with the value lower-cased, since handles and
+    custom names are case-insensitive. Safe to share between threads.
+
+    Args:
+        path: Database file (``":memory:"`` keeps the cache per process)
+        ttl: Seconds a resolved channel ID stays valid
+        negative_ttl: Seconds an unknown handle is remembered as unknown
+        clock: Returns the current time
+    """
+
+    def __init__(self, path=":memory:", ttl=DEFAULT_TTL, negative_ttl=DEFAULT_NEGATIVE_TTL,
+                 clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def key(kind, value):
+        """Return the cache key of a lookup (channel IDs stay case-sensitive)."""
+        return f"{kind}:{value if kind == 'id' else value.lower()}"
+
+    def get(self, kind, value):
+        """Return ``(hit, channel_id)``; a hit with ``None`` means known to be missing."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT channel_id, expires_at FROM channel_lookups WHERE lookup = ?",
+                (self.key(kind, value),)).fetchone()
+        if row is None or row[1] <= self.clock():
+            return False, None
+        return True, row[0]
+
+    def set(self, kind, value, channel_id):
+        """Remember a lookup result; ``None`` records the value as unknown."""
+        ttl = self.ttl if channel_id is not None else self.negative_ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO channel_lookups (lookup, channel_id, expires_at) VALUES (?, ?, ?)",
+                (self.key(kind, value), channel_id, self.clock() + ttl))
+
+    def purge(self):
+        """Delete expired entries; returns how many were removed."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM channel_lookups WHERE expires_at <= ?",
+                                      (self.clock(),)).rowcount
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
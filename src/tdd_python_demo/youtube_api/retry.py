@@ -0,0 +1,187 @@
+"""Retry policy, retry budget and circuit breaker for the YouTube API client."""
+
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+RETRYABLE_STATUSES = (500, 502, 503, 504)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker is open and requests are being shed."""
+
+
+def parse_retry_after(value, now=None):
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds.
+
+    Returns None when the header is missing or malformed.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now if now is not None else time.time()
+    return max(0.0, when.timestamp() - now)
+
+
+class RetryPolicy:
+    """Backoff with decorrelated jitter: ``sleep = min(cap, uniform(base, previous * 3))``.
+
+    The first retry uses ``previous = base``, so even first retries are spread
+    over ``[base, base * 3]`` instead of landing on the same instant.
+
+    Args:
+        base: Minimum delay in seconds
+        cap: Maximum delay in seconds
+        retry_statuses: HTTP status codes retried with backoff
+        max_key_wait: Longest a request waits for a cooling-down key before
+            giving up with "All API keys exhausted"
+        rng: Optional ``random.Random`` for deterministic jitter
+    """
+
+    def __init__(self, base=1.0, cap=30.0, retry_statuses=RETRYABLE_STATUSES,
+                 max_key_wait=10.0, rng=None):
+        self.base = base
+        self.cap = cap
+        self.retry_statuses = tuple(retry_statuses)
+        self.max_key_wait = max_key_wait
+        self._rng = rng or random.Random()
+
+    def next_delay(self, previous=None, retry_after=None):
+        """Return the delay before the next attempt.
+
+        ``previous`` is the last delay used (None before the first retry).
+        A server-provided ``retry_after`` wins when it is longer, but is
+        still capped at ``cap``.
+        """
+        upper = max(self.base, (previous if previous is not None else self.base) * 3)
+        delay = min(self.cap, self._rng.uniform(self.base, upper))
+        if retry_after is not None:
+            delay = min(self.cap, max(delay, retry_after))
+        return delay
+
+
+class RetryBudget:
+    """Caps retries to a fraction of requests so retries cannot amplify an outage.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one.
+    ``min_per_second`` tokens trickle in regardless so low-traffic clients can
+    still retry. Share one instance between clients for a process-wide budget.
+
+    Args:
+        ratio: Retries allowed per request
+        min_per_second: Retries always allowed per second
+        max_tokens: Maximum tokens that can accumulate
+        clock: Monotonic time source
+    """
+
+    def __init__(self, ratio=0.2, min_per_second=1.0, max_tokens=100.0, clock=time.monotonic):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._tokens = max_tokens
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self):
+        """Record a request, earning ``ratio`` retry tokens."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self):
+        """Spend one retry token. Returns False when the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """Closed → open after ``failure_threshold`` consecutive failures → half-open
+    after ``recovery_timeout`` seconds, where ``half_open_max_calls`` trial requests
+    decide whether to close again or re-open.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds the circuit stays open
+        half_open_max_calls: Trial requests allowed while half-open
+        clock: Monotonic time source
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1,
+                 clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            self._update()
+            return self._state
+
+    def _update(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+
+    def allow(self):
+        """Return True if a request may be sent now."""
+        with self._lock:
+            self._update()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            return False
+
+    def release(self):
+        """Give back a half-open trial slot whose request produced no verdict."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_success(self):
+        """Close the circuit after a successful response."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold or on a failed trial."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = self._clock()
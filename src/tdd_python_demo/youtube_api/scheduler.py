@@ -0,0 +1,161 @@
+"""Adaptive polling scheduler for watching many channels.
+
+Channels sit in a heap ordered by next-due time. Each poll pops the due
+channels, tops the last batch up with channels due shortly after (a
+``channels`` call costs 1 unit for 1 or 50 IDs), fetches them in 50-ID
+requests and reports only profiles that changed. A channel's interval
+shrinks when it changes and grows while it stays the same, so quiet
+channels cost little quota and busy ones stay fresh.
+"""
+
+import heapq
+import itertools
+import time
+
+from .client import MAX_IDS_PER_REQUEST
+
+# Fields compared to decide whether a channel changed; view counts move on
+# almost every poll, so they are left out by default.
+DEFAULT_WATCH_FIELDS = ("title", "description", "custom_url", "subscriber_count", "video_count")
+
+
+class ChannelWatcher:
+    """Poll channel profiles on adaptive per-channel intervals.
+
+    Args:
+        client: ``YouTubeClient`` providing ``get_channel_profiles``
+        min_interval: Shortest polling interval in seconds
+        max_interval: Longest polling interval in seconds
+        initial_interval: Interval of newly added channels (defaults to ``min_interval``)
+        backoff: Interval multiplier after a poll without changes
+        speedup: Interval multiplier after a poll with changes
+        prefetch_window: Seconds ahead a channel may be polled early to fill a batch
+        watch_fields: Profile fields compared between polls (None compares all)
+        clock: Returns the current time
+        sleep: Sleeps between polls in ``run``
+    """
+
+    def __init__(self, client, min_interval=300, max_interval=86400, initial_interval=None,
+                 backoff=2.0, speedup=0.5, prefetch_window=60, watch_fields=DEFAULT_WATCH_FIELDS,
+                 clock=time.time, sleep=time.sleep):
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval if initial_interval is not None else min_interval
+        self.backoff = backoff
+        self.speedup = speedup
+        self.prefetch_window = prefetch_window
+        self.watch_fields = watch_fields
+        self.clock = clock
+        self.sleep = sleep
+        self._heap = []
+        self._due = {}
+        self._intervals = {}
+        self._fingerprints = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, channel_id):
+        return channel_id in self._due
+
+    def add(self, channel_id, due=None):
+        """Watch a channel, first polling it at ``due`` (default: now)."""
+        self._intervals.setdefault(channel_id, self.initial_interval)
+        self._schedule(channel_id, self.clock() if due is None else due)
+
+    def remove(self, channel_id):
+        """Stop watching a channel."""
+        self._due.pop(channel_id, None)
+        self._intervals.pop(channel_id, None)
+        self._fingerprints.pop(channel_id, None)
+
+    def interval(self, channel_id):
+        """Return the current polling interval of a channel."""
+        return self._intervals[channel_id]
+
+    def next_due(self):
+        """Return when the next channel is due, or None if nothing is watched."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def poll(self):
+        """Fetch every due channel and return the profiles that changed.
+
+        A channel's first successful poll always counts as a change. If a
+        request fails, the channels not yet processed are rescheduled one
+        interval later and the error is re-raised.
+        """
+        now = self.clock()
+        batch = self._pop_due(now)
+        changed = []
+        try:
+            while batch:
+                chunk = batch[:MAX_IDS_PER_REQUEST]
+                profiles = self.client.get_channel_profiles(chunk)
+                for channel_id in chunk:
+                    profile = profiles.get(channel_id)
+                    first = channel_id not in self._fingerprints
+                    if profile is None:
+                        self._adapt(channel_id, self.backoff)
+                    elif self._update(channel_id, profile):
+                        changed.append(profile)
+                        if not first:
+                            self._adapt(channel_id, self.speedup)
+                    else:
+                        self._adapt(channel_id, self.backoff)
+                    self._schedule(channel_id, now + self._intervals[channel_id])
+                batch = batch[MAX_IDS_PER_REQUEST:]
+        finally:
+            for channel_id in batch:
+                self._schedule(channel_id, now + self._intervals[channel_id])
+        return changed
+
+    def run(self, on_change, max_polls=None):
+        """Poll forever (or ``max_polls`` times), calling ``on_change(profile)`` per change."""
+        polls = 0
+        while self._due and (max_polls is None or polls < max_polls):
+            delay = self.next_due() - self.clock()
+            if delay > 0:
+                self.sleep(delay)
+            for profile in self.poll():
+                on_change(profile)
+            polls += 1
+
+    def _schedule(self, channel_id, due):
+        self._due[channel_id] = due
+        heapq.heappush(self._heap, (due, next(self._counter), channel_id))
+
+    def _drop_stale(self):
+        """Discard heap entries superseded by a reschedule or removal."""
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now):
+        """Pop channels due by ``now``, plus early ones to fill the last 50-ID batch."""
+        due = []
+        while True:
+            self._drop_stale()
+            if not self._heap:
+                break
+            due_at, _, channel_id = self._heap[0]
+            room = -len(due) % MAX_IDS_PER_REQUEST
+            if due_at > now and (due_at > now + self.prefetch_window or not room):
+                break
+            heapq.heappop(self._heap)
+            del self._due[channel_id]
+            due.append(channel_id)
+        return due
+
+    def _update(self, channel_id, profile):
+        """Store the profile's fingerprint; return True if it differs from the last one."""
+        fields = self.watch_fields if self.watch_fields is not None else tuple(profile)
+        fingerprint = tuple(profile.get(name) for name in fields)
+        previous = self._fingerprints.get(channel_id)
+        self._fingerprints[channel_id] = fingerprint
+        return fingerprint != previous
+
+    def _adapt(self, channel_id, factor):
+        interval = self._intervals[channel_id] * factor
+        self._intervals[channel_id] = min(self.max_interval, max(self.min_interval, interval))
@@ -0,0 +1,274 @@
+"""Quota ledger and key health shared by every process on a host.
+
+``SharedQuotaStore`` keeps per-key unit consumption, exhaustion and
+cooldowns in one SQLite database in WAL mode, so readers never block and
+each reservation is a short ``BEGIN IMMEDIATE`` transaction. ``SharedKeyPool``
+is a ``KeyPool`` whose selection, reservation and health reports go through
+that store::
+
+    store = SharedQuotaStore("/var/tmp/youtube-quota.db")
+    pool = SharedKeyPool(keys, store)
+    client = YouTubeClient(",".join(keys), quota_ledger=store, key_pool=pool)
+
+A key parked by one process is skipped by all of them, and the units a
+request may spend are reserved before it is sent.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from .key_pool import KeyPool, next_daily_reset
+from .quota import DEFAULT_DAILY_QUOTA, ENDPOINT_COSTS, endpoint_cost
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_keys (
+    key TEXT PRIMARY KEY,
+    used INTEGER NOT NULL DEFAULT 0,
+    exhausted INTEGER NOT NULL DEFAULT 0,
+    cooldown_until REAL NOT NULL DEFAULT 0,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    last_pick INTEGER NOT NULL DEFAULT 0,
+    reset_at REAL NOT NULL
+)
+"""
+
+
+class SharedQuotaStore:
+    """``QuotaLedger``-compatible ledger stored in a SQLite WAL database.
+
+    Safe to use from many threads and processes. Spending resets at the
+    daily quota reset (midnight Pacific), checked on every access.
+
+    Args:
+        path: Database file shared by the processes
+        daily_quota: Units each key may spend per day
+        costs: Optional endpoint → units mapping overriding ``ENDPOINT_COSTS``
+        timeout: Seconds to wait for another process's write lock
+        clock: Wall-clock time source (epoch seconds)
+    """
+
+    def __init__(self, path, daily_quota=DEFAULT_DAILY_QUOTA, costs=None, timeout=30.0,
+                 clock=time.time):
+        self.path = path
+        self.daily_quota = daily_quota
+        self.costs = dict(ENDPOINT_COSTS, **(costs or {}))
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None,
+                                     check_same_thread=False)
+        self._enable_wal(timeout)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def _enable_wal(self, timeout):
+        """Switch to WAL, retrying while another process holds the lock.
+
+        The journal mode switch ignores the busy timeout, so processes
+        opening a new database together would otherwise fail at once.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while True:
+            try:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                return
+            except sqlite3.OperationalError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+    @contextmanager
+    def transaction(self):
+        """Run statements in one write transaction; yields the connection.
+
+        Expired daily budgets are reset first, so callers always see today's
+        numbers.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                self._conn.execute(
+                    "UPDATE api_keys SET used = 0, exhausted = 0, cooldown_until = 0, "
+                    "consecutive_failures = 0, reset_at = ? WHERE reset_at <= ?",
+                    (next_daily_reset(now), now))
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def register(self, keys):
+        """Add ``keys`` to the store (existing keys keep their state)."""
+        reset_at = next_daily_reset(self.clock())
+        with self.transaction() as conn:
+            conn.executemany("INSERT OR IGNORE INTO api_keys (key, reset_at) VALUES (?, ?)",
+                             [(key, reset_at) for key in keys])
+
+    def cost(self, url):
+        """Return the quota cost of a request to ``url``."""
+        return endpoint_cost(url, self.costs)
+
+    def used(self, key):
+        """Return units spent by ``key`` today, across all processes."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT used FROM api_keys WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self, key):
+        """Return units ``key`` may still spend today."""
+        return max(0, self.daily_quota - self.used(key))
+
+    def charge(self, key, units):
+        """Record ``units`` spent by ``key``."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE api_keys SET used = used + ? WHERE key = ?", (units, key))
+
+    def refund(self, key, units):
+        """Give back ``units`` reserved for a call that never reached the API."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE api_keys SET used = MAX(0, used - ?) WHERE key = ?", (units, key))
+
+    def exhaust(self, key):
+        """Mark ``key`` as having no budget left (e.g. after a quotaExceeded error)."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE api_keys SET used = MAX(used, ?) WHERE key = ?", (self.daily_quota, key))
+
+    def reset(self):
+        """Forget all spending and key health."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE api_keys SET used = 0, exhausted = 0, cooldown_until = 0, "
+                         "consecutive_failures = 0")
+
+    def best_key(self, keys, units=1):
+        """Return the key in ``keys`` with the most remaining budget that can afford ``units``."""
+        keys = list(keys)
+        with self.transaction() as conn:
+            rows = conn.execute(
+                f"SELECT key, used FROM api_keys WHERE key IN ({','.join('?' * len(keys))})", keys).fetchall()
+        best, best_remaining = None, units - 1
+        for key, used in sorted(rows, key=lambda row: keys.index(row[0])):
+            if self.daily_quota - used > best_remaining:
+                best, best_remaining = key, self.daily_quota - used
+        return best
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SharedKeyPool(KeyPool):
+    """``KeyPool`` whose key state lives in a ``SharedQuotaStore``.
+
+    Selection, quota reservation and health updates are single SQLite
+    transactions, so every process on the host sees the same cooldowns and
+    spending. ``"weighted"`` picks the key with the most remaining budget;
+    ``"round_robin"`` picks the least recently used healthy key.
+
+    Args:
+        keys: API keys to serve
+        store: ``SharedQuotaStore`` shared by the processes
+        strategy: ``"round_robin"`` or ``"weighted"``
+        cooldown: Base cooldown in seconds after a rate-limit error
+        max_cooldown: Upper bound for the cooldown
+    """
+
+    def __init__(self, keys, store, strategy="weighted", cooldown=1.0, max_cooldown=60.0):
+        super().__init__(keys, strategy=strategy, quota_ledger=store, cooldown=cooldown,
+                         max_cooldown=max_cooldown, clock=store.clock)
+        self.store = store
+        store.register(keys)
+
+    def _rows(self, conn):
+        placeholders = ",".join("?" * len(self._states))
+        return conn.execute(
+            "SELECT key, used, exhausted, cooldown_until, last_pick FROM api_keys "
+            f"WHERE key IN ({placeholders})", self.keys).fetchall()
+
+    def acquire(self, units=1, reserve=False):
+        """Return a healthy key able to spend ``units``, reserving them if asked."""
+        with self.store.transaction() as conn:
+            now = self._clock()
+            budget = self.store.daily_quota - units
+            candidates = [row for row in self._rows(conn)
+                          if not row[2] and row[3] <= now and row[1] <= budget]
+            if not candidates:
+                return None
+            if self.strategy == "weighted":
+                key = min(candidates, key=lambda row: (row[1], row[4]))[0]
+            else:
+                key = min(candidates, key=lambda row: row[4])[0]
+            conn.execute(
+                "UPDATE api_keys SET used = used + ?, "
+                "last_pick = (SELECT MAX(last_pick) FROM api_keys) + 1 WHERE key = ?",
+                (units if reserve else 0, key))
+            return key
+
+    def next_available_in(self, units=1):
+        """Return seconds until a key able to spend ``units`` is free (0 if one is now)."""
+        with self.store.transaction() as conn:
+            now = self._clock()
+            reset_wait = next_daily_reset(now) - now
+            waits = []
+            for _, used, exhausted, cooldown_until, _ in self._rows(conn):
+                if exhausted or used > self.store.daily_quota - units:
+                    waits.append(reset_wait)
+                else:
+                    waits.append(max(0.0, cooldown_until - now))
+            return min(waits)
+
+    def report_success(self, key):
+        """Record a successful call on ``key``."""
+        with self.store.transaction() as conn:
+            conn.execute("UPDATE api_keys SET successes = successes + 1, consecutive_failures = 0 "
+                         "WHERE key = ?", (key,))
+
+    def report_rate_limited(self, key, retry_after=None):
+        """Cool ``key`` down in every process."""
+        with self.store.transaction() as conn:
+            row = conn.execute("SELECT consecutive_failures FROM api_keys WHERE key = ?", (key,)).fetchone()
+            failures = (row[0] if row else 0) + 1
+            if retry_after is not None:
+                delay = retry_after
+            else:
+                delay = min(self.max_cooldown, self.cooldown * 2 ** (failures - 1))
+            conn.execute("UPDATE api_keys SET failures = failures + 1, consecutive_failures = ?, "
+                         "cooldown_until = ? WHERE key = ?", (failures, self._clock() + delay, key))
+
+    def report_quota_exceeded(self, key):
+        """Take ``key`` out of rotation in every process until the daily reset."""
+        with self.store.transaction() as conn:
+            conn.execute("UPDATE api_keys SET failures = failures + 1, "
+                         "consecutive_failures = consecutive_failures + 1, exhausted = 1, "
+                         "used = MAX(used, ?) WHERE key = ?", (self.store.daily_quota, key))
+
+    def health(self):
+        """Return a key → health snapshot mapping, as seen by all processes."""
+        with self.store.transaction() as conn:
+            now = self._clock()
+            rows = conn.execute(
+                "SELECT key, used, exhausted, cooldown_until, consecutive_failures, successes, failures "
+                f"FROM api_keys WHERE key IN ({','.join('?' * len(self._states))})", self.keys).fetchall()
+        return {
+            key: {
+                "available": not exhausted and cooldown_until <= now and used < self.store.daily_quota,
+                "exhausted": bool(exhausted),
+                "cooldown_remaining": max(0.0, cooldown_until - now),
+                "consecutive_failures": consecutive,
+                "successes": successes,
+                "failures": failures,
+                "used": used,
+            }
+            for key, used, exhausted, cooldown_until, consecutive, successes, failures in rows
+        }
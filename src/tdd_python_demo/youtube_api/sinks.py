@@ -0,0 +1,133 @@
+"""Batched output sinks for comment rows.
+
+Sinks buffer flat dict rows and write them out ``batch_size`` at a time.
+``flush()`` makes every row written so far durable; the ingestion pipeline
+only checkpoints page tokens after a flush. ``pyarrow`` is optional and
+only needed for ``ParquetSink``.
+"""
+
+import gzip
+import json
+import os
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional dependency
+    pyarrow = None
+
+
+class _BatchSink:
+    """Buffer rows and hand them to ``_write_batch`` in batches."""
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffer = []
+
+    def write(self, rows):
+        """Buffer rows, writing a batch whenever ``batch_size`` is reached.
+
+        Returns:
+            True if a batch was written (and flushed) by this call
+        """
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self):
+        """Write any buffered rows and make them durable."""
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+        self._sync()
+
+    def close(self):
+        """Flush and release the underlying file."""
+        self.flush()
+        self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_batch(self, rows):
+        raise NotImplementedError
+
+    def _sync(self):
+        pass
+
+    def _close(self):
+        pass
+
+
+class JSONLinesSink(_BatchSink):
+    """Append rows as JSON Lines, gzip-compressed when the path ends in ``.gz``.
+
+    Each flush appends a new gzip member, so a resumed run keeps appending to
+    the same file and ``gzip.open`` reads all members back as one stream.
+
+    Args:
+        path: Output file path
+        batch_size: Rows buffered before a write
+        compresslevel: gzip level (6 trades little size for much less CPU than 9)
+    """
+
+    def __init__(self, path, batch_size=1000, compresslevel=6):
+        super().__init__(batch_size)
+        self.path = path
+        self.compresslevel = compresslevel
+        self._file = open(path, "ab")
+
+    def _write_batch(self, rows):
+        data = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode("utf-8")
+        if self.path.endswith(".gz"):
+            data = gzip.compress(data, compresslevel=self.compresslevel)
+        self._file.write(data)
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetSink(_BatchSink):
+    """Write rows as a directory of Parquet files (requires ``pyarrow``).
+
+    Every batch becomes its own complete ``part-NNNNN.parquet`` file, so a
+    flushed batch survives a crash and resumed runs only add files.
+
+    Args:
+        directory: Dataset directory (created if missing)
+        batch_size: Rows per part file
+        compression: Parquet codec
+    """
+
+    def __init__(self, directory, batch_size=10000, compression="zstd"):
+        if pyarrow is None:
+            raise RuntimeError("pyarrow is not installed")
+        super().__init__(batch_size)
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.compression = compression
+        self._part = sum(1 for name in os.listdir(directory) if name.startswith("part-"))
+
+    def _write_batch(self, rows):
+        path = os.path.join(self.directory, f"part-{self._part:05d}.parquet")
+        pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows), path,
+                                    compression=self.compression)
+        self._part += 1
+
+
+def open_sink(path, batch_size=1000):
+    """Open a sink for ``path``: JSON Lines for ``.jsonl``/``.jsonl.gz``, Parquet otherwise."""
+    if path.endswith((".jsonl", ".jsonl.gz", ".ndjson", ".ndjson.gz")):
+        return JSONLinesSink(path, batch_size=batch_size)
+    return ParquetSink(path, batch_size=batch_size)
@@ -0,0 +1,169 @@
+"""Incremental comment sync: fetch only comments posted since the last run.
+
+Threads are requested newest first (``order=time``) and paging stops at the
+first comment older than the newest one seen before, so refreshing a quiet
+video costs one page instead of all of them. The newest ``publishedAt`` per
+video, plus the IDs sharing that timestamp, live in a SQLite state store.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .models import CommentRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS comment_sync (
+    video_id TEXT PRIMARY KEY,
+    newest_published_at TEXT,
+    newest_ids TEXT NOT NULL DEFAULT '[]',
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+)
+"""
+
+
+def _comment_key(comment):
+    """Return (ID, publishedAt) of a ``commentThreads`` item or ``CommentRecord``."""
+    if isinstance(comment, CommentRecord):
+        return comment.id, comment.published_at
+    snippet = comment.get("snippet", {}).get("topLevelComment", {}).get("snippet", {})
+    return comment.get("id"), snippet.get("publishedAt")
+
+
+class SyncStore:
+    """SQLite store of per-video sync state, safe to share between threads.
+
+    Args:
+        path: Database file (``":memory:"`` for a throwaway store)
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def get(self, video_id):
+        """Return the stored state of a video, or None if it was never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_published_at, newest_ids, comment_count, synced_at "
+                "FROM comment_sync WHERE video_id = ?", (video_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "newest_published_at": row[0],
+            "newest_ids": json.loads(row[1]),
+            "comment_count": row[2],
+            "synced_at": row[3],
+        }
+
+    def save(self, video_id, newest_published_at, newest_ids, new_comments, synced_at):
+        """Record a finished sync, adding ``new_comments`` to the video's running count."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO comment_sync (video_id, newest_published_at, newest_ids, comment_count, synced_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(video_id) DO UPDATE SET newest_published_at = excluded.newest_published_at, "
+                "newest_ids = excluded.newest_ids, comment_count = comment_count + excluded.comment_count, "
+                "synced_at = excluded.synced_at",
+                (video_id, newest_published_at, json.dumps(sorted(newest_ids)), new_comments, synced_at))
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CommentSync:
+    """Fetch the comment threads added to videos since their previous sync.
+
+    The first sync of a video fetches every thread. Replies and edits to old
+    threads are not picked up, since ``order=time`` sorts by thread creation.
+
+    Args:
+        client: ``YouTubeClient`` used for ``list_comments``
+        store: ``SyncStore`` holding the per-video watermark
+        page_size: ``commentThreads`` page size
+        clock: Returns the current time, recorded as ``synced_at``
+    """
+
+    def __init__(self, client, store, page_size=100, clock=time.time):
+        self.client = client
+        self.store = store
+        self.page_size = page_size
+        self.clock = clock
+
+    def sync(self, video_id):
+        """Return the video's new comment threads, newest first, and advance its watermark."""
+        state = self.store.get(video_id)
+        newest = state["newest_published_at"] if state else None
+        seen = set(state["newest_ids"]) if state else set()
+
+        new_comments = []
+        unmatched = set(seen)
+        page_token = None
+        reached_seen = False
+        while not reached_seen:
+            comments, page_token = self.client.list_comments(
+                video_id, page_size=self.page_size, max_comments=None,
+                page_token=page_token, order="time")
+            for comment in comments:
+                comment_id, published_at = _comment_key(comment)
+                if newest and published_at:
+                    if published_at < newest:
+                        reached_seen = True
+                        break
+                    if published_at == newest and comment_id in seen:
+                        # Once every watermark ID is matched, the rest were synced before.
+                        unmatched.discard(comment_id)
+                        if not unmatched:
+                            reached_seen = True
+                            break
+                        continue
+                new_comments.append(comment)
+            if not page_token:
+                break
+
+        for comment in new_comments:
+            comment_id, published_at = _comment_key(comment)
+            if not published_at:
+                continue
+            if newest is None or published_at > newest:
+                newest, seen = published_at, {comment_id}
+            elif published_at == newest:
+                seen.add(comment_id)
+        self.store.save(video_id, newest, seen, len(new_comments), self.clock())
+        return new_comments
+
+    def sync_many(self, video_ids, max_workers=8):
+        """Sync several videos concurrently.
+
+        A failing video does not discard the others: each successful sync has
+        already advanced its watermark, so its comments are always returned.
+
+        Returns:
+            Tuple of ``{video_id: new comments}`` for the videos that synced
+            and ``{video_id: exception}`` for those that failed
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        results, errors = {}, {}
+        if not video_ids:
+            return results, errors
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(video_ids))) as executor:
+            futures = [(video_id, executor.submit(self.sync, video_id)) for video_id in video_ids]
+            for video_id, future in futures:
+                try:
+                    results[video_id] = future.result()
+                except Exception as exc:
+                    errors[video_id] = exc
+        return results, errors
@@ -0,0 +1,228 @@
+"""Compact append-only store of channel and video statistics snapshots.
+
+Snapshots are buffered per entity and written on ``flush`` as one block per
+entity: the timestamps and each counter column are delta-encoded and
+stored as zigzag varints, so a slowly growing counter costs a byte or two
+per sample instead of a JSON object. Blocks are self-describing::
+
+    varint block length
+    varint entity length, entity ID (UTF-8)
+    varint sample count, zigzag first timestamp, varint time span
+    timestamp deltas, then per column: first value and deltas
+
+Reads memory-map the file and decode only the blocks of the requested
+entity into ``array('q')`` columns; a torn block at the end (e.g. after a
+crash during ``flush``) is ignored.
+"""
+
+import mmap
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+# Counters kept per snapshot, named like the client's results.
+METRICS = ("view_count", "like_count", "comment_count", "subscriber_count", "video_count")
+# Stored for counters a snapshot does not have (e.g. hidden like counts).
+MISSING = -1
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_signed(out, value):
+    _write_varint(out, (value << 1) ^ (value >> 63))
+
+
+def _read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _read_signed(data, pos):
+    value, pos = _read_varint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def _encode_column(out, values):
+    previous = 0
+    for value in values:
+        _write_signed(out, value - previous)
+        previous = value
+
+
+def _decode_column(data, pos, count):
+    column = array("q")
+    value = 0
+    for _ in range(count):
+        delta, pos = _read_signed(data, pos)
+        value += delta
+        column.append(value)
+    return column, pos
+
+
+class SnapshotStore:
+    """Delta/varint-encoded time series of statistics per channel or video.
+
+    Safe to share between threads. Queries see flushed snapshots only.
+
+    Args:
+        path: Data file (created if missing)
+        clock: Returns the current time, used when ``record`` gets no timestamp
+    """
+
+    def __init__(self, path, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._buffer = {}
+        self._file = open(path, "ab+")
+        self._map = None
+        self._index = {}
+        self._scan(0)
+
+    def _remap(self):
+        size = os.fstat(self._file.fileno()).st_size
+        if self._map is not None and len(self._map) == size:
+            return
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def _scan(self, start):
+        """Index the block headers from ``start`` to the end of the file."""
+        self._remap()
+        data = self._map
+        size = len(data) if data is not None else 0
+        pos = start
+        while pos < size:
+            try:
+                length, body = _read_varint(data, pos)
+                if body + length > size:
+                    break
+                name_length, cursor = _read_varint(data, body)
+                entity = bytes(data[cursor:cursor + name_length]).decode()
+                cursor += name_length
+                count, cursor = _read_varint(data, cursor)
+                first, cursor = _read_signed(data, cursor)
+                span, _ = _read_varint(data, cursor)
+            except IndexError:
+                break
+            self._index.setdefault(entity, []).append((body, first, first + span, count))
+            pos = body + length
+        self._end = pos
+
+    def record(self, entity_id, snapshot, timestamp=None):
+        """Buffer the counters of ``snapshot`` (a profile or statistics mapping)."""
+        timestamp = int(timestamp if timestamp is not None else self.clock())
+        values = [snapshot.get(name) for name in METRICS]
+        row = [timestamp] + [MISSING if value is None else int(value) for value in values]
+        with self._lock:
+            self._buffer.setdefault(entity_id, []).append(row)
+
+    def flush(self):
+        """Write buffered snapshots as one block per entity and make them durable."""
+        with self._lock:
+            if not self._buffer:
+                return
+            out = bytearray()
+            for entity_id, rows in self._buffer.items():
+                rows.sort(key=lambda row: row[0])
+                block = bytearray()
+                name = entity_id.encode()
+                _write_varint(block, len(name))
+                block += name
+                _write_varint(block, len(rows))
+                _write_signed(block, rows[0][0])
+                _write_varint(block, rows[-1][0] - rows[0][0])
+                for column in range(len(METRICS) + 1):
+                    _encode_column(block, [row[column] for row in rows])
+                _write_varint(out, len(block))
+                out += block
+            self._file.seek(self._end)
+            self._file.truncate()
+            self._file.write(out)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._buffer = {}
+            self._scan(self._end)
+
+    def entities(self):
+        """Return the IDs of every entity with flushed snapshots."""
+        with self._lock:
+            return list(self._index)
+
+    def series(self, entity_id, start=None, end=None):
+        """Return the snapshots of an entity with ``start <= timestamp < end``.
+
+        Returns:
+            Dict mapping ``"timestamp"`` and each of ``METRICS`` to an
+            ``array('q')`` in time order (``MISSING`` marks absent counters)
+        """
+        lower = float("-inf") if start is None else start
+        upper = float("inf") if end is None else end
+        with self._lock:
+            blocks = [block for block in self._index.get(entity_id, ())
+                      if block[1] < upper and block[2] >= lower]
+            columns = [array("q") for _ in range(len(METRICS) + 1)]
+            for body, _, _, count in blocks:
+                name_length, pos = _read_varint(self._map, body)
+                pos = _read_varint(self._map, pos + name_length)[1]
+                pos = _read_signed(self._map, pos)[1]
+                pos = _read_varint(self._map, pos)[1]
+                for column in columns:
+                    values, pos = _decode_column(self._map, pos, count)
+                    column.extend(values)
+
+        timestamps = columns[0]
+        if any(timestamps[i] > timestamps[i + 1] for i in range(len(timestamps) - 1)):
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            columns = [array("q", (column[i] for i in order)) for column in columns]
+            timestamps = columns[0]
+        first = 0 if start is None else bisect_left(timestamps, start)
+        last = len(timestamps) if end is None else bisect_left(timestamps, end)
+        return {name: column[first:last] for name, column in zip(("timestamp",) + METRICS, columns)}
+
+    def rate(self, entity_id, metric, start=None, end=None, per=86400):
+        """Return the average change of ``metric`` per ``per`` seconds over a range.
+
+        Uses the first and last snapshots in the range that have the
+        counter; returns None with fewer than two such snapshots.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        data = self.series(entity_id, start, end)
+        points = [(t, v) for t, v in zip(data["timestamp"], data[metric]) if v != MISSING]
+        if len(points) < 2 or points[-1][0] == points[0][0]:
+            return None
+        (t0, v0), (t1, v1) = points[0], points[-1]
+        return (v1 - v0) * per / (t1 - t0)
+
+    def rates(self, entity_ids, metric, start=None, end=None, per=86400):
+        """Return ``{entity_id: rate}`` for many entities (see ``rate``)."""
+        return {entity_id: self.rate(entity_id, metric, start, end, per) for entity_id in entity_ids}
+
+    def close(self):
+        """Flush buffered snapshots and release the file."""
+        self.flush()
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
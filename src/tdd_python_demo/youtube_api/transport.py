@@ -0,0 +1,162 @@
+"""HTTP transports used by ``YouTubeClient`` to send API requests.
+
+A transport sends one GET and returns a response with ``status_code``,
+``headers``, ``content``, ``elapsed`` and ``json()``; ``errors`` lists the
+exceptions that mean the request never got an answer (retried by the
+client). ``RequestsTransport`` is the default: HTTP/1.1 over a pooled
+``requests.Session``, one request per connection at a time.
+``HTTPXTransport`` speaks HTTP/2 through httpx, multiplexing concurrent
+calls from many threads over a few connections::
+
+    client = YouTubeClient(keys, transport=HTTPXTransport(max_connections=4))
+
+``RecordingTransport`` and ``ReplayTransport`` write every exchange to a
+``ResponseArchive`` and serve it back later without any network, so a
+day's crawl can be reprocessed (or the client benchmarked) at disk speed.
+"""
+
+import ssl
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .archive import kept_headers, request_key
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+
+class Transport:
+    """Interface of a client transport."""
+
+    errors = ()
+
+    def get(self, url, params, timeout):
+        """Send a GET request and return its response."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release pooled connections."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """HTTP/1.1 transport over a pooled ``requests.Session``.
+
+    Args:
+        session: Optional ``requests.Session`` to use instead of a new pooled
+            one (its adapters are left untouched)
+        pool_size: Keep-alive connections kept per host
+        verify: TLS verification: True, False or a CA bundle path
+    """
+
+    errors = (requests.exceptions.RequestException,)
+
+    def __init__(self, session=None, pool_size=10, verify=True):
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        # Passed per request: requests lets REQUESTS_CA_BUNDLE override ``session.verify``.
+        self._options = {} if verify is True else {"verify": verify}
+
+    def get(self, url, params, timeout):
+        """Send a GET request through the session."""
+        return self.session.get(url, params=params, timeout=timeout, **self._options)
+
+    def close(self):
+        """Close the session's connections."""
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """HTTP/2 transport over a thread-safe ``httpx.Client``.
+
+    Concurrent requests share connections as separate streams, so a crawl
+    with many threads needs only ``max_connections`` sockets and TLS
+    handshakes. Servers without HTTP/2 are spoken to over HTTP/1.1.
+
+    Args:
+        http2: Negotiate HTTP/2 (needs the ``h2`` package)
+        max_connections: Upper bound on open connections
+        max_keepalive_connections: Idle connections kept open
+        verify: TLS verification: True, False or a CA bundle path
+
+    Raises:
+        RuntimeError: If httpx is not installed
+    """
+
+    def __init__(self, http2=True, max_connections=10, max_keepalive_connections=10, verify=True):
+        if httpx is None:
+            raise RuntimeError("httpx is not installed")
+        self.errors = (httpx.TransportError,)
+        limits = httpx.Limits(max_connections=max_connections,
+                              max_keepalive_connections=max_keepalive_connections)
+        if isinstance(verify, str):  # httpx wants a CA bundle as an SSL context
+            verify = ssl.create_default_context(cafile=verify)
+        self.client = httpx.Client(http2=http2, limits=limits, verify=verify)
+
+    def get(self, url, params, timeout):
+        """Send a GET request, multiplexed with any others in flight."""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        return self.client.get(url, params=params, timeout=timeout)
+
+    def close(self):
+        """Close the connections."""
+        self.client.close()
+
+
+class RecordingTransport(Transport):
+    """Send requests through ``transport`` and archive every response.
+
+    Args:
+        transport: Transport doing the actual network I/O
+        archive: ``ResponseArchive`` opened in append mode
+    """
+
+    def __init__(self, transport, archive):
+        self.transport = transport
+        self.archive = archive
+        self.errors = transport.errors
+
+    def get(self, url, params, timeout):
+        """Send the request and append the response to the archive."""
+        response = self.transport.get(url, params, timeout)
+        self.archive.append(request_key(url, params), response.status_code,
+                            kept_headers(response.headers), response.content)
+        return response
+
+    def close(self):
+        """Close the wrapped transport and flush the archive."""
+        self.transport.close()
+        self.archive.flush()
+
+
+class ReplayTransport(Transport):
+    """Serve requests from a ``ResponseArchive`` without touching the network.
+
+    Raises:
+        RuntimeError: From ``get`` when a request was never recorded
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+
+    def get(self, url, params, timeout):
+        """Return the archived response for this request."""
+        key = request_key(url, params)
+        response = self.archive.get(key)
+        if response is None:
+            raise RuntimeError(f"No archived response for {key}")
+        return response
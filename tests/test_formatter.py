@@ -9,6 +9,7 @@ from tdd_python_demo.youtube_api.formatter import (
     format_summary,
     format_channel_profile
 )
+from tdd_python_demo.youtube_api.models import ChannelRecord, VideoRecord
 
 
 class TestFormatJson:
@@ -37,6 +38,15 @@ class TestFormatJson:
         parsed = json.loads(result)
         assert parsed == data
 
+    def test_format_json_with_records(self):
+        """Test format_json serializes slotted records via to_dict."""
+        record = ChannelRecord("UC1", "Chan", view_count="10",
+                               recent_videos=[VideoRecord("v1", "Vid", like_count="2")])
+        parsed = json.loads(format_json([record]))
+
+        assert parsed[0]["view_count"] == 10
+        assert parsed[0]["recent_videos"][0]["like_count"] == 2
+
     def test_format_json_with_chinese_characters(self):
         """Test format_json properly handles Chinese characters without escaping."""
         data = {"title": "摩的司机徐师傅", "description": "若无闲事挂心头"}
@@ -0,0 +1,80 @@
+"""Shared fixtures for the unit tests."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep moves time forward."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _comment_thread(thread_id, replies=0, published_at=None, text="hi"):
+    return {"id": thread_id, "snippet": {
+        "totalReplyCount": replies,
+        "topLevelComment": {"snippet": {"textDisplay": text, "publishedAt": published_at}},
+    }}
+
+
+def _comment_client(pages, fail_at=None, reply_delay=None):
+    """Mock client serving numbered comment pages and echoing one reply per thread.
+
+    Args:
+        pages: List of pages served for every video, or a dict of such lists keyed by video ID.
+        fail_at: Set of ``(video_id, page)`` pairs at which list_comments raises.
+        reply_delay: Callable mapping a thread ID to seconds to sleep before replying.
+    """
+    client = Mock()
+
+    def list_comments(video_id, page_token=None, **kwargs):
+        page = int(page_token or 0)
+        if fail_at and (video_id, page) in fail_at:
+            raise RuntimeError("boom")
+        video_pages = pages[video_id] if isinstance(pages, dict) else pages
+        return video_pages[page], str(page + 1) if page + 1 < len(video_pages) else None
+
+    client.list_comments.side_effect = list_comments
+
+    def replies(thread_id, page_size=None):
+        if reply_delay:
+            time.sleep(reply_delay(thread_id))
+        return [{"id": f"{thread_id}.r"}]
+
+    client.get_all_comment_replies.side_effect = replies
+    return client
+
+
+@pytest.fixture
+def clock_start():
+    """Initial reading of the ``clock`` fixture; modules override it as needed."""
+    return 0.0
+
+
+@pytest.fixture
+def clock(clock_start):
+    """FakeClock starting at ``clock_start``."""
+    return FakeClock(clock_start)
+
+
+@pytest.fixture
+def comment_thread():
+    """Factory for raw commentThreads items."""
+    return _comment_thread
+
+
+@pytest.fixture
+def comment_client():
+    """Factory for mock clients serving paged comment threads."""
+    return _comment_client
@@ -0,0 +1,153 @@
+"""Tests for the compressed response archive."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from tdd_python_demo.youtube_api import archive as archive_module
+from tdd_python_demo.youtube_api.archive import ResponseArchive, request_key, resource_ids
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+
+
+class TestRequestKey:
+    """Test request_key()."""
+
+    def test_ignores_api_key_and_param_order(self):
+        """Test keys are stable across API keys and parameter order."""
+        first = request_key("https://x/videos", {"id": "a", "part": "snippet", "key": "k1"})
+        second = request_key("https://x/videos", {"part": "snippet", "key": "k2", "id": "a"})
+        assert first == second == "https://x/videos?id=a&part=snippet"
+
+
+class TestResourceIds:
+    """Test resource_ids()."""
+
+    def test_plain_and_search_ids(self):
+        """Test string IDs and search-result ID mappings are both extracted."""
+        data = {"items": [{"id": "UC1"}, {"id": {"kind": "youtube#video", "videoId": "v1"}}, {}]}
+        assert resource_ids(data) == ["UC1", "v1"]
+        assert resource_ids([]) == []
+
+
+class TestResponseArchive:
+    """Test ResponseArchive."""
+
+    def test_round_trip(self, tmp_path):
+        """Test responses are read back with status, headers and body."""
+        path = str(tmp_path / "crawl.arc")
+        with ResponseArchive(path, mode="a") as archive:
+            archive.append("a", 200, {"Content-Type": "application/json"}, b'{"items": [1]}')
+            archive.append("b", 429, {"Retry-After": "3"}, b"{}")
+
+        with ResponseArchive(path) as archive:
+            response = archive.get("a")
+            assert len(archive) == 2
+            assert "b" in archive and "c" not in archive
+            assert archive.get("c") is None
+        assert response.status_code == 200
+        assert response.headers == {"Content-Type": "application/json"}
+        assert response.json() == {"items": [1]}
+
+    def test_latest_response_wins(self, tmp_path):
+        """Test a re-recorded request resolves to its newest frame."""
+        with ResponseArchive(str(tmp_path / "crawl.arc"), mode="a") as archive:
+            archive.append("a", 429, {}, b"{}")
+            archive.append("a", 200, {}, b"[1]")
+            assert archive.get("a").status_code == 200
+
+    def test_frames_are_compressed(self, tmp_path):
+        """Test repetitive bodies take a fraction of their size on disk."""
+        path = tmp_path / "crawl.arc"
+        body = b'{"items": [' + b", ".join([b'{"text": "hello world"}'] * 500) + b"]}"
+        with ResponseArchive(str(path), mode="a") as archive:
+            archive.append("a", 200, {}, body)
+        assert path.stat().st_size * 10 < len(body)
+
+    def test_appends_across_sessions(self, tmp_path):
+        """Test reopening in append mode keeps earlier frames readable."""
+        path = str(tmp_path / "crawl.arc")
+        with ResponseArchive(path, mode="a") as archive:
+            archive.append("a", 200, {}, b"1")
+        with ResponseArchive(path, mode="a") as archive:
+            archive.append("b", 200, {}, b"2")
+            assert archive.get("a").content == b"1"
+            assert archive.get("b").content == b"2"
+
+    def test_appends_are_visible_before_close(self, tmp_path):
+        """Test another reader finds each response as soon as it is appended."""
+        path = str(tmp_path / "crawl.arc")
+        writer = ResponseArchive(path, mode="a")
+        writer.append("a", 200, {}, b'{"items": [{"id": "v1"}]}', ["v1"])
+
+        with ResponseArchive(path) as reader:
+            assert reader.get("a").content == b'{"items": [{"id": "v1"}]}'
+            assert reader.get_resource("v1") == {"id": "v1"}
+        writer.close()
+
+    def test_missing_archive(self, tmp_path):
+        """Test opening a missing archive for reading raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="Archive not found"):
+            ResponseArchive(str(tmp_path / "missing.arc"))
+
+    def test_resource_lookup(self, tmp_path):
+        """Test a single resource is read back through the ID index."""
+        path = str(tmp_path / "crawl.arc")
+        first = {"items": [{"id": "UC1", "n": 1}, {"id": "UC2"}]}
+        second = {"items": [{"id": "UC1", "n": 2}]}
+        with ResponseArchive(path, mode="a") as archive:
+            archive.append("p1", 200, {}, json.dumps(first).encode(), ["UC1", "UC2"])
+            archive.append("p2", 200, {}, json.dumps(second).encode(), ["UC1"])
+
+        with ResponseArchive(path) as archive:
+            assert archive.get_resource("UC1") == {"id": "UC1", "n": 2}
+            assert archive.get_resource("UC2") == {"id": "UC2"}
+            assert archive.find("UC2").json() == first
+            assert archive.get_resource("UC3") is None
+
+    def test_zstd_frames(self, tmp_path):
+        """Test zstd frames round-trip and can follow gzip frames in one file."""
+        pytest.importorskip("zstandard")
+        path = str(tmp_path / "crawl.arc")
+        with ResponseArchive(path, mode="a") as archive:
+            archive.append("a", 200, {}, b"gzip")
+        with ResponseArchive(path, mode="a", codec="zstd") as archive:
+            archive.append("b", 200, {}, b"zstd")
+        with ResponseArchive(path) as archive:
+            assert archive.get("a").content == b"gzip"
+            assert archive.get("b").content == b"zstd"
+
+    def test_zstd_requires_zstandard(self, tmp_path):
+        """Test choosing zstd without zstandard raises RuntimeError."""
+        with patch.object(archive_module, "zstandard", None):
+            with pytest.raises(RuntimeError, match="zstandard is not installed"):
+                ResponseArchive(str(tmp_path / "crawl.arc"), mode="a", codec="zstd")
+
+    def test_unknown_codec(self, tmp_path):
+        """Test unknown codecs are rejected."""
+        with pytest.raises(ValueError, match="Unknown archive codec"):
+            ResponseArchive(str(tmp_path / "crawl.arc"), mode="a", codec="lz4")
+
+
+class TestClientArchive:
+    """Test YouTubeClient(archive=...)."""
+
+    def test_successful_responses_are_archived(self, tmp_path):
+        """Test raw responses are kept and indexed by resource ID."""
+        path = str(tmp_path / "crawl.arc")
+        with FakeYouTubeServer(pages=2) as server, ResponseArchive(path, mode="a") as archive:
+            client = YouTubeClient("k1", base_url=server.base_url, archive=archive)
+            profile = client.get_channel_profile("UCsomebody")
+            comments = client.get_all_comments("vid1", page_size=10)
+
+        with ResponseArchive(path) as archive:
+            assert archive.get_resource("UCsomebody")["id"] == profile["id"]
+            assert len(archive) == 3
+            page = archive.find(comments[-1]["id"]).json()
+        assert len(page["items"]) == 10
+
+    def test_close_flushes_archive(self):
+        """Test closing the client flushes its archive."""
+        archive = Mock()
+        YouTubeClient("k1", archive=archive).close()
+        archive.flush.assert_called_once_with()
@@ -0,0 +1,89 @@
+"""Tests for date-partitioned catalog enumeration."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from tdd_python_demo.youtube_api.catalog import CatalogEnumerator, format_rfc3339
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class TestFormatRfc3339:
+    """Test format_rfc3339()."""
+
+    def test_converts_to_utc(self):
+        """Test aware datetimes are rendered in UTC with a Z suffix."""
+        moment = datetime(2024, 5, 1, 12, 30, 15, 999, tzinfo=timezone(timedelta(hours=2)))
+        assert format_rfc3339(moment) == "2024-05-01T10:30:15Z"
+
+
+class TestCatalogEnumerator:
+    """Test CatalogEnumerator against the fake server."""
+
+    @pytest.fixture
+    def server(self):
+        with FakeYouTubeServer(catalog_size=1200, search_cap=100) as fake:
+            yield fake
+
+    def test_enumerates_whole_catalog(self, server):
+        """Test every video is found once, newest first, despite the result cap."""
+        client = YouTubeClient("k1", base_url=server.base_url)
+        enumerator = CatalogEnumerator(client, max_workers=4, page_size=50, result_cap=100)
+
+        videos = enumerator.enumerate_channel("UCbig", START, START + timedelta(days=60))
+
+        assert len(videos) == 1200
+        assert len({video["video_id"] for video in videos}) == 1200
+        assert videos[0]["video_id"] == "UCbig_v1199"
+        assert videos[-1]["published_at"] == "2020-01-01T00:00:00Z"
+        assert enumerator.splits > 0
+
+    def test_small_range_needs_no_split(self, server):
+        """Test windows under the cap are paged without splitting."""
+        client = YouTubeClient("k1", base_url=server.base_url)
+        enumerator = CatalogEnumerator(client, max_workers=2, page_size=50, result_cap=100)
+
+        videos = enumerator.enumerate_channel("UCbig", START, START + timedelta(hours=120))
+
+        assert len(videos) == 120
+        assert enumerator.splits == 0
+        assert enumerator.searches == server.endpoint_counts["search"] == 4
+
+    def test_search_params(self):
+        """Test windows are searched by date with a minimal field selector."""
+        client = Mock(base_url="https://api")
+        client.request.return_value = {"pageInfo": {"totalResults": 0}, "items": []}
+        enumerator = CatalogEnumerator(client, max_workers=1, initial_windows=1)
+
+        assert enumerator.enumerate_channel("UC1", START, START + timedelta(days=1)) == []
+        url, params = client.request.call_args.args
+        assert url == "https://api/search"
+        assert params["publishedAfter"] == "2020-01-01T00:00:00Z"
+        assert params["publishedBefore"] == "2020-01-02T00:00:00Z"
+        assert params["order"] == "date"
+
+    def test_min_window_stops_splitting(self):
+        """Test a window at the minimum size is paged even when over the cap."""
+        client = Mock(base_url="https://api")
+        client.request.return_value = {
+            "pageInfo": {"totalResults": 900},
+            "items": [{"id": {"videoId": "v1"}, "snippet": {"publishedAt": "2020-01-01T00:00:10Z"}}],
+        }
+        enumerator = CatalogEnumerator(client, max_workers=1, initial_windows=1, result_cap=1,
+                                       min_window=60)
+
+        videos = enumerator.enumerate_channel("UC1", START, START + timedelta(seconds=90))
+
+        assert videos == [{"video_id": "v1", "published_at": "2020-01-01T00:00:10Z"}]
+        assert enumerator.splits == 0
+
+    def test_errors_propagate(self):
+        """Test a failing search is raised to the caller."""
+        client = Mock(base_url="https://api")
+        client.request.side_effect = RuntimeError("boom")
+        enumerator = CatalogEnumerator(client, max_workers=2)
+        with pytest.raises(RuntimeError, match="boom"):
+            enumerator.enumerate_channel("UC1", START, START + timedelta(days=1))
@@ -0,0 +1,130 @@
+"""Unit tests for the yt-fetch CLI command."""
+
+import json
+import threading
+from unittest.mock import Mock, patch
+
+from tdd_python_demo.youtube_api.cli import main
+from tdd_python_demo.youtube_api.models import CommentRecord, VideoStatistics
+
+DETAILS = {"id": "dQw4w9WgXcQ", "title": "Test Video", "channel": "Test Channel", "views": 1000, "likes": 50}
+
+
+def _client():
+    client = Mock()
+    client.get_video_details.return_value = dict(DETAILS)
+    client.get_all_comments.return_value = [CommentRecord(id="c1", author="ann", text="hi", like_count=2)]
+    return client
+
+
+class TestCliMain:
+    """Test yt-fetch main()."""
+
+    @patch('tdd_python_demo.youtube_api.cli.YouTubeClient')
+    def test_json_output_with_comments(self, mock_client_class, capsys):
+        """Test details and comments are combined into one JSON document."""
+        client = _client()
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--url', 'https://youtu.be/dQw4w9WgXcQ',
+                                '--max-comments', '50']):
+            result = main()
+
+        data = json.loads(capsys.readouterr().out)
+        assert result == 0
+        assert data["title"] == "Test Video"
+        assert data["comments"][0]["author"] == "ann"
+        client.get_video_details.assert_called_once_with("dQw4w9WgXcQ")
+        client.get_all_comments.assert_called_once_with("dQw4w9WgXcQ", page_size=100, max_comments=50)
+
+    @patch('tdd_python_demo.youtube_api.cli.YouTubeClient')
+    def test_details_and_comments_are_fetched_concurrently(self, mock_client_class, capsys):
+        """Test the comment fetch does not wait for the details call."""
+        client = _client()
+        both_started = threading.Barrier(2, timeout=2)
+
+        def details(video_id):
+            both_started.wait()
+            return dict(DETAILS)
+
+        def comments(*args, **kwargs):
+            both_started.wait()
+            return []
+
+        client.get_video_details.side_effect = details
+        client.get_all_comments.side_effect = comments
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--id', 'dQw4w9WgXcQ']):
+            assert main() == 0
+
+    @patch('tdd_python_demo.youtube_api.cli.YouTubeClient')
+    def test_all_comments_streams_ndjson(self, mock_client_class, capsys):
+        """Test --all-comments prints the video then one line per comment, page by page."""
+        client = _client()
+        client.list_comments.side_effect = [
+            ([CommentRecord(id="c1", text="a")], "p2"),
+            ([CommentRecord(id="c2", text="b"), CommentRecord(id="c3", text="c")], None),
+        ]
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--id', 'dQw4w9WgXcQ', '--all-comments']):
+            result = main()
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert result == 0
+        assert lines[0]["video"]["title"] == "Test Video"
+        assert [line["comment"]["id"] for line in lines[1:]] == ["c1", "c2", "c3"]
+        client.get_all_comments.assert_not_called()
+
+    @patch('tdd_python_demo.youtube_api.cli.YouTubeClient')
+    def test_stats_only(self, mock_client_class, capsys):
+        """Test --stats-only makes a single statistics call."""
+        client = _client()
+        client.get_video_statistics.return_value = VideoStatistics("10", "2", "1")
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--id', 'dQw4w9WgXcQ', '--stats-only']):
+            result = main()
+
+        assert result == 0
+        assert json.loads(capsys.readouterr().out) == {"view_count": 10, "like_count": 2, "comment_count": 1}
+        client.get_video_details.assert_not_called()
+
+    @patch('tdd_python_demo.youtube_api.cli.YouTubeClient')
+    def test_human_format_lists_comments(self, mock_client_class, capsys):
+        """Test human output includes the video and its comments."""
+        mock_client_class.return_value = _client()
+
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--id', 'dQw4w9WgXcQ', '--format', 'human']):
+            main()
+
+        out = capsys.readouterr().out
+        assert "Test Video" in out
+        assert "[2 likes] ann: hi" in out
+
+    @patch('tdd_python_demo.youtube_api.cli.YouTubeClient')
+    def test_details_survive_failed_comment_fetch(self, mock_client_class, capsys):
+        """Test a video with comments disabled still prints its details."""
+        client = _client()
+        client.get_all_comments.side_effect = RuntimeError("forbidden (403): commentsDisabled")
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--id', 'dQw4w9WgXcQ']):
+            result = main()
+
+        captured = capsys.readouterr()
+        data = json.loads(captured.out)
+        assert result == 0
+        assert data["title"] == "Test Video"
+        assert data["comments"] == []
+        assert "commentsDisabled" in data["comments_error"]
+        assert "commentsDisabled" in captured.err
+
+    def test_invalid_url_fails(self, capsys):
+        """Test an unparseable URL exits with an error."""
+        with patch('sys.argv', ['yt-fetch', '--keys', 'k', '--url', 'https://example.com/video']):
+            result = main()
+
+        assert result == 1
+        assert "Unable to parse video ID" in capsys.readouterr().err
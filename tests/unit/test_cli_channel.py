@@ -1,5 +1,6 @@
 """Unit tests for CLI channel command."""
 
+import io
 import pytest
 import json
 from unittest.mock import patch, Mock
@@ -30,3 +31,105 @@ class TestCliChannelMain:
 
         assert result == 0  # Success exit code
         mock_client.get_channel_profile.assert_called_once_with("UC123", include_recent_videos=False, max_videos=5)
+
+
+def _multi_client():
+    """Mock client resolving handles to UC IDs and serving profiles for known IDs."""
+    client = Mock()
+
+    def resolve(item):
+        if item.startswith("UC"):
+            return item
+        if item == "@missing":
+            raise RuntimeError("Channel not found for handle: @missing")
+        return "UC" + item.lstrip("@")
+
+    client.resolve_channel_id.side_effect = resolve
+    client.get_channel_profiles.side_effect = lambda ids: {
+        cid: {"id": cid, "title": f"Title {cid}"} for cid in ids if cid != "UCgone"
+    }
+    return client
+
+
+class TestCliChannelMultipleInputs:
+    """Test yt-channel with many channels."""
+
+    @patch('tdd_python_demo.youtube_api.cli_channel.YouTubeClient')
+    def test_repeated_flags_stream_ndjson_with_per_line_errors(self, mock_client_class, capsys):
+        """Test each input gets one NDJSON line and failures do not abort the rest."""
+        mock_client_class.return_value = _multi_client()
+
+        with patch('sys.argv', ['yt-channel', '--keys', 'k', '--id', 'UC1', '--handle', '@two',
+                                '--handle', '@missing', '--id', 'UCgone']):
+            result = main()
+
+        lines = {line["input"]: line for line in map(json.loads, capsys.readouterr().out.splitlines())}
+        assert result == 1
+        assert lines["UC1"]["channel"]["id"] == "UC1"
+        assert lines["@two"]["channel"]["id"] == "UCtwo"
+        assert "not found" in lines["@missing"]["error"]
+        assert lines["UCgone"]["error"] == "Channel not found: UCgone"
+
+    @patch('tdd_python_demo.youtube_api.cli_channel.YouTubeClient')
+    def test_inputs_from_file_are_batched(self, mock_client_class, tmp_path, capsys):
+        """Test a file of channels is fetched in 50-ID channels calls."""
+        client = _multi_client()
+        mock_client_class.return_value = client
+        path = tmp_path / "channels.txt"
+        path.write_text("# channels\n" + "\n".join(f"UC{i}" for i in range(75)) + "\n\n")
+
+        with patch('sys.argv', ['yt-channel', '--keys', 'k', '--input', str(path), '--concurrency', '4']):
+            result = main()
+
+        assert result == 0
+        assert len(capsys.readouterr().out.splitlines()) == 75
+        assert sorted(len(call.args[0]) for call in client.get_channel_profiles.call_args_list) == [25, 50]
+
+    @patch('tdd_python_demo.youtube_api.cli_channel.YouTubeClient')
+    def test_inputs_from_stdin(self, mock_client_class, capsys):
+        """Test --input - reads channels from stdin."""
+        mock_client_class.return_value = _multi_client()
+
+        with patch('sys.argv', ['yt-channel', '--keys', 'k', '--input', '-']), \
+                patch('sys.stdin', io.StringIO("UC1\n@two\n")):
+            result = main()
+
+        assert result == 0
+        assert sorted(json.loads(line)["input"] for line in capsys.readouterr().out.splitlines()) == ["@two", "UC1"]
+
+    @patch('tdd_python_demo.youtube_api.cli_channel.YouTubeClient')
+    def test_include_videos_uses_bulk_uploads(self, mock_client_class, capsys):
+        """Test recent videos come from one get_recent_videos_bulk call per batch."""
+        client = _multi_client()
+        client.get_recent_videos_bulk.return_value = {"UC1": [{"id": "v1"}], "UC2": []}
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-channel', '--keys', 'k', '--id', 'UC1', '--id', 'UC2',
+                                '--include-videos', '--max-videos', '3']):
+            main()
+
+        lines = {line["input"]: line for line in map(json.loads, capsys.readouterr().out.splitlines())}
+        assert lines["UC1"]["channel"]["recent_videos"] == [{"id": "v1"}]
+        assert client.get_recent_videos_bulk.call_args.kwargs["max_videos"] == 3
+        client.get_channel_profile.assert_not_called()
+
+    @patch('tdd_python_demo.youtube_api.cli_channel.YouTubeClient')
+    def test_include_videos_reports_failed_channel_only(self, mock_client_class, capsys):
+        """Test a channel whose uploads fail is an error line while the rest succeed."""
+        client = _multi_client()
+
+        def bulk(channel_ids, max_videos, max_workers, errors):
+            errors["UC2"] = RuntimeError("forbidden")
+            return {"UC1": [{"id": "v1"}]}
+
+        client.get_recent_videos_bulk.side_effect = bulk
+        mock_client_class.return_value = client
+
+        with patch('sys.argv', ['yt-channel', '--keys', 'k', '--id', 'UC1', '--id', 'UC2',
+                                '--include-videos']):
+            result = main()
+
+        lines = {line["input"]: line for line in map(json.loads, capsys.readouterr().out.splitlines())}
+        assert result == 1
+        assert lines["UC1"]["channel"]["recent_videos"] == [{"id": "v1"}]
+        assert lines["UC2"]["error"] == "forbidden"
@@ -2,8 +2,14 @@
 
 import pytest
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
-from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.client import ApiError, YouTubeClient, VIDEO_STATISTICS_FIELDS
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+from tdd_python_demo.youtube_api.key_pool import KeyPool
+from tdd_python_demo.youtube_api.models import ChannelRecord
+from tdd_python_demo.youtube_api.quota import QuotaLedger
+from tdd_python_demo.youtube_api.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 
 class TestYouTubeClientInitialization:
@@ -45,11 +51,12 @@ class TestUtilityMethods:
 class TestRequestMethod:
     """Test request() method with retry and backoff."""
 
-    @patch('tdd_python_demo.youtube_api.client.requests.get')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
     def test_request_success(self, mock_get):
         """Test successful API request."""
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.content = b'{"items": []}'
         mock_response.json.return_value = {"items": []}
         mock_get.return_value = mock_response
 
@@ -60,17 +67,17 @@ class TestRequestMethod:
         mock_get.assert_called_once_with(
             "https://api.example.com/test",
             params={"param": "value", "key": "test_key"},
-            timeout=20
+            timeout=(5.0, 20.0)
         )
 
     @patch('tdd_python_demo.youtube_api.client.time.sleep')
-    @patch('tdd_python_demo.youtube_api.client.requests.get')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
     def test_request_retry_on_network_error(self, mock_get, mock_sleep):
         """Test request retries on network errors with exponential backoff."""
         mock_get.side_effect = [
             requests.exceptions.RequestException("Network error"),
             requests.exceptions.RequestException("Network error"),
-            Mock(status_code=200, json=lambda: {"success": True})
+            Mock(status_code=200, content=b'{"success": true}', json=lambda: {"success": True})
         ]
 
         client = YouTubeClient(api_keys="test_key")
@@ -81,15 +88,16 @@ class TestRequestMethod:
         assert mock_sleep.call_count == 2
 
     @patch('tdd_python_demo.youtube_api.client.time.sleep')
-    @patch('tdd_python_demo.youtube_api.client.requests.get')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
     def test_request_rotates_key_on_quota_error(self, mock_get, mock_sleep):
         """Test request rotates to next API key on 403 quota error."""
         mock_response_403 = Mock()
         mock_response_403.status_code = 403
-        mock_response_403.json.return_value = {"error": {"code": 403}}
+        mock_response_403.json.return_value = {"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}}
 
         mock_response_success = Mock()
         mock_response_success.status_code = 200
+        mock_response_success.content = b'{"success": true}'
         mock_response_success.json.return_value = {"success": True}
 
         mock_get.side_effect = [mock_response_403, mock_response_success]
@@ -102,7 +110,7 @@ class TestRequestMethod:
         assert mock_get.call_count == 2
 
     @patch('tdd_python_demo.youtube_api.client.time.sleep')
-    @patch('tdd_python_demo.youtube_api.client.requests.get')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
     def test_request_rotates_key_on_429_rate_limit(self, mock_get, mock_sleep):
         """Test request rotates to next API key on 429 rate limit error."""
         mock_response_429 = Mock()
@@ -111,6 +119,7 @@ class TestRequestMethod:
 
         mock_response_success = Mock()
         mock_response_success.status_code = 200
+        mock_response_success.content = b'{"success": true}'
         mock_response_success.json.return_value = {"success": True}
 
         mock_get.side_effect = [mock_response_429, mock_response_success]
@@ -123,7 +132,7 @@ class TestRequestMethod:
         assert mock_get.call_count == 2
 
     @patch('tdd_python_demo.youtube_api.client.time.sleep')
-    @patch('tdd_python_demo.youtube_api.client.requests.get')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
     def test_request_raises_error_when_all_keys_exhausted(self, mock_get, mock_sleep):
         """Test request raises error when all API keys return 403/429."""
         mock_response_403 = Mock()
@@ -142,7 +151,7 @@ class TestRequestMethod:
         assert mock_get.call_count == 3
 
     @patch('tdd_python_demo.youtube_api.client.time.sleep')
-    @patch('tdd_python_demo.youtube_api.client.requests.get')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
     def test_request_raises_error_on_single_key_quota_exceeded(self, mock_get, mock_sleep):
         """Test request raises error immediately when single API key hits quota."""
         mock_response_403 = Mock()
@@ -160,6 +169,305 @@ class TestRequestMethod:
         assert mock_get.call_count == 1  # Should only try once with single key
 
 
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_recovers_after_transient_rate_limits(self, mock_get, mock_sleep):
+        """Test keys cooled down by a 429 are used again once their cooldown ends."""
+        clock = Mock(return_value=1705348800.0)
+        mock_response_429 = Mock(status_code=429)
+        mock_response_429.json.return_value = {"error": {"code": 429}}
+        mock_response_success = Mock(status_code=200, content=b'{"success": true}')
+        mock_response_success.json.return_value = {"success": True}
+        mock_get.side_effect = [mock_response_429, mock_response_429, mock_response_success]
+
+        pool = KeyPool(["key1", "key2"], cooldown=60, clock=clock)
+        client = YouTubeClient(api_keys="key1,key2", key_pool=pool)
+
+        with pytest.raises(Exception, match="exhausted"):
+            client.request("https://api.example.com/test", {})
+
+        clock.return_value += 60
+        assert client.request("https://api.example.com/test", {}) == {"success": True}
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_parks_key_on_quota_exceeded(self, mock_get):
+        """Test a quotaExceeded 403 takes the key out until the daily reset."""
+        mock_response_403 = Mock(status_code=403)
+        mock_response_403.json.return_value = {
+            "error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}
+        }
+        mock_get.side_effect = [mock_response_403, Mock(status_code=200, content=b'{}', json=lambda: {})]
+
+        client = YouTubeClient(api_keys="key1,key2")
+        client.request("https://api.example.com/test", {})
+
+        assert client.key_pool.health()["key1"]["exhausted"] is True
+        assert client.key_pool.health()["key2"]["successes"] == 1
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_cools_key_on_403_rate_limit_reason(self, mock_get):
+        """Test a 403 userRateLimitExceeded rotates and cools the key down."""
+        mock_response_403 = Mock(status_code=403, headers={})
+        mock_response_403.json.return_value = {
+            "error": {"code": 403, "errors": [{"reason": "userRateLimitExceeded"}]}
+        }
+        mock_get.side_effect = [mock_response_403, Mock(status_code=200, content=b'{}', json=lambda: {})]
+
+        client = YouTubeClient(api_keys="key1,key2")
+        client.request("https://api.example.com/test", {})
+
+        assert client.key_pool.health()["key1"]["cooldown_remaining"] > 0
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_raises_on_resource_403(self, mock_get):
+        """Test a per-resource 403 raises with its reason and leaves every key healthy."""
+        mock_response_403 = Mock(status_code=403)
+        mock_response_403.json.return_value = {
+            "error": {"code": 403, "errors": [{"reason": "commentsDisabled"}]}
+        }
+        mock_get.return_value = mock_response_403
+
+        client = YouTubeClient(api_keys="key1,key2,key3")
+        with pytest.raises(RuntimeError, match="commentsDisabled"):
+            client.request("https://api.example.com/commentThreads", {})
+
+        assert mock_get.call_count == 1
+        assert all(health["available"] for health in client.key_pool.health().values())
+
+
+class TestRequestQuotaAwareness:
+    """Test request() with a quota ledger and rate limiter."""
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_uses_key_with_most_budget_and_charges_it(self, mock_get):
+        """Test request sends to the richest key and records the endpoint cost."""
+        mock_get.return_value = Mock(status_code=200, content=b'{"items": []}', json=lambda: {"items": []})
+        ledger = QuotaLedger(["key1", "key2"], daily_quota=1000)
+        ledger.charge("key1", 500)
+
+        client = YouTubeClient(api_keys="key1,key2", quota_ledger=ledger)
+        client.request("https://www.googleapis.com/youtube/v3/search", {})
+
+        assert mock_get.call_args[1]["params"]["key"] == "key2"
+        assert ledger.used("key2") == 100
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_raises_without_calling_api_when_budget_is_spent(self, mock_get):
+        """Test request fails fast when no key can afford the call."""
+        ledger = QuotaLedger(["key1"], daily_quota=50)
+
+        client = YouTubeClient(api_keys="key1", quota_ledger=ledger)
+
+        with pytest.raises(Exception, match="exhausted"):
+            client.request("https://www.googleapis.com/youtube/v3/search", {})
+        mock_get.assert_not_called()
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_paces_through_rate_limiter(self, mock_get):
+        """Test request takes a token from the rate limiter before each call."""
+        mock_get.return_value = Mock(status_code=200, content=b'{}', json=lambda: {})
+        limiter = Mock()
+
+        client = YouTubeClient(api_keys="key1", rate_limiter=limiter)
+        client.request("https://api.example.com/test", {})
+
+        limiter.acquire.assert_called_once_with()
+
+
+class TestClientConcurrency:
+    """Test sharing one YouTubeClient between worker threads."""
+
+    def test_shared_client_spends_exactly_the_ledger_budget(self):
+        """Test concurrent requests never spend more quota than the ledger allows."""
+        ledger = QuotaLedger(["key1", "key2"], daily_quota=10)
+        with FakeYouTubeServer(latency=0.01) as server:
+            client = YouTubeClient("key1,key2", quota_ledger=ledger, base_url=server.base_url,
+                                   retry_policy=RetryPolicy(max_key_wait=0), pool_size=8)
+
+            def fetch(i):
+                try:
+                    return client.get_video_statistics(f"vid{i}")
+                except Exception:
+                    return None
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(fetch, range(40)))
+
+            assert sum(result is not None for result in results) == 20
+            assert server.endpoint_counts["videos"] == 20
+        assert ledger.used("key1") == ledger.used("key2") == 10
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_network_error_refunds_reserved_quota(self, mock_get):
+        """Test quota reserved for a request that never reached the API is given back."""
+        mock_get.side_effect = requests.exceptions.ConnectionError()
+        ledger = QuotaLedger(["key1"], daily_quota=100)
+
+        client = YouTubeClient("key1", quota_ledger=ledger, retry_policy=RetryPolicy(base=0, cap=0))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.request("https://www.googleapis.com/youtube/v3/videos", {}, max_retries=2)
+
+        assert ledger.used("key1") == 0
+
+    def test_connection_pool_is_sized_for_workers(self):
+        """Test the shared session's adapters keep pool_size connections per host."""
+        client = YouTubeClient("key1", pool_size=32)
+
+        adapter = client.session.get_adapter("https://www.googleapis.com")
+        assert adapter._pool_maxsize == 32
+        client.close()
+
+
+class TestRequestRetryPolicy:
+    """Test request() server-error retries, Retry-After, budget and breaker."""
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_retries_5xx_then_succeeds(self, mock_get, mock_sleep):
+        """Test a 503 is retried with backoff instead of returned."""
+        mock_get.side_effect = [
+            Mock(status_code=503, headers={}),
+            Mock(status_code=200, content=b'{"success": true}', json=lambda: {"success": True})
+        ]
+
+        client = YouTubeClient(api_keys="test_key")
+        result = client.request("https://api.example.com/test", {})
+
+        assert result == {"success": True}
+        assert mock_sleep.call_count == 1
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_raises_runtime_error_when_5xx_persists(self, mock_get, mock_sleep):
+        """Test persistent 5xx responses raise RuntimeError after max_retries."""
+        mock_get.return_value = Mock(status_code=500, headers={})
+
+        client = YouTubeClient(api_keys="test_key")
+
+        with pytest.raises(RuntimeError, match="failed after 3 attempts"):
+            client.request("https://api.example.com/test", {}, max_retries=3)
+        assert mock_get.call_count == 3
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_honours_retry_after_on_5xx(self, mock_get, mock_sleep):
+        """Test the Retry-After header sets the backoff delay."""
+        mock_get.side_effect = [
+            Mock(status_code=503, headers={"Retry-After": "7"}),
+            Mock(status_code=200, content=b'{}', json=lambda: {})
+        ]
+
+        client = YouTubeClient(api_keys="test_key")
+        client.request("https://api.example.com/test", {})
+
+        mock_sleep.assert_called_once_with(7)
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_waits_for_key_after_short_retry_after(self, mock_get, mock_sleep):
+        """Test a single key rate-limited with a short Retry-After is retried."""
+        clock = Mock(return_value=1705348800.0)
+        mock_sleep.side_effect = lambda seconds: setattr(clock, "return_value", clock.return_value + seconds)
+        mock_get.side_effect = [
+            Mock(status_code=429, headers={"Retry-After": "2"}, json=lambda: {}),
+            Mock(status_code=200, content=b'{"success": true}', json=lambda: {"success": True})
+        ]
+
+        pool = KeyPool(["key1"], cooldown=1, clock=clock)
+        client = YouTubeClient(api_keys="key1", key_pool=pool)
+
+        assert client.request("https://api.example.com/test", {}) == {"success": True}
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_single_key_waits_out_default_rate_limit_cooldown(self, mock_get, mock_sleep):
+        """Test a lone key hit by a 429 without Retry-After is retried, not reported exhausted."""
+        clock = Mock(return_value=1705348800.0)
+        mock_sleep.side_effect = lambda seconds: setattr(clock, "return_value", clock.return_value + seconds)
+        mock_get.side_effect = [
+            Mock(status_code=429, headers={}, json=lambda: {}),
+            Mock(status_code=200, content=b'{"success": true}', json=lambda: {"success": True})
+        ]
+
+        client = YouTubeClient(api_keys="key1", key_pool=KeyPool(["key1"], clock=clock))
+
+        assert client.request("https://api.example.com/test", {}) == {"success": True}
+        assert sum(call.args[0] for call in mock_sleep.call_args_list) <= client.retry_policy.max_key_wait
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_stops_when_retry_budget_is_spent(self, mock_get, mock_sleep):
+        """Test retries stop once the shared retry budget is exhausted."""
+        mock_get.return_value = Mock(status_code=503, headers={})
+        budget = Mock()
+        budget.try_withdraw.return_value = False
+
+        client = YouTubeClient(api_keys="test_key", retry_budget=budget)
+
+        with pytest.raises(RuntimeError, match="Retry budget exhausted"):
+            client.request("https://api.example.com/test", {})
+        assert mock_get.call_count == 1
+        budget.deposit.assert_called_once_with()
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_is_shed_while_circuit_is_open(self, mock_get, mock_sleep):
+        """Test an open circuit breaker fails requests without calling the API."""
+        mock_get.return_value = Mock(status_code=500, headers={})
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        client = YouTubeClient(api_keys="test_key", circuit_breaker=breaker)
+
+        with pytest.raises(CircuitOpenError):
+            client.request("https://api.example.com/test", {})
+        assert mock_get.call_count == 2
+        with pytest.raises(CircuitOpenError):
+            client.request("https://api.example.com/test", {})
+        assert mock_get.call_count == 2
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_half_open_trial_without_verdict_frees_the_slot(self, mock_get, mock_sleep):
+        """Test a trial ending in key exhaustion or a 429 does not leave the circuit stuck."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 1.0
+        client = YouTubeClient(api_keys="test_key", circuit_breaker=breaker)
+        client.key_pool.report_quota_exceeded("test_key")
+
+        with pytest.raises(Exception, match="All API keys exhausted"):
+            client.request("https://api.example.com/test", {})
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        client = YouTubeClient(api_keys="test_key", circuit_breaker=breaker)
+        limited = Mock(status_code=429, headers={"Retry-After": "0"})
+        ok = Mock(status_code=200, headers={}, content=b'{"items": []}')
+        ok.json.return_value = {"items": []}
+        mock_get.side_effect = [limited, ok]
+
+        assert client.request("https://api.example.com/test", {}) == {"items": []}
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_request_raises_on_client_error(self, mock_get):
+        """Test a 4xx response is raised, not returned or counted as a success."""
+        response = Mock(status_code=404, headers={})
+        response.json.return_value = {"error": {"errors": [{"reason": "videoNotFound"}]}}
+        mock_get.return_value = response
+        breaker = CircuitBreaker(failure_threshold=1)
+        archive = Mock()
+
+        client = YouTubeClient(api_keys="test_key", circuit_breaker=breaker, archive=archive)
+
+        with pytest.raises(RuntimeError, match="404.*videoNotFound"):
+            client.request("https://api.example.com/test", {})
+        assert mock_get.call_count == 1
+        assert client.key_pool.health()["test_key"]["successes"] == 0
+        archive.append.assert_not_called()
+
+
 class TestGetVideoStatistics:
     """Test get_video_statistics() method."""
 
@@ -189,6 +497,19 @@ class TestGetVideoStatistics:
             {"part": "statistics", "id": "test_video_id"}
         )
 
+    @patch.object(YouTubeClient, 'request')
+    def test_get_video_statistics_with_fields(self, mock_request):
+        """Test get_video_statistics forwards the fields selector."""
+        mock_request.return_value = {"items": [{"statistics": {"viewCount": "1"}}]}
+
+        client = YouTubeClient(api_keys="test_key")
+        client.get_video_statistics("vid", fields=VIDEO_STATISTICS_FIELDS)
+
+        mock_request.assert_called_once_with(
+            "https://www.googleapis.com/youtube/v3/videos",
+            {"part": "statistics", "id": "vid", "fields": VIDEO_STATISTICS_FIELDS}
+        )
+
     @patch.object(YouTubeClient, 'request')
     def test_get_video_statistics_with_missing_fields(self, mock_request):
         """Test get_video_statistics handles missing statistics fields gracefully."""
@@ -223,6 +544,45 @@ class TestGetVideoStatistics:
             client.get_video_statistics("invalid_video_id")
 
 
+class TestGetVideoDetails:
+    """Test get_video_details() method."""
+
+    @patch.object(YouTubeClient, 'request')
+    def test_get_video_details_uses_one_combined_call(self, mock_request):
+        """Test every part is fetched in a single videos request and flattened."""
+        mock_request.return_value = {"items": [{
+            "id": "video123",
+            "snippet": {"title": "T", "channelTitle": "C", "channelId": "UC1", "tags": ["a"]},
+            "contentDetails": {"duration": "PT1M"},
+            "status": {"privacyStatus": "public"},
+            "topicDetails": {"topicCategories": ["music"]},
+            "statistics": {"viewCount": "10", "likeCount": "2", "commentCount": "1"},
+        }]}
+
+        client = YouTubeClient(api_keys="test_key")
+        details = client.get_video_details("video123")
+
+        mock_request.assert_called_once_with(
+            "https://www.googleapis.com/youtube/v3/videos",
+            {"part": "snippet,contentDetails,status,topicDetails,statistics", "id": "video123"}
+        )
+        assert details["title"] == "T"
+        assert details["channel"] == "C"
+        assert details["duration"] == "PT1M"
+        assert details["privacy_status"] == "public"
+        assert details["topic_categories"] == ["music"]
+        assert (details["views"], details["likes"], details["comment_count"]) == (10, 2, 1)
+
+    @patch.object(YouTubeClient, 'request')
+    def test_get_video_details_missing_video(self, mock_request):
+        """Test a missing video raises RuntimeError."""
+        mock_request.return_value = {"items": []}
+
+        client = YouTubeClient(api_keys="test_key")
+        with pytest.raises(RuntimeError, match="Video not found: nope"):
+            client.get_video_details("nope")
+
+
 class TestListComments:
     """Test list_comments() method."""
 
@@ -276,6 +636,30 @@ class TestListComments:
             }
         )
 
+    @patch.object(YouTubeClient, 'request')
+    def test_list_comments_caps_page_at_max_comments(self, mock_request):
+        """Test list_comments never requests or returns more than max_comments."""
+        mock_request.return_value = {
+            "items": [{"id": f"comment{i}"} for i in range(5)],
+            "nextPageToken": "next"
+        }
+
+        client = YouTubeClient(api_keys="test_key")
+        comments, _ = client.list_comments("video123", max_comments=3)
+
+        assert [c["id"] for c in comments] == ["comment0", "comment1", "comment2"]
+        assert mock_request.call_args[0][1]["maxResults"] == 3
+
+    @patch.object(YouTubeClient, 'request')
+    def test_list_comments_with_fields(self, mock_request):
+        """Test list_comments passes the partial-response fields selector."""
+        mock_request.return_value = {"items": []}
+
+        client = YouTubeClient(api_keys="test_key")
+        client.list_comments("video123", fields="items(id)")
+
+        assert mock_request.call_args[0][1]["fields"] == "items(id)"
+
 
 class TestGetAllComments:
     """Test get_all_comments() method."""
@@ -325,6 +709,63 @@ class TestGetAllComments:
         mock_list_comments.assert_called_once_with("video123", page_size=100, page_token=None)
 
 
+    @patch.object(YouTubeClient, 'list_comments')
+    def test_get_all_comments_stops_exactly_at_max_comments(self, mock_list_comments):
+        """Test get_all_comments requests only the remaining comments and stops at the cap."""
+        mock_list_comments.side_effect = [
+            ([{"id": f"c{i}"} for i in range(100)], "token_page2"),
+            ([{"id": f"d{i}"} for i in range(50)], "token_page3"),
+        ]
+
+        client = YouTubeClient(api_keys="test_key")
+        all_comments = client.get_all_comments("video123", max_comments=150)
+
+        assert len(all_comments) == 150
+        assert mock_list_comments.call_count == 2
+        mock_list_comments.assert_called_with(
+            "video123", page_size=50, page_token="token_page2", max_comments=50
+        )
+
+    @patch.object(YouTubeClient, 'request')
+    def test_zero_max_comments_sends_no_request(self, mock_request):
+        """Test a cap of zero returns nothing without spending a quota unit."""
+        client = YouTubeClient(api_keys="test_key")
+
+        assert client.get_all_comments("video123", max_comments=0) == []
+        assert client.list_comments("video123", max_comments=0) == ([], None)
+        mock_request.assert_not_called()
+
+
+
+class TestListCommentReplies:
+    """Test list_comment_replies() and get_all_comment_replies() methods."""
+
+    @patch.object(YouTubeClient, 'request')
+    def test_list_comment_replies_uses_comments_endpoint(self, mock_request):
+        """Test replies are fetched by parentId from the comments endpoint."""
+        mock_request.return_value = {"items": [{"id": "r1"}], "nextPageToken": "next"}
+
+        client = YouTubeClient(api_keys="test_key")
+        replies, token = client.list_comment_replies("thread1", page_size=20)
+
+        assert replies == [{"id": "r1"}]
+        assert token == "next"
+        url, params = mock_request.call_args[0]
+        assert url.endswith("/comments")
+        assert params["parentId"] == "thread1"
+        assert params["maxResults"] == 20
+
+    @patch.object(YouTubeClient, 'list_comment_replies')
+    def test_get_all_comment_replies_follows_pages(self, mock_list_replies):
+        """Test get_all_comment_replies keeps paging until no token is returned."""
+        mock_list_replies.side_effect = [([{"id": "r1"}], "p2"), ([{"id": "r2"}], None)]
+
+        client = YouTubeClient(api_keys="test_key")
+        replies = client.get_all_comment_replies("thread1")
+
+        assert [reply["id"] for reply in replies] == ["r1", "r2"]
+        mock_list_replies.assert_called_with("thread1", page_size=100, page_token="p2", fields=None)
+
 
 class TestResolveChannelId:
     """Test resolve_channel_id() method."""
@@ -351,6 +792,65 @@ class TestResolveChannelId:
         assert result == "UCyyyy"
         mock_request.assert_called_once()
 
+    @patch.object(YouTubeClient, "request")
+    def test_resolve_channel_id_from_urls(self, mock_request):
+        """Test channel and handle URLs are resolved."""
+        mock_request.return_value = {"items": [{"id": "UCyyyy"}]}
+
+        client = YouTubeClient(api_keys="test_key")
+
+        assert client.resolve_channel_id("https://www.youtube.com/channel/UCzzzz") == "UCzzzz"
+        assert client.resolve_channel_id("https://www.youtube.com/@username/videos") == "UCyyyy"
+        assert mock_request.call_args[0][1] == {"part": "id", "forHandle": "username"}
+
+    @patch.object(YouTubeClient, "request")
+    def test_resolve_channel_id_caches_handles(self, mock_request):
+        """Test a handle is looked up once, whatever form or case it comes in."""
+        mock_request.return_value = {"items": [{"id": "UCyyyy"}]}
+
+        client = YouTubeClient(api_keys="test_key")
+        client.resolve_channel_id("@UserName")
+        client.resolve_channel_id("https://youtube.com/@username")
+
+        mock_request.assert_called_once()
+
+    @patch.object(YouTubeClient, "request")
+    def test_resolve_channel_id_caches_unknown_handles(self, mock_request):
+        """Test unknown handles raise without a second API call."""
+        mock_request.return_value = {"items": []}
+
+        client = YouTubeClient(api_keys="test_key")
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="Channel not found for handle: @nobody"):
+                client.resolve_channel_id("@nobody")
+
+        mock_request.assert_called_once()
+
+    @patch.object(YouTubeClient, "request")
+    def test_resolve_custom_url_falls_back_to_username(self, mock_request):
+        """Test /c/ names are tried as a handle, then as a legacy username."""
+        mock_request.side_effect = [{"items": []}, {"items": [{"id": "UCcustom"}]}]
+
+        client = YouTubeClient(api_keys="test_key")
+
+        assert client.resolve_channel_id("https://www.youtube.com/c/Custom") == "UCcustom"
+        assert [c[0][1] for c in mock_request.call_args_list] == [
+            {"part": "id", "forHandle": "Custom"}, {"part": "id", "forUsername": "Custom"}]
+
+    @patch.object(YouTubeClient, "request")
+    def test_resolve_channel_ids_deduplicates_lookups(self, mock_request):
+        """Test bulk resolution looks each distinct handle up once."""
+        mock_request.side_effect = lambda url, params: (
+            {"items": [{"id": "UC" + params["forHandle"].lower()}]} if params["forHandle"] != "nobody" else {"items": []}
+        )
+
+        client = YouTubeClient(api_keys="test_key")
+        result = client.resolve_channel_ids(["@a", "@A", "UCx", "@nobody", "garbage", "youtube.com/@b"])
+
+        assert result == {"@a": "UCa", "@A": "UCa", "UCx": "UCx", "@nobody": None,
+                          "garbage": None, "youtube.com/@b": "UCb"}
+        assert mock_request.call_count == 3
+
 
 class TestGetChannelProfile:
     """Test get_channel_profile() method."""
@@ -471,6 +971,21 @@ class TestGetChannelProfile:
         mock_get_videos.assert_called_once_with("UC789", max_videos=2)
 
 
+    @patch.object(YouTubeClient, "request")
+    def test_get_channel_profile_returns_record_in_records_mode(self, mock_request):
+        """Test records=True returns a slotted ChannelRecord equal to the dict result."""
+        mock_request.return_value = {
+            "items": [{"snippet": {"title": "Chan"}, "statistics": {"viewCount": "7"}}]
+        }
+
+        client = YouTubeClient(api_keys="test_key", records=True)
+        result = client.get_channel_profile("UC1")
+
+        assert isinstance(result, ChannelRecord)
+        assert result.view_count == 7
+        assert result == YouTubeClient(api_keys="test_key").get_channel_profile("UC1")
+
+
 class TestGetRecentVideos:
     """Test _get_recent_videos() helper method."""
 
@@ -526,3 +1041,83 @@ class TestGetRecentVideos:
         # Should only call search API once, not videos API
         assert mock_request.call_count == 1
 
+
+
+class TestGetRecentVideosBulk:
+    """Test get_recent_videos_bulk() method."""
+
+    @staticmethod
+    def fake_api(url, params):
+        """Answer channels/playlistItems/videos calls for two channels."""
+        endpoint = url.rsplit("/", 1)[-1]
+        if endpoint == "channels":
+            return {"items": [
+                {"id": cid, "contentDetails": {"relatedPlaylists": {"uploads": "UU" + cid[2:]}}}
+                for cid in params["id"].split(",") if cid != "UC_EMPTY"
+            ]}
+        if endpoint == "playlistItems":
+            count = params["maxResults"]
+            return {"items": [
+                {"contentDetails": {"videoId": f"{params['playlistId']}_v{i}"}} for i in range(count)
+            ]}
+        if endpoint == "videos":
+            return {"items": [
+                {"id": vid, "snippet": {"title": vid}, "statistics": {"viewCount": "10"}}
+                for vid in params["id"].split(",")
+            ]}
+        raise AssertionError(f"unexpected endpoint {endpoint}")
+
+    @patch.object(YouTubeClient, "request")
+    def test_bulk_uses_uploads_playlists_and_batched_videos_calls(self, mock_request):
+        """Test bulk mode avoids search and combines video lookups."""
+        mock_request.side_effect = self.fake_api
+
+        client = YouTubeClient(api_keys="test_key")
+        result = client.get_recent_videos_bulk(["UCaaa", "UCbbb", "UC_EMPTY"], max_videos=3)
+
+        assert [v["id"] for v in result["UCaaa"]] == ["UUaaa_v0", "UUaaa_v1", "UUaaa_v2"]
+        assert result["UCbbb"][0]["view_count"] == 10
+        assert result["UC_EMPTY"] == []
+
+        endpoints = [call[0][0].rsplit("/", 1)[-1] for call in mock_request.call_args_list]
+        assert "search" not in endpoints
+        assert endpoints.count("channels") == 1
+        assert endpoints.count("playlistItems") == 2
+        assert endpoints.count("videos") == 1
+
+    @patch.object(YouTubeClient, "request")
+    def test_bulk_isolates_failing_channels(self, mock_request):
+        """Test a missing uploads playlist maps to [] and other errors are reported per channel."""
+        def api(url, params):
+            playlist = params.get("playlistId")
+            if playlist == "UUempty":
+                raise ApiError("failed (404): playlistNotFound", 404, "playlistNotFound")
+            if playlist == "UUbroken":
+                raise ApiError("forbidden (403): forbidden", 403, "forbidden")
+            return self.fake_api(url, params)
+        mock_request.side_effect = api
+        errors = {}
+
+        client = YouTubeClient(api_keys="test_key")
+        result = client.get_recent_videos_bulk(["UCa", "UCempty", "UCbroken", "UCb"], max_videos=1,
+                                               errors=errors)
+
+        assert {cid: [v["id"] for v in videos] for cid, videos in result.items()} == {
+            "UCa": ["UUa_v0"], "UCempty": [], "UCb": ["UUb_v0"]}
+        assert list(errors) == ["UCbroken"]
+        assert errors["UCbroken"].status == 403
+
+    @patch.object(YouTubeClient, "request")
+    def test_bulk_chunks_ids_by_fifty(self, mock_request):
+        """Test channel and video IDs are sent in groups of at most 50."""
+        mock_request.side_effect = self.fake_api
+        channel_ids = [f"UC{i:03d}" for i in range(60)]
+
+        client = YouTubeClient(api_keys="test_key")
+        result = client.get_recent_videos_bulk(channel_ids, max_videos=2)
+
+        assert len(result) == 60
+        id_lists = [call[0][1]["id"].split(",") for call in mock_request.call_args_list
+                    if call[0][0].endswith(("/channels", "/videos"))]
+        assert max(len(ids) for ids in id_lists) == 50
+        assert sum(1 for call in mock_request.call_args_list if call[0][0].endswith("/videos")) == 3
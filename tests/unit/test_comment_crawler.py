@@ -0,0 +1,122 @@
+"""Tests for the threaded comment crawler."""
+
+import threading
+import time
+
+import pytest
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.comment_crawler import CommentCrawler
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+
+
+class TestCommentCrawler:
+    """Test CommentCrawler against a mocked client."""
+
+    def test_ordered_crawl_preserves_api_order(self, comment_thread, comment_client):
+        """Test threads come out in API order even when early replies are slow."""
+        pages = [[comment_thread("t0", 1), comment_thread("t1", 0)], [comment_thread("t2", 1)]]
+        client = comment_client(pages, reply_delay=lambda tid: 0.05 if tid == "t0" else 0)
+
+        items = list(CommentCrawler(client, ordered=True).crawl("vid1"))
+
+        assert [item["thread"]["id"] for item in items] == ["t0", "t1", "t2"]
+        assert items[0]["replies"] == [{"id": "t0.r"}]
+        assert items[1]["replies"] == []
+        assert all(item["video_id"] == "vid1" for item in items)
+
+    def test_unordered_crawl_yields_fast_threads_first(self, comment_thread, comment_client):
+        """Test unordered mode yields threads as soon as their replies arrive."""
+        pages = [[comment_thread("t0", 1), comment_thread("t1", 1)]]
+        client = comment_client(pages, reply_delay=lambda tid: 0.2 if tid == "t0" else 0)
+
+        items = list(CommentCrawler(client, ordered=False).crawl("vid1"))
+
+        assert [item["thread"]["id"] for item in items] == ["t1", "t0"]
+
+    def test_skips_reply_calls_without_replies(self, comment_thread, comment_client):
+        """Test include_replies=False and zero-reply threads make no comments calls."""
+        pages = [[comment_thread("t0", 2), comment_thread("t1", 0)]]
+        client = comment_client(pages)
+
+        items = list(CommentCrawler(client).crawl("vid1", include_replies=False))
+
+        assert len(items) == 2
+        client.get_all_comment_replies.assert_not_called()
+
+    def test_errors_propagate_to_consumer(self, comment_thread, comment_client):
+        """Test an exception raised by a reply fetch is re-raised from the generator."""
+        client = comment_client([[comment_thread("t0", 1)]])
+        client.get_all_comment_replies.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(CommentCrawler(client).crawl("vid1"))
+
+    def test_per_video_concurrency_bounds_reply_fetches(self, comment_thread, comment_client):
+        """Test no more than per_video_concurrency reply fetches run at once."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        client = comment_client([[comment_thread(f"t{i}", 1) for i in range(12)]])
+
+        def replies(thread_id, page_size):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return []
+
+        client.get_all_comment_replies.side_effect = replies
+        items = list(CommentCrawler(client, max_workers=8, per_video_concurrency=2).crawl("vid1"))
+
+        assert len(items) == 12
+        assert state["peak"] <= 2
+
+    def test_closing_early_stops_the_crawl(self, comment_thread, comment_client):
+        """Test closing the generator stops walking further pages."""
+        pages = [[comment_thread(f"p{page}_{i}", 0) for i in range(5)] for page in range(50)]
+        client = comment_client(pages)
+
+        crawl = CommentCrawler(client, max_pending=2).crawl("vid1")
+        next(crawl)
+        crawl.close()
+
+        assert client.list_comments.call_count < 50
+
+    def test_ordered_walk_waits_for_a_slow_head_thread(self, comment_thread, comment_client):
+        """Test threads queued behind an unfinished ordered head stay within max_pending."""
+        release = threading.Event()
+        pages = [[comment_thread("t0", 1)]] + [[comment_thread(f"p{page}_{i}", 0) for i in range(5)]
+                                               for page in range(1, 20)]
+        client = comment_client(pages)
+        client.get_all_comment_replies.side_effect = lambda thread_id, page_size: release.wait(5) and []
+        items = []
+        consumer = threading.Thread(
+            target=lambda: items.extend(CommentCrawler(client, max_pending=4).crawl("vid1")))
+        consumer.start()
+
+        time.sleep(0.3)
+        pages_walked = client.list_comments.call_count
+        release.set()
+        consumer.join(5)
+
+        assert pages_walked <= 2
+        assert len(items) == 96
+
+
+class TestCommentCrawlerWithFakeServer:
+    """Test CommentCrawler end to end against the fake API server."""
+
+    def test_crawl_many_collects_every_thread_and_reply(self):
+        """Test all threads and replies of several videos are crawled."""
+        with FakeYouTubeServer(pages=2) as server:
+            client = YouTubeClient("k1,k2", base_url=server.base_url, records=True)
+            crawler = CommentCrawler(client, page_size=10)
+
+            items = list(crawler.crawl_many(["vidA", "vidB"]))
+
+            assert len(items) == 40
+            assert {item["video_id"] for item in items} == {"vidA", "vidB"}
+            for item in items:
+                assert len(item["replies"]) == item["thread"].reply_count
+                assert all(reply.parent_id == item["thread"].id for reply in item["replies"])
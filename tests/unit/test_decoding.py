@@ -0,0 +1,49 @@
+"""Unit tests for pluggable JSON decoders."""
+
+import pytest
+from unittest.mock import Mock
+from tdd_python_demo.youtube_api import decoding
+from tdd_python_demo.youtube_api.decoding import JSONDecoder
+
+BODY = b'{"items": [{"id": "c1", "snippet": {"textDisplay": "caf\\u00e9"}}], "nextPageToken": "t"}'
+EXPECTED = {"items": [{"id": "c1", "snippet": {"textDisplay": "café"}}], "nextPageToken": "t"}
+
+
+class TestJSONDecoder:
+    """Test JSONDecoder backends."""
+
+    def test_json_backend_uses_response_json(self):
+        """Test the stdlib backend defers to response.json()."""
+        response = Mock(content=BODY)
+        response.json.return_value = EXPECTED
+
+        assert JSONDecoder("json").decode_response(response) == EXPECTED
+        response.json.assert_called_once_with()
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec"])
+    def test_fast_backends_decode_raw_bytes(self, name):
+        """Test orjson and msgspec parse the body bytes directly."""
+        pytest.importorskip(name)
+        response = Mock(content=BODY)
+
+        assert JSONDecoder(name).decode_response(response) == EXPECTED
+        response.json.assert_not_called()
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        """Test auto picks the stdlib when no fast backend is installed."""
+        monkeypatch.setattr(decoding, "orjson", None)
+        monkeypatch.setattr(decoding, "msgspec", None)
+
+        assert JSONDecoder("auto").name == "json"
+
+    def test_missing_backend_raises(self, monkeypatch):
+        """Test asking for an uninstalled backend raises RuntimeError."""
+        monkeypatch.setattr(decoding, "orjson", None)
+
+        with pytest.raises(RuntimeError, match="orjson is not installed"):
+            JSONDecoder("orjson")
+
+    def test_unknown_backend_raises(self):
+        """Test an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError):
+            JSONDecoder("yaml")
@@ -0,0 +1,93 @@
+"""Tests for the local fake YouTube API server and the benchmark harness."""
+
+import pytest
+from tdd_python_demo.youtube_api.benchmark import percentile, run_benchmark
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+from tdd_python_demo.youtube_api.retry import RetryPolicy
+
+
+@pytest.fixture
+def server():
+    """Run a fake API server for the duration of a test."""
+    with FakeYouTubeServer(pages=2) as fake:
+        yield fake
+
+
+class TestFakeYouTubeServer:
+    """Test the fake server through YouTubeClient."""
+
+    def test_serves_paginated_comment_threads(self, server):
+        """Test get_all_comments walks every page the server is configured with."""
+        client = YouTubeClient("k1", base_url=server.base_url)
+
+        comments = client.get_all_comments("vid1", page_size=10)
+
+        assert len(comments) == 20
+        assert server.endpoint_counts == {"commentThreads": 2}
+
+    def test_serves_channel_profile_and_statistics(self, server):
+        """Test channels and videos endpoints return parseable resources."""
+        client = YouTubeClient("k1", base_url=server.base_url)
+
+        profile = client.get_channel_profile("@somebody")
+        stats = client.get_video_statistics("vid1")
+
+        assert profile["id"] == "UCsomebody"
+        assert isinstance(profile["subscriber_count"], int)
+        assert isinstance(stats["view_count"], int)
+
+    def test_serves_bulk_recent_videos(self, server):
+        """Test the uploads-playlist path used by get_recent_videos_bulk."""
+        client = YouTubeClient("k1", base_url=server.base_url)
+
+        result = client.get_recent_videos_bulk(["UCaaa", "UCbbb"], max_videos=3)
+
+        assert [len(videos) for videos in result.values()] == [3, 3]
+
+    def test_injected_rate_limits_rotate_keys(self):
+        """Test injected 429s with Retry-After are absorbed by key rotation."""
+        with FakeYouTubeServer(rate_limit_rate=0.3, retry_after=0, seed=3) as fake:
+            client = YouTubeClient("k1,k2,k3", base_url=fake.base_url,
+                                   retry_policy=RetryPolicy(base=0.01, cap=0.05))
+            for i in range(10):
+                client.get_video_statistics(f"vid{i}")
+
+            assert fake.request_count > 10
+
+    def test_injected_quota_errors_exhaust_keys(self):
+        """Test injected 403 quotaExceeded responses park every key."""
+        with FakeYouTubeServer(quota_error_rate=1.0) as fake:
+            client = YouTubeClient("k1,k2", base_url=fake.base_url)
+
+            with pytest.raises(Exception, match="exhausted"):
+                client.get_video_statistics("vid1")
+            assert fake.request_count == 2
+
+
+class TestBenchmark:
+    """Test the benchmark harness."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) is None
+
+    def test_run_benchmark_reports_throughput_and_latency(self, server):
+        """Test run_benchmark counts operations, errors and HTTP requests."""
+        client = YouTubeClient("k1", base_url=server.base_url)
+
+        def operation(i):
+            if i == 0:
+                raise RuntimeError("boom")
+            client.get_video_statistics(f"vid{i}")
+
+        result = run_benchmark(operation, iterations=20, concurrency=4, server=server)
+
+        assert result["operations"] == 20
+        assert result["errors"] == 1
+        assert result["http_requests"] == 19
+        assert result["p50_ms"] <= result["p99_ms"]
+        assert result["requests_per_second"] > 0
@@ -0,0 +1,207 @@
+"""Tests for hedged requests."""
+
+import itertools
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.hedging import HedgingPolicy
+from tdd_python_demo.youtube_api.quota import QuotaLedger
+from tdd_python_demo.youtube_api.transport import Transport
+
+
+def warmed_policy(latency=0.01, **kwargs):
+    """Return a policy that has seen enough calls and latencies to hedge."""
+    kwargs.setdefault("min_samples", 5)
+    policy = HedgingPolicy(**kwargs)
+    for _ in range(kwargs["min_samples"]):
+        policy.observe(latency)
+    policy.calls = 100
+    return policy
+
+
+def stuck_then(value, release):
+    """Return a send() whose first call blocks until ``release`` and later calls return ``value``."""
+    counter = itertools.count()
+
+    def send():
+        if next(counter) == 0:
+            release.wait(5)
+            return "slow"
+        return value
+    return send
+
+
+class TestHedgingDelay:
+    """Test HedgingPolicy.delay()."""
+
+    def test_no_delay_until_warm(self):
+        """Test hedging waits for min_samples latencies."""
+        policy = HedgingPolicy(min_samples=3)
+        policy.observe(0.1)
+        assert policy.delay() is None
+
+    def test_quantile_and_bounds(self):
+        """Test the delay is the latency quantile clamped to the bounds."""
+        policy = HedgingPolicy(quantile=0.9, min_delay=0.0, max_delay=5.0, min_samples=1)
+        for value in range(1, 11):
+            policy.observe(value / 10)
+        assert policy.delay() == 1.0
+        policy.max_delay = 0.5
+        assert policy.delay() == 0.5
+
+    def test_invalid_quantile(self):
+        """Test quantiles outside (0, 1) are rejected."""
+        with pytest.raises(ValueError):
+            HedgingPolicy(quantile=1.5)
+
+
+class TestHedgingCall:
+    """Test HedgingPolicy.call()."""
+
+    def test_fast_call_is_not_hedged(self):
+        """Test a call answering within the delay is returned as is."""
+        policy = warmed_policy(latency=1.0)
+        send = Mock(return_value="ok")
+        assert policy.call(send) == ("ok", False)
+        assert send.call_count == 1
+        policy.close()
+
+    def test_slow_call_is_hedged(self):
+        """Test a stuck call is raced against a duplicate that wins."""
+        policy = warmed_policy()
+        release = threading.Event()
+        assert policy.call(stuck_then("fast", release)) == ("fast", True)
+        release.set()
+        assert policy.stats()["hedge_wins"] == 1
+        policy.close()
+
+    def test_hedge_answer_returns_without_waiting_for_stuck_call(self):
+        """Test the caller gets the duplicate's answer while the first call is still stuck."""
+        policy = warmed_policy(latency=0.01, min_delay=0.0)
+        release = threading.Event()
+        started = time.perf_counter()
+
+        assert policy.call(stuck_then("fast", release)) == ("fast", True)
+
+        assert time.perf_counter() - started < 1
+        assert not release.is_set()
+        assert policy.delay() < 1
+        release.set()
+        policy.close()
+
+    def test_hedge_stands_in_for_failed_call(self):
+        """Test the duplicate's answer is used when the first call fails."""
+        policy = warmed_policy()
+        hedge_done = threading.Event()
+        calls = itertools.count()
+
+        def send():
+            if next(calls) == 0:
+                hedge_done.wait(5)
+                raise TimeoutError("read timed out")
+            hedge_done.set()
+            return "hedge"
+
+        assert policy.call(send) == ("hedge", True)
+        policy.close()
+
+    def test_error_raised_when_every_call_fails(self):
+        """Test the first call's error is raised when the duplicate fails too."""
+        policy = warmed_policy()
+        calls = itertools.count()
+
+        def send():
+            if next(calls) == 0:
+                time.sleep(0.2)
+                raise TimeoutError("read timed out")
+            raise ConnectionError("reset")
+
+        with pytest.raises(TimeoutError):
+            policy.call(send)
+        policy.close()
+
+    def test_hedge_ratio_cap(self):
+        """Test no duplicates are sent once the hedge budget is spent."""
+        policy = warmed_policy(max_ratio=0.0)
+        release = threading.Event()
+        threading.Timer(0.1, release.set).start()
+        assert policy.call(stuck_then("fast", release)) == ("slow", False)
+        assert policy.hedged == 0
+        policy.close()
+
+    def test_expensive_calls_are_not_hedged(self):
+        """Test calls costing more than max_cost run once, unhedged."""
+        policy = warmed_policy(max_cost=1)
+        send = Mock(return_value="ok")
+        assert policy.call(send, cost=100) == ("ok", False)
+        assert send.call_count == 1
+        policy.close()
+
+    def test_failed_first_answer_waits_for_other(self):
+        """Test an error from one call is ignored when the other succeeds."""
+        policy = warmed_policy()
+        release = threading.Event()
+        calls = itertools.count()
+
+        def send():
+            if next(calls) == 0:
+                release.wait(5)
+                return "slow"
+            raise ConnectionError("reset")
+
+        threading.Timer(0.1, release.set).start()
+        assert policy.call(send) == ("slow", True)
+        policy.close()
+
+
+class TestClientHedging:
+    """Test YouTubeClient with timeouts and a hedging policy."""
+
+    def test_timeout_passed_to_transport(self):
+        """Test split connect/read timeouts reach the transport."""
+        response = Mock(status_code=200, content=b'{"items": []}')
+        response.json.return_value = {"items": []}
+        transport = Mock(spec=Transport)
+        transport.errors = ()
+        transport.get.return_value = response
+        client = YouTubeClient("k1", transport=transport, timeout=(2.0, 9.0))
+
+        client.request("https://example.com/videos", {"id": "a"})
+
+        assert transport.get.call_args.args[2] == (2.0, 9.0)
+
+    def test_hedged_request_charges_duplicate(self):
+        """Test a hedged call returns the fast answer and charges both calls."""
+        release = threading.Event()
+        fast = Mock(status_code=200, content=b'{"items": ["fast"]}')
+        fast.json.return_value = {"items": ["fast"]}
+        slow = Mock(status_code=200, content=b'{"items": ["slow"]}')
+        slow.json.return_value = {"items": ["slow"]}
+        calls = itertools.count()
+
+        def get(url, params, timeout):
+            if next(calls) == 0:
+                release.wait(5)
+                return slow
+            return fast
+
+        transport = Mock(spec=Transport)
+        transport.errors = ()
+        transport.get.side_effect = get
+        ledger = QuotaLedger(["k1"])
+        policy = warmed_policy()
+        client = YouTubeClient("k1", transport=transport, quota_ledger=ledger, hedging=policy)
+
+        assert client.request("https://example.com/videos", {"id": "a"}) == {"items": ["fast"]}
+        release.set()
+        assert ledger.used("k1") == 2
+        client.close()
+
+    def test_close_stops_hedging_workers(self):
+        """Test closing the client closes its hedging policy."""
+        policy = Mock(spec=HedgingPolicy)
+        YouTubeClient("k1", hedging=policy).close()
+        policy.close.assert_called_once_with()
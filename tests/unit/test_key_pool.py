@@ -0,0 +1,164 @@
+"""Unit tests for KeyPool."""
+
+import asyncio
+import threading
+
+import pytest
+from tdd_python_demo.youtube_api.key_pool import KeyPool, next_daily_reset
+from tdd_python_demo.youtube_api.quota import QuotaLedger
+
+# 2024-01-15 12:00:00 America/Los_Angeles (PST)
+NOON_PACIFIC = 1705348800.0
+
+
+@pytest.fixture
+def clock_start():
+    return NOON_PACIFIC
+
+
+class TestNextDailyReset:
+    """Test next_daily_reset()."""
+
+    def test_returns_next_midnight_pacific(self):
+        """Test the reset is the following midnight in Pacific time."""
+        assert next_daily_reset(NOON_PACIFIC) == NOON_PACIFIC + 12 * 3600
+
+
+class TestKeyPoolSelection:
+    """Test key selection strategies."""
+
+    def test_round_robin_spreads_load(self, clock):
+        """Test round robin cycles through all keys."""
+        pool = KeyPool(["key1", "key2", "key3"], clock=clock)
+
+        assert [pool.acquire() for _ in range(4)] == ["key1", "key2", "key3", "key1"]
+
+    def test_weighted_follows_weights(self, clock):
+        """Test weighted selection hands out keys in proportion to weight."""
+        pool = KeyPool(["key1", "key2"], strategy="weighted",
+                       weights={"key1": 3, "key2": 1}, clock=clock)
+
+        picks = [pool.acquire() for _ in range(8)]
+
+        assert picks.count("key1") == 6
+        assert picks.count("key2") == 2
+
+    def test_weighted_with_ledger_skips_keys_without_budget(self, clock):
+        """Test keys that cannot afford the request are not handed out."""
+        ledger = QuotaLedger(["key1", "key2"], daily_quota=150)
+        ledger.charge("key1", 100)
+        pool = KeyPool(["key1", "key2"], strategy="weighted", quota_ledger=ledger, clock=clock)
+
+        assert pool.acquire(units=100) == "key2"
+
+    def test_rejects_unknown_strategy(self):
+        """Test an unknown strategy raises ValueError."""
+        with pytest.raises(ValueError):
+            KeyPool(["key1"], strategy="random")
+
+
+class TestKeyPoolHealth:
+    """Test cooldowns, quota exhaustion and the daily reset."""
+
+    def test_rate_limited_key_recovers_after_cooldown(self, clock):
+        """Test a rate-limited key comes back once its cooldown elapses."""
+        pool = KeyPool(["key1"], cooldown=30, clock=clock)
+
+        pool.report_rate_limited("key1")
+        assert pool.acquire() is None
+        assert pool.next_available_in() == 30
+
+        clock.now += 30
+        assert pool.acquire() == "key1"
+
+    def test_cooldown_grows_with_consecutive_failures_and_honours_retry_after(self, clock):
+        """Test repeated failures double the cooldown and Retry-After overrides it."""
+        pool = KeyPool(["key1"], cooldown=10, clock=clock)
+
+        pool.report_rate_limited("key1")
+        pool.report_rate_limited("key1")
+        assert pool.next_available_in() == 20
+
+        pool.report_rate_limited("key1", retry_after=3)
+        assert pool.next_available_in() == 3
+
+    def test_quota_exceeded_key_returns_after_daily_reset(self, clock):
+        """Test an exhausted key stays out until midnight Pacific and the ledger resets."""
+        ledger = QuotaLedger(["key1"], daily_quota=100)
+        pool = KeyPool(["key1"], quota_ledger=ledger, clock=clock)
+
+        pool.report_quota_exceeded("key1")
+        clock.now += 6 * 3600
+        assert pool.acquire() is None
+        assert pool.health()["key1"]["exhausted"] is True
+
+        clock.now += 6 * 3600
+        assert pool.acquire() == "key1"
+        assert ledger.remaining("key1") == 100
+
+    def test_wait_for_key_sleeps_until_recovery(self, clock):
+        """Test wait_for_key blocks until a cooled-down key is usable again."""
+        pool = KeyPool(["key1"], cooldown=5, clock=clock)
+        pool.report_rate_limited("key1")
+
+        def sleep(seconds):
+            clock.now += seconds
+
+        assert pool.wait_for_key(sleep=sleep) == "key1"
+        assert pool.wait_for_key(timeout=0) == "key1"
+
+    def test_acquire_async_times_out(self):
+        """Test acquire_async returns None when no key recovers in time."""
+        pool = KeyPool(["key1"], cooldown=60)
+        pool.report_rate_limited("key1")
+
+        assert asyncio.run(pool.acquire_async(timeout=0.02)) is None
+
+
+class TestKeyPoolConcurrency:
+    """Test KeyPool under concurrent use."""
+
+    def test_concurrent_round_robin_is_balanced(self, clock):
+        """Test many threads acquiring keys get an even split."""
+        pool = KeyPool(["key1", "key2", "key3", "key4"], clock=clock)
+        picks = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(250):
+                key = pool.acquire()
+                with lock:
+                    picks.append(key)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert {key: picks.count(key) for key in set(picks)} == {
+            "key1": 500, "key2": 500, "key3": 500, "key4": 500
+        }
+
+    def test_reserve_never_overspends_a_ledger(self, clock):
+        """Test reserving acquisitions hand out exactly the budget, even under contention."""
+        ledger = QuotaLedger(["key1", "key2"], daily_quota=100)
+        pool = KeyPool(["key1", "key2"], strategy="weighted", quota_ledger=ledger, clock=clock)
+        granted = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                key = pool.acquire(units=3, reserve=True)
+                if key is not None:
+                    with lock:
+                        granted.append(key)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(granted) == 66
+        assert ledger.used("key1") == ledger.used("key2") == 99
@@ -0,0 +1,115 @@
+"""Unit tests for client hooks and MetricsCollector."""
+
+import pytest
+from unittest.mock import Mock, patch
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+from tdd_python_demo.youtube_api.metrics import MetricsCollector
+
+
+class TestMetricsCollector:
+    """Test MetricsCollector aggregation and dumps."""
+
+    def make_collector(self):
+        collector = MetricsCollector()
+        collector.on_response({"endpoint": "videos", "status": 200, "seconds": 0.02,
+                               "decode_seconds": 0.001, "bytes": 300, "units": 1})
+        collector.on_response({"endpoint": "videos", "status": 503, "seconds": 3.0, "bytes": 20, "units": 1})
+        collector.on_retry({"endpoint": "videos", "reason": "status", "delay": 1.5})
+        collector.on_rotate({"endpoint": "search", "key": "k1", "reason": "rate_limited"})
+        return collector
+
+    def test_snapshot_aggregates_per_endpoint(self):
+        """Test the snapshot holds histogram, bytes, units, retries and rotations."""
+        snapshot = self.make_collector().snapshot()
+
+        videos = snapshot["videos"]
+        assert videos["requests"] == 2
+        assert videos["latency_buckets"]["0.025"] == 1
+        assert videos["latency_buckets"]["5.0"] == 2
+        assert videos["latency_buckets"]["+Inf"] == 2
+        assert videos["bytes"] == 320
+        assert videos["quota_units"] == 2
+        assert videos["statuses"] == {"200": 1, "503": 1}
+        assert videos["retries"] == {"status": 1}
+        assert videos["backoff_seconds_sum"] == 1.5
+        assert snapshot["search"]["key_rotations"] == 1
+
+    def test_prometheus_dump(self):
+        """Test the Prometheus text format exposes histogram and counters."""
+        text = self.make_collector().to_prometheus()
+
+        assert '# TYPE youtube_api_request_duration_seconds histogram' in text
+        assert 'youtube_api_request_duration_seconds_bucket{endpoint="videos",le="+Inf"} 2' in text
+        assert 'youtube_api_request_duration_seconds_count{endpoint="videos"} 2' in text
+        assert 'youtube_api_quota_units_total{endpoint="videos"} 2' in text
+        assert 'youtube_api_retries_total{endpoint="videos",reason="status"} 1' in text
+        assert 'youtube_api_key_rotations_total{endpoint="search"} 1' in text
+
+    def test_json_dump(self):
+        """Test the JSON dump round-trips the snapshot."""
+        import json
+        collector = self.make_collector()
+        assert json.loads(collector.to_json()) == collector.snapshot()
+
+
+class TestClientHooks:
+    """Test hook registration and emission in YouTubeClient."""
+
+    def test_rejects_unknown_event(self):
+        """Test add_hook validates the event name."""
+        client = YouTubeClient(api_keys="k1")
+        with pytest.raises(ValueError):
+            client.add_hook("on_everything", print)
+
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_no_hooks_means_no_event_work(self, mock_get):
+        """Test requests without hooks never build event data."""
+        mock_get.return_value = Mock(status_code=200, content=b'{}', json=lambda: {})
+        client = YouTubeClient(api_keys="k1")
+
+        with patch.object(YouTubeClient, "_emit") as mock_emit:
+            client.request("https://api.example.com/test", {})
+
+        mock_emit.assert_not_called()
+
+    @patch('tdd_python_demo.youtube_api.client.time.sleep')
+    @patch('tdd_python_demo.youtube_api.transport.requests.Session.get')
+    def test_hooks_see_request_response_retry_and_rotate(self, mock_get, mock_sleep):
+        """Test each event fires with its endpoint."""
+        mock_get.side_effect = [
+            Mock(status_code=429, headers={}, content=b"{}", json=lambda: {}),
+            Mock(status_code=503, headers={}, content=b"{}"),
+            Mock(status_code=200, content=b'{"items": []}', json=lambda: {"items": []}),
+        ]
+        events = []
+        client = YouTubeClient(api_keys="k1,k2,k3")
+        for event in ("on_request", "on_response", "on_retry", "on_rotate"):
+            client.add_hook(event, lambda data, event=event: events.append((event, data)))
+
+        client.request("https://www.googleapis.com/youtube/v3/videos", {})
+
+        assert [name for name, _ in events] == [
+            "on_request", "on_response", "on_rotate",
+            "on_request", "on_response", "on_retry",
+            "on_request", "on_response",
+        ]
+        assert all(data["endpoint"] == "videos" for _, data in events)
+        assert events[-1][1]["bytes"] == len(b'{"items": []}')
+
+
+class TestMetricsAgainstFakeServer:
+    """Test the collector end to end against the fake API server."""
+
+    def test_collects_quota_units_and_bytes(self):
+        """Test search is charged 100 units and bytes are counted."""
+        collector = MetricsCollector()
+        with FakeYouTubeServer() as server:
+            client = YouTubeClient("k1", base_url=server.base_url)
+            client.add_hooks(collector)
+            client.get_channel_profile("UCabc", include_recent_videos=True, max_videos=2)
+
+        snapshot = collector.snapshot()
+        assert snapshot["search"]["quota_units"] == 100
+        assert snapshot["channels"]["requests"] == 1
+        assert snapshot["videos"]["bytes"] > 0
@@ -0,0 +1,102 @@
+"""Unit tests for slotted record models."""
+
+import sys
+
+import pytest
+from tdd_python_demo.youtube_api.models import (
+    ChannelRecord,
+    CommentRecord,
+    VideoRecord,
+    VideoStatistics,
+)
+
+
+class TestRecords:
+    """Test record behaviour shared by all models."""
+
+    def test_records_have_no_instance_dict(self):
+        """Test records are slotted."""
+        record = VideoRecord("v1")
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unexpected = 1
+
+    def test_counts_convert_lazily_and_once(self):
+        """Test raw count strings stay raw until read, then are cached as int."""
+        record = VideoStatistics("1000", "oops", None)
+
+        assert record._view_count == "1000"
+        assert record.view_count == 1000
+        assert record._view_count == 1000
+        assert record.like_count is None
+        assert record.comment_count is None
+
+    def test_records_compare_equal_to_dicts(self):
+        """Test records are read-only mappings matching the client's dicts."""
+        record = VideoStatistics("1", "2", "3")
+
+        assert record == {"view_count": 1, "like_count": 2, "comment_count": 3}
+        assert record["like_count"] == 2
+        assert record.get("missing", "N/A") == "N/A"
+        with pytest.raises(KeyError):
+            record["missing"]
+
+    def test_record_is_smaller_than_dict(self):
+        """Test a record is smaller than the dict it replaces."""
+        record = VideoRecord("v1", "t", "d", "1", "2")
+        assert sys.getsizeof(record) < sys.getsizeof(record.to_dict())
+
+
+class TestChannelRecord:
+    """Test ChannelRecord."""
+
+    ITEM = {
+        "snippet": {"title": "Chan", "customUrl": "@chan"},
+        "statistics": {"viewCount": "10", "subscriberCount": "5"},
+    }
+
+    def test_from_item_without_recent_videos(self):
+        """Test recent_videos is not a key until set."""
+        record = ChannelRecord.from_item("UC1", self.ITEM)
+
+        assert record.to_dict() == {
+            "id": "UC1", "title": "Chan", "description": None, "custom_url": "@chan",
+            "thumbnails": {}, "view_count": 10, "subscriber_count": 5, "video_count": None,
+        }
+        assert "recent_videos" not in record
+
+    def test_to_dict_converts_nested_videos(self):
+        """Test recent video records become dicts."""
+        record = ChannelRecord.from_item("UC1", self.ITEM)
+        record.recent_videos = [VideoRecord.from_item({"id": "v1", "statistics": {"viewCount": "3"}})]
+
+        assert record.to_dict()["recent_videos"] == [
+            {"id": "v1", "title": None, "description": None, "view_count": 3, "like_count": None}
+        ]
+
+
+class TestCommentRecord:
+    """Test CommentRecord."""
+
+    def test_from_comment_thread(self):
+        """Test a commentThreads item is flattened."""
+        item = {
+            "id": "t1",
+            "snippet": {
+                "videoId": "v1",
+                "totalReplyCount": 2,
+                "topLevelComment": {"snippet": {
+                    "authorDisplayName": "ann", "authorChannelId": {"value": "UCann"},
+                    "textDisplay": "hi", "likeCount": 4, "publishedAt": "2024-01-01T00:00:00Z",
+                }},
+            },
+        }
+
+        record = CommentRecord.from_item(item)
+
+        assert record.id == "t1"
+        assert record.video_id == "v1"
+        assert record.author_channel_id == "UCann"
+        assert record.like_count == 4
+        assert record.reply_count == 2
+        assert record.published_at == "2024-01-01T00:00:00Z"
@@ -0,0 +1,132 @@
+"""Tests for the resumable comment ingestion pipeline."""
+
+import json
+from unittest.mock import Mock
+
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+from tdd_python_demo.youtube_api.pipeline import Checkpoint, CommentPipeline, comment_row
+from tdd_python_demo.youtube_api.sinks import JSONLinesSink
+
+
+class _ListSink:
+    """In-memory sink that flushes every ``batch_size`` rows."""
+
+    def __init__(self, batch_size=1):
+        self.batch_size = batch_size
+        self.rows = []
+        self.buffer = []
+
+    def write(self, rows):
+        self.buffer.extend(rows)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self):
+        self.rows.extend(self.buffer)
+        self.buffer = []
+
+
+class TestCommentRow:
+    """Test comment_row()."""
+
+    def test_flattens_thread_item(self, comment_thread):
+        """Test a raw commentThreads item becomes a flat CommentRecord dict."""
+        row = comment_row(comment_thread("t1"))
+
+        assert row["id"] == "t1"
+        assert row["text"] == "hi"
+
+    def test_video_id_from_fetcher(self, comment_thread):
+        """Test the fetched-for video ID fills rows whose item lacks one."""
+        assert comment_row(comment_thread("t1"))["video_id"] is None
+        assert comment_row(comment_thread("t1"), "vid1")["video_id"] == "vid1"
+
+
+class TestCheckpoint:
+    """Test Checkpoint persistence."""
+
+    def test_commit_and_reload(self, tmp_path):
+        """Test committed progress is read back by a new checkpoint."""
+        path = str(tmp_path / "state.json")
+        checkpoint = Checkpoint(path)
+        checkpoint.update("vid1", "tok2", False, 10)
+        checkpoint.update("vid1", "tok3", False, 5)
+        checkpoint.commit()
+
+        assert Checkpoint(path).get("vid1") == {"page_token": "tok3", "done": False, "comments": 15}
+
+    def test_uncommitted_progress_is_not_persisted(self, tmp_path):
+        """Test staged updates do not reach disk without commit()."""
+        path = str(tmp_path / "state.json")
+        Checkpoint(path).update("vid1", "tok2", False, 10)
+
+        assert Checkpoint(path).get("vid1")["page_token"] is None
+
+
+class TestCommentPipeline:
+    """Test CommentPipeline."""
+
+    def test_ingests_all_videos(self, comment_thread, comment_client):
+        """Test every page of every video reaches the sink."""
+        client = comment_client({
+            "v1": [[comment_thread("a1"), comment_thread("a2")], [comment_thread("a3")]],
+            "v2": [[comment_thread("b1")]],
+        })
+        sink = _ListSink()
+
+        summary = CommentPipeline(client, sink).run(["v1", "v2", "v1"])
+
+        assert sorted((row["video_id"], row["id"]) for row in sink.rows) == [
+            ("v1", "a1"), ("v1", "a2"), ("v1", "a3"), ("v2", "b1")]
+        assert summary["comments"] == 4
+        assert sorted(summary["completed"]) == ["v1", "v2"]
+        assert summary["errors"] == {}
+
+    def test_resumes_from_checkpointed_page_token(self, comment_thread, comment_client, tmp_path):
+        """Test an interrupted video resumes at its token and finished videos are skipped."""
+        path = str(tmp_path / "state.json")
+        pages = {"v1": [[comment_thread("a1")], [comment_thread("a2")], [comment_thread("a3")]],
+                 "v2": [[comment_thread("b1")]]}
+        sink = _ListSink()
+
+        first = CommentPipeline(comment_client(pages, fail_at={("v1", 1)}), sink,
+                                checkpoint=path).run(["v1", "v2"])
+        client = comment_client(pages)
+        second = CommentPipeline(client, sink, checkpoint=path).run(["v1", "v2"])
+
+        assert first["errors"] == {"v1": "boom"}
+        assert second["skipped"] == ["v2"]
+        assert [call.kwargs["page_token"] for call in client.list_comments.call_args_list] == ["1", "2"]
+        assert sorted(row["id"] for row in sink.rows) == ["a1", "a2", "a3", "b1"]
+        assert Checkpoint(path).get("v1") == {"page_token": None, "done": True, "comments": 3}
+
+    def test_checkpoint_waits_for_sink_flush(self, comment_thread, comment_client, tmp_path):
+        """Test page tokens are not committed while their rows sit in the sink buffer."""
+        path = str(tmp_path / "state.json")
+        client = comment_client({"v1": [[comment_thread("a1")], [comment_thread("a2")]]})
+        sink = _ListSink(batch_size=100)
+        pipeline = CommentPipeline(client, sink, checkpoint=path)
+        pipeline.sink.flush = Mock(side_effect=KeyboardInterrupt)
+
+        try:
+            pipeline.run(["v1"])
+        except KeyboardInterrupt:
+            pass
+
+        assert Checkpoint(path).get("v1")["page_token"] is None
+
+    def test_end_to_end_with_fake_server(self, tmp_path):
+        """Test the pipeline writes gzip JSON Lines from the fake API server."""
+        out = str(tmp_path / "comments.jsonl.gz")
+        with FakeYouTubeServer(pages=3) as server, JSONLinesSink(out, batch_size=25) as sink:
+            client = YouTubeClient("k1", base_url=server.base_url)
+            summary = CommentPipeline(client, sink, checkpoint=str(tmp_path / "state.json"),
+                                      page_size=10).run(["vidA", "vidB"])
+
+        assert summary["comments"] == 60
+        assert sink.rows_written == 60
+        with open(tmp_path / "state.json", encoding="utf-8") as f:
+            assert all(state["done"] for state in json.load(f)["videos"].values())
@@ -0,0 +1,83 @@
+"""Unit tests for the token bucket and quota ledger."""
+
+import pytest
+from tdd_python_demo.youtube_api.quota import (
+    TokenBucket,
+    QuotaLedger,
+    endpoint_cost,
+)
+
+
+class TestEndpointCost:
+    """Test endpoint_cost()."""
+
+    def test_search_costs_100_units(self):
+        """Test search is charged 100 units."""
+        assert endpoint_cost("https://www.googleapis.com/youtube/v3/search") == 100
+
+    def test_list_endpoints_cost_1_unit(self):
+        """Test videos and unknown endpoints are charged 1 unit."""
+        assert endpoint_cost("https://www.googleapis.com/youtube/v3/videos") == 1
+        assert endpoint_cost("https://api.example.com/test") == 1
+
+
+class TestTokenBucket:
+    """Test TokenBucket pacing."""
+
+    def test_allows_burst_up_to_capacity(self, clock):
+        """Test a full bucket hands out capacity tokens without waiting."""
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_acquire_waits_for_refill(self, clock):
+        """Test acquire sleeps until a token has been refilled."""
+        bucket = TokenBucket(rate=4, capacity=1, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.25)
+        assert clock.sleeps == [pytest.approx(0.25)]
+
+    def test_rejects_non_positive_rate(self):
+        """Test a zero rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestQuotaLedger:
+    """Test QuotaLedger accounting and key selection."""
+
+    def test_best_key_prefers_most_remaining_budget(self):
+        """Test best_key picks the key with the most units left."""
+        ledger = QuotaLedger(["key1", "key2"], daily_quota=1000)
+        ledger.charge("key1", 300)
+        ledger.charge("key2", 100)
+
+        assert ledger.best_key(["key1", "key2"]) == "key2"
+        assert ledger.remaining("key1") == 700
+
+    def test_best_key_skips_keys_that_cannot_afford_cost(self):
+        """Test best_key returns None when no key can afford the endpoint."""
+        ledger = QuotaLedger(["key1"], daily_quota=150)
+        ledger.charge("key1", 60)
+
+        assert ledger.best_key(["key1"], units=100) is None
+        assert ledger.best_key(["key1"], units=1) == "key1"
+
+    def test_exhaust_and_reset(self):
+        """Test exhaust removes a key's budget until reset."""
+        ledger = QuotaLedger(["key1"], daily_quota=100)
+        ledger.exhaust("key1")
+        assert ledger.remaining("key1") == 0
+
+        ledger.reset()
+        assert ledger.remaining("key1") == 100
+
+    def test_refund_returns_reserved_units(self):
+        """Test refund gives units back without going below zero."""
+        ledger = QuotaLedger(["key1"], daily_quota=100)
+        ledger.charge("key1", 5)
+        ledger.refund("key1", 5)
+        ledger.refund("key1", 5)
+
+        assert ledger.used("key1") == 0
@@ -0,0 +1,97 @@
+"""Tests for channel input parsing and the handle cache."""
+
+import pytest
+from tdd_python_demo.youtube_api.resolver import HandleCache, parse_channel_input, parse_video_id
+
+
+@pytest.fixture
+def clock_start():
+    return 1000.0
+
+
+class TestParseVideoId:
+    """Test parse_video_id()."""
+
+    @pytest.mark.parametrize("value", [
+        "dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s",
+        "youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+        "https://m.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/live/dQw4w9WgXcQ",
+    ])
+    def test_recognised_forms(self, value):
+        """Test IDs are extracted from bare IDs and video URL forms."""
+        assert parse_video_id(value) == "dQw4w9WgXcQ"
+
+    @pytest.mark.parametrize("value", ["short", "https://example.com/watch?v=dQw4w9WgXcQ",
+                                       "https://www.youtube.com/watch?v=bad"])
+    def test_unrecognised_forms_raise(self, value):
+        """Test anything else raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="Unable to parse video ID"):
+            parse_video_id(value)
+
+
+class TestParseChannelInput:
+    """Test parse_channel_input()."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("UCabc123", ("id", "UCabc123")),
+        ("@somebody", ("handle", "somebody")),
+        ("https://www.youtube.com/channel/UCabc123", ("id", "UCabc123")),
+        ("https://www.youtube.com/channel/UCabc123/videos", ("id", "UCabc123")),
+        ("https://youtube.com/@somebody", ("handle", "somebody")),
+        ("youtube.com/@somebody/videos?view=0", ("handle", "somebody")),
+        ("https://m.youtube.com/@some%C3%A9body", ("handle", "someébody")),
+        ("https://www.youtube.com/c/SomeName", ("custom", "SomeName")),
+        ("http://www.youtube.com/user/oldname", ("username", "oldname")),
+    ])
+    def test_recognised_forms(self, value, expected):
+        """Test IDs, handles and channel URL forms are classified."""
+        assert parse_channel_input(value) == expected
+
+    @pytest.mark.parametrize("value", [
+        "somebody",
+        "https://example.com/@somebody",
+        "https://notyoutube.com/channel/UCabc",
+        "https://www.youtube.com/watch?v=abc",
+        "https://www.youtube.com/channel/notanid",
+    ])
+    def test_unrecognised_forms_raise(self, value):
+        """Test anything else raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="Unable to resolve channel ID"):
+            parse_channel_input(value)
+
+
+class TestHandleCache:
+    """Test HandleCache."""
+
+    def test_miss_then_hit_case_insensitive(self):
+        """Test a stored handle is found regardless of case."""
+        with HandleCache() as cache:
+            assert cache.get("handle", "Somebody") == (False, None)
+            cache.set("handle", "Somebody", "UC1")
+
+            assert cache.get("handle", "somebody") == (True, "UC1")
+
+    def test_negative_entries_use_shorter_ttl(self, clock):
+        """Test unknown handles are cached as None and expire after negative_ttl."""
+        with HandleCache(ttl=1000, negative_ttl=10, clock=clock) as cache:
+            cache.set("handle", "nobody", None)
+            cache.set("handle", "somebody", "UC1")
+            assert cache.get("handle", "nobody") == (True, None)
+
+            clock.now += 11
+            assert cache.get("handle", "nobody") == (False, None)
+            assert cache.get("handle", "somebody") == (True, "UC1")
+            assert cache.purge() == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a file-backed cache is shared between runs."""
+        path = str(tmp_path / "handles.db")
+        with HandleCache(path) as cache:
+            cache.set("custom", "Name", "UC2")
+
+        with HandleCache(path) as cache:
+            assert cache.get("custom", "name") == (True, "UC2")
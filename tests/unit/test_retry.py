@@ -0,0 +1,130 @@
+"""Unit tests for retry policy, retry budget and circuit breaker."""
+
+import random
+
+import pytest
+from tdd_python_demo.youtube_api.retry import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Test parse_retry_after()."""
+
+    def test_delta_seconds(self):
+        """Test a numeric header is returned as seconds."""
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        """Test an HTTP-date header is converted to seconds from now."""
+        now = 1705348800.0  # Mon, 15 Jan 2024 20:00:00 GMT
+        assert parse_retry_after("Mon, 15 Jan 2024 20:00:30 GMT", now=now) == 30.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_malformed(self, value):
+        """Test missing or unparseable headers give None."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy delays."""
+
+    def test_delays_stay_within_decorrelated_jitter_bounds(self):
+        """Test each delay lies in [base, min(cap, previous * 3)]."""
+        policy = RetryPolicy(base=1, cap=20, rng=random.Random(7))
+        previous = None
+        for _ in range(20):
+            delay = policy.next_delay(previous)
+            upper = 3 if previous is None else min(20, previous * 3)
+            assert 1 <= delay <= upper
+            previous = delay
+
+    def test_jitter_desynchronizes_workers(self):
+        """Test two workers with different seeds do not retry in lockstep."""
+        first = RetryPolicy(rng=random.Random(1))
+        second = RetryPolicy(rng=random.Random(2))
+
+        assert first.next_delay(4.0) != second.next_delay(4.0)
+
+    def test_first_retries_are_jittered(self):
+        """Test first retries spread over [base, base * 3] instead of all waiting base."""
+        policy = RetryPolicy(base=1, rng=random.Random(3))
+
+        delays = [policy.next_delay() for _ in range(20)]
+
+        assert all(1 <= delay <= 3 for delay in delays)
+        assert len(set(delays)) == 20
+
+    def test_retry_after_extends_delay_up_to_cap(self):
+        """Test a longer Retry-After wins but stays capped."""
+        policy = RetryPolicy(base=1, cap=30, rng=random.Random(0))
+
+        assert policy.next_delay(None, retry_after=12) == 12
+        assert policy.next_delay(None, retry_after=600) == 30
+
+
+class TestRetryBudget:
+    """Test RetryBudget."""
+
+    def test_budget_runs_out_and_refills(self, clock):
+        """Test retries stop when tokens are spent and resume as time passes."""
+        budget = RetryBudget(ratio=0.5, min_per_second=1, max_tokens=2, clock=clock)
+
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+
+        budget.deposit()
+        budget.deposit()
+        assert budget.try_withdraw() is True
+
+        clock.now += 1
+        assert budget.try_withdraw() is True
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold_and_half_opens_after_timeout(self, clock):
+        """Test the breaker sheds requests until the recovery timeout elapses."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow() is True
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.allow() is False
+
+        clock.now += 10
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # only one trial while half-open
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self, clock):
+        """Test a failure while half-open re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow() is True
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_released_trial_frees_the_slot(self, clock):
+        """Test a half-open trial without a verdict can be given back."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow() is True
+        assert breaker.allow() is False
+
+        breaker.release()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() is True
@@ -0,0 +1,171 @@
+"""Tests for the adaptive channel watch scheduler."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.scheduler import ChannelWatcher
+
+
+@pytest.fixture
+def clock_start():
+    return 1000.0
+
+
+def _client(profiles):
+    """Mock client answering get_channel_profiles from a mutable dict of profiles."""
+    client = Mock()
+    client.get_channel_profiles.side_effect = lambda ids: {
+        cid: dict(profiles[cid]) for cid in ids if cid in profiles
+    }
+    return client
+
+
+class TestChannelWatcher:
+    """Test ChannelWatcher scheduling and change detection."""
+
+    def test_first_poll_emits_every_channel(self, clock):
+        """Test newly watched channels are reported on their first poll."""
+        client = _client({"UC1": {"id": "UC1", "video_count": 1}, "UC2": {"id": "UC2", "video_count": 2}})
+        watcher = ChannelWatcher(client, clock=clock)
+        watcher.add("UC1")
+        watcher.add("UC2")
+
+        changed = watcher.poll()
+
+        assert [profile["id"] for profile in changed] == ["UC1", "UC2"]
+        client.get_channel_profiles.assert_called_once_with(["UC1", "UC2"])
+
+    def test_only_changed_profiles_are_emitted(self, clock):
+        """Test unchanged channels are not reported again."""
+        profiles = {"UC1": {"id": "UC1", "video_count": 1}, "UC2": {"id": "UC2", "video_count": 2}}
+        watcher = ChannelWatcher(_client(profiles), min_interval=10, clock=clock)
+        watcher.add("UC1")
+        watcher.add("UC2")
+        watcher.poll()
+
+        profiles["UC2"]["video_count"] = 3
+        clock.now += 10
+        changed = watcher.poll()
+
+        assert changed == [{"id": "UC2", "video_count": 3}]
+
+    def test_ignores_fields_outside_watch_fields(self, clock):
+        """Test view count churn alone does not count as a change."""
+        profiles = {"UC1": {"id": "UC1", "video_count": 1, "view_count": 5}}
+        watcher = ChannelWatcher(_client(profiles), min_interval=10, clock=clock)
+        watcher.add("UC1")
+        watcher.poll()
+
+        profiles["UC1"]["view_count"] = 6
+        clock.now += 10
+
+        assert watcher.poll() == []
+
+    def test_interval_backs_off_while_unchanged_and_speeds_up_on_change(self, clock):
+        """Test polling intervals adapt to how often a channel changes."""
+        profiles = {"UC1": {"id": "UC1", "video_count": 1}}
+        watcher = ChannelWatcher(_client(profiles), min_interval=10, max_interval=35, clock=clock)
+        watcher.add("UC1")
+        watcher.poll()
+        assert watcher.interval("UC1") == 10
+
+        for expected in (20, 35, 35):
+            clock.now = watcher.next_due()
+            watcher.poll()
+            assert watcher.interval("UC1") == expected
+
+        profiles["UC1"]["video_count"] = 2
+        clock.now = watcher.next_due()
+        watcher.poll()
+        assert watcher.interval("UC1") == 17.5
+
+    def test_channels_not_yet_due_are_not_polled(self, clock):
+        """Test poll only fetches channels whose due time has passed."""
+        client = _client({"UC1": {"id": "UC1"}, "UC2": {"id": "UC2"}})
+        watcher = ChannelWatcher(client, prefetch_window=0, clock=clock)
+        watcher.add("UC1")
+        watcher.add("UC2", due=clock.now + 100)
+
+        watcher.poll()
+
+        client.get_channel_profiles.assert_called_once_with(["UC1"])
+        assert watcher.next_due() == clock.now + 100
+
+    def test_batches_fill_with_channels_due_soon(self, clock):
+        """Test channels due within the prefetch window join a partial batch."""
+        client = _client({})
+        watcher = ChannelWatcher(client, prefetch_window=60, clock=clock)
+        watcher.add("UC1")
+        watcher.add("UC2", due=clock.now + 30)
+        watcher.add("UC3", due=clock.now + 90)
+
+        watcher.poll()
+
+        client.get_channel_profiles.assert_called_once_with(["UC1", "UC2"])
+
+    def test_due_channels_are_split_into_50_id_batches(self, clock):
+        """Test more than 50 due channels need several requests."""
+        client = _client({})
+        watcher = ChannelWatcher(client, clock=clock)
+        for i in range(120):
+            watcher.add(f"UC{i}")
+
+        watcher.poll()
+
+        assert [len(call.args[0]) for call in client.get_channel_profiles.call_args_list] == [50, 50, 20]
+
+    def test_failed_batch_is_rescheduled(self, clock):
+        """Test channels of a failed request stay watched and the error propagates."""
+        client = Mock()
+        client.get_channel_profiles.side_effect = RuntimeError("boom")
+        watcher = ChannelWatcher(client, min_interval=10, clock=clock)
+        watcher.add("UC1")
+
+        with pytest.raises(RuntimeError):
+            watcher.poll()
+
+        assert "UC1" in watcher
+        assert watcher.next_due() == clock.now + 10
+
+    def test_remove_stops_polling(self, clock):
+        """Test removed channels are dropped from the queue."""
+        client = _client({})
+        watcher = ChannelWatcher(client, clock=clock)
+        watcher.add("UC1")
+        watcher.remove("UC1")
+
+        assert watcher.poll() == []
+        assert watcher.next_due() is None
+        client.get_channel_profiles.assert_not_called()
+
+    def test_run_sleeps_until_due_and_reports_changes(self, clock):
+        """Test run() waits for the next due time and calls on_change."""
+        watcher = ChannelWatcher(_client({"UC1": {"id": "UC1"}}), clock=clock, sleep=clock.sleep)
+        watcher.add("UC1", due=clock.now + 5)
+        seen = []
+
+        watcher.run(seen.append, max_polls=2)
+
+        assert seen == [{"id": "UC1"}]
+        assert clock.now == 1005.0 + 300
+
+
+class TestGetChannelProfiles:
+    """Test get_channel_profiles() method."""
+
+    @patch.object(YouTubeClient, 'request')
+    def test_fetches_in_50_id_batches(self, mock_request):
+        """Test channel IDs are deduplicated and split into 50-ID requests."""
+        mock_request.side_effect = lambda url, params: {
+            "items": [{"id": cid, "snippet": {"title": cid}, "statistics": {"videoCount": "3"}}
+                      for cid in params["id"].split(",") if cid != "UCmissing"]
+        }
+
+        client = YouTubeClient(api_keys="test_key")
+        profiles = client.get_channel_profiles([f"UC{i}" for i in range(60)] + ["UC0", "UCmissing"])
+
+        assert mock_request.call_count == 2
+        assert len(profiles) == 60
+        assert profiles["UC7"]["video_count"] == 3
+        assert "UCmissing" not in profiles
@@ -0,0 +1,137 @@
+"""Tests for the SQLite-backed shared quota store and key pool."""
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.key_pool import next_daily_reset
+from tdd_python_demo.youtube_api.shared_quota import SharedKeyPool, SharedQuotaStore
+
+
+@pytest.fixture
+def clock_start():
+    return 1_700_000_000.0
+
+
+def _reserve_until_empty(path, keys, units, results, start=None):
+    if start is not None:
+        start.wait()
+    store = SharedQuotaStore(path, daily_quota=1000)
+    pool = SharedKeyPool(keys, store)
+    count = 0
+    while pool.acquire(units, reserve=True) is not None:
+        count += 1
+    store.close()
+    results.put(count)
+
+
+class TestSharedQuotaStore:
+    """Test SharedQuotaStore."""
+
+    def test_ledger_api(self, tmp_path):
+        """Test charge, refund, exhaust and best_key behave like QuotaLedger."""
+        with SharedQuotaStore(str(tmp_path / "quota.db"), daily_quota=100) as store:
+            store.register(["a", "b"])
+            store.charge("a", 30)
+            store.charge("b", 10)
+            store.refund("b", 5)
+            assert store.used("a") == 30
+            assert store.remaining("b") == 95
+            assert store.best_key(["a", "b"], units=1) == "b"
+            store.exhaust("b")
+            assert store.remaining("b") == 0
+            assert store.best_key(["a", "b"], units=80) is None
+            assert store.cost("https://www.googleapis.com/youtube/v3/search") == 100
+
+    def test_instances_share_state(self, tmp_path):
+        """Test two connections to one file see each other's spending."""
+        path = str(tmp_path / "quota.db")
+        first, second = SharedQuotaStore(path), SharedQuotaStore(path)
+        first.register(["a"])
+        first.charge("a", 7)
+        assert second.used("a") == 7
+        first.close()
+        second.close()
+
+    def test_daily_reset(self, clock, tmp_path):
+        """Test spending is forgotten after midnight Pacific."""
+        with SharedQuotaStore(str(tmp_path / "quota.db"), clock=clock) as store:
+            store.register(["a"])
+            store.charge("a", 50)
+            clock.now = next_daily_reset(clock.now) + 1
+            assert store.used("a") == 0
+
+
+class TestSharedKeyPool:
+    """Test SharedKeyPool."""
+
+    def test_cooldown_seen_by_other_process_pool(self, clock, tmp_path):
+        """Test a rate-limited key is skipped by a pool on another connection."""
+        path = str(tmp_path / "quota.db")
+        pool_a = SharedKeyPool(["a", "b"], SharedQuotaStore(path, clock=clock))
+        pool_b = SharedKeyPool(["a", "b"], SharedQuotaStore(path, clock=clock))
+        pool_a.report_rate_limited("a", retry_after=30)
+        assert {pool_b.acquire() for _ in range(4)} == {"b"}
+        assert pool_b.health()["a"]["cooldown_remaining"] == 30
+        clock.now += 31
+        assert pool_b.health()["a"]["available"] is True
+
+    def test_quota_exceeded_until_reset(self, clock, tmp_path):
+        """Test an exhausted key waits for the daily reset."""
+        pool = SharedKeyPool(["a"], SharedQuotaStore(str(tmp_path / "quota.db"), clock=clock))
+        pool.report_quota_exceeded("a")
+        assert pool.acquire() is None
+        assert pool.next_available_in() == next_daily_reset(clock.now) - clock.now
+        clock.now = next_daily_reset(clock.now)
+        assert pool.acquire() == "a"
+
+    def test_round_robin_uses_least_recently_picked(self, tmp_path):
+        """Test round robin rotates through keys."""
+        pool = SharedKeyPool(["a", "b", "c"], SharedQuotaStore(str(tmp_path / "quota.db")),
+                             strategy="round_robin")
+        assert [pool.acquire() for _ in range(4)] == ["a", "b", "c", "a"]
+
+    def test_weighted_prefers_most_remaining(self, tmp_path):
+        """Test weighted selection picks the key with the most budget left."""
+        store = SharedQuotaStore(str(tmp_path / "quota.db"))
+        pool = SharedKeyPool(["a", "b"], store)
+        store.charge("a", 500)
+        assert pool.acquire(100, reserve=True) == "b"
+        assert store.used("b") == 100
+
+    def test_threads_never_overspend(self, tmp_path):
+        """Test concurrent reservations stop exactly at the daily quota."""
+        store = SharedQuotaStore(str(tmp_path / "quota.db"), daily_quota=1000)
+        pool = SharedKeyPool(["a", "b"], store)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            keys = list(executor.map(lambda _: pool.acquire(100, reserve=True), range(40)))
+        assert sum(key is not None for key in keys) == 20
+        assert store.used("a") == store.used("b") == 1000
+
+    def test_processes_never_overspend(self, tmp_path):
+        """Test processes opening a new store at the same moment add up to the budget."""
+        path = str(tmp_path / "quota.db")
+        results = multiprocessing.Queue()
+        start = multiprocessing.Barrier(4)
+        workers = [multiprocessing.Process(target=_reserve_until_empty,
+                                           args=(path, ["a", "b"], 100, results, start))
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+        assert sum(results.get(timeout=5) for _ in workers) == 20
+
+    def test_client_reserves_through_store(self, tmp_path):
+        """Test YouTubeClient reserves quota in the shared store."""
+        store = SharedQuotaStore(str(tmp_path / "quota.db"))
+        pool = SharedKeyPool(["k1", "k2"], store)
+        client = YouTubeClient("k1,k2", quota_ledger=store, key_pool=pool)
+        response = Mock(status_code=200, content=b'{"items": []}')
+        response.json.return_value = {"items": []}
+        client.session.get = Mock(return_value=response)
+        client.request("https://www.googleapis.com/youtube/v3/search", {})
+        assert store.used("k1") + store.used("k2") == 100
+        assert sum(h["successes"] for h in pool.health().values()) == 1
@@ -0,0 +1,90 @@
+"""Tests for single-flight call coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+from tdd_python_demo.youtube_api.singleflight import SingleFlight
+
+
+def _run_together(flight, key, fn, callers=5):
+    """Call flight.do(key, fn) from ``callers`` threads; returns their futures."""
+    executor = ThreadPoolExecutor(max_workers=callers)
+    futures = [executor.submit(flight.do, key, fn) for _ in range(callers)]
+    executor.shutdown(wait=False)
+    return futures
+
+
+class TestSingleFlight:
+    """Test SingleFlight."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test callers arriving while a call is in flight get its result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(2)
+            return {"items": []}
+
+        futures = _run_together(flight, "k", slow)
+        while flight.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+
+        results = [future.result() for future in futures]
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.in_flight() == 0
+
+    def test_exception_is_shared_and_key_released(self):
+        """Test followers see the leader's exception and later calls run again."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(2)
+            raise RuntimeError("boom")
+
+        futures = _run_together(flight, "k", failing, callers=3)
+        while flight.coalesced < 2:
+            time.sleep(0.001)
+        release.set()
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result()
+        assert flight.do("k", lambda: "again") == "again"
+
+    def test_different_keys_do_not_coalesce(self):
+        """Test distinct keys run independently."""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.coalesced == 0
+
+
+class TestClientCoalescing:
+    """Test YouTubeClient(coalesce=True) against the fake server."""
+
+    def test_identical_concurrent_requests_hit_the_api_once(self):
+        """Test threads asking for the same video at once share one HTTP request."""
+        with FakeYouTubeServer(latency=0.2) as server:
+            client = YouTubeClient("k1,k2", base_url=server.base_url, coalesce=True)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda _: client.get_video_statistics("vid1"), range(8)))
+                other = client.get_video_statistics("vid222")
+
+            assert all(result == results[0] for result in results)
+            assert other != results[0]
+            assert server.endpoint_counts["videos"] == 2
+
+    def test_coalescing_is_off_by_default(self):
+        """Test clients without coalesce send every request."""
+        assert YouTubeClient("k1").single_flight is None
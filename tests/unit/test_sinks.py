@@ -0,0 +1,71 @@
+"""Tests for batched comment sinks."""
+
+import gzip
+import json
+
+import pytest
+from tdd_python_demo.youtube_api import sinks
+from tdd_python_demo.youtube_api.sinks import JSONLinesSink, ParquetSink, open_sink
+
+
+class TestJSONLinesSink:
+    """Test JSONLinesSink."""
+
+    def test_buffers_until_batch_size(self, tmp_path):
+        """Test rows are written only once a batch fills up."""
+        path = str(tmp_path / "out.jsonl")
+        sink = JSONLinesSink(path, batch_size=3)
+
+        assert sink.write([{"id": 1}, {"id": 2}]) is False
+        assert sink.write([{"id": 3}]) is True
+        sink.close()
+
+        with open(path, encoding="utf-8") as f:
+            assert [json.loads(line)["id"] for line in f] == [1, 2, 3]
+        assert sink.rows_written == 3
+
+    def test_gzip_members_append_across_sinks(self, tmp_path):
+        """Test a reopened .gz sink appends and all rows read back as one stream."""
+        path = str(tmp_path / "out.jsonl.gz")
+        with JSONLinesSink(path, batch_size=1) as sink:
+            sink.write([{"id": "a"}])
+        with JSONLinesSink(path) as sink:
+            sink.write([{"id": "b", "text": "héllo"}])
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert rows == [{"id": "a"}, {"id": "b", "text": "héllo"}]
+
+
+class TestParquetSink:
+    """Test ParquetSink."""
+
+    def test_requires_pyarrow(self, tmp_path, monkeypatch):
+        """Test a clear error is raised when pyarrow is missing."""
+        monkeypatch.setattr(sinks, "pyarrow", None)
+
+        with pytest.raises(RuntimeError, match="pyarrow is not installed"):
+            ParquetSink(str(tmp_path / "dataset"))
+
+    def test_writes_one_part_file_per_batch(self, tmp_path):
+        """Test each batch becomes a readable part file."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        directory = tmp_path / "dataset"
+        with ParquetSink(str(directory), batch_size=2) as sink:
+            sink.write([{"id": "a", "like_count": 1}, {"id": "b", "like_count": 2}])
+            sink.write([{"id": "c", "like_count": 3}])
+
+        assert sorted(p.name for p in directory.iterdir()) == ["part-00000.parquet", "part-00001.parquet"]
+        assert pq.read_table(str(directory)).num_rows == 3
+
+
+class TestOpenSink:
+    """Test open_sink()."""
+
+    def test_picks_json_lines_by_extension(self, tmp_path):
+        """Test .jsonl.gz paths get a JSONLinesSink."""
+        sink = open_sink(str(tmp_path / "out.jsonl.gz"), batch_size=10)
+
+        assert isinstance(sink, JSONLinesSink)
+        assert sink.batch_size == 10
+        sink.close()
@@ -0,0 +1,136 @@
+"""Tests for incremental comment sync."""
+
+from unittest.mock import patch
+
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.models import CommentRecord
+from tdd_python_demo.youtube_api.sync import CommentSync, SyncStore
+
+
+class TestSyncStore:
+    """Test SyncStore."""
+
+    def test_get_unknown_video_returns_none(self):
+        """Test videos never synced have no state."""
+        with SyncStore() as store:
+            assert store.get("vid1") is None
+
+    def test_save_updates_watermark_and_accumulates_count(self, tmp_path):
+        """Test saving twice keeps the latest watermark and sums comment counts."""
+        path = str(tmp_path / "sync.db")
+        with SyncStore(path) as store:
+            store.save("vid1", "2024-01-01T00:00:00Z", {"a"}, 3, 100.0)
+            store.save("vid1", "2024-01-02T00:00:00Z", {"c", "b"}, 2, 200.0)
+
+        with SyncStore(path) as store:
+            assert store.get("vid1") == {
+                "newest_published_at": "2024-01-02T00:00:00Z",
+                "newest_ids": ["b", "c"],
+                "comment_count": 5,
+                "synced_at": 200.0,
+            }
+
+
+class TestCommentSync:
+    """Test CommentSync."""
+
+    def test_first_sync_fetches_everything(self, comment_thread, comment_client):
+        """Test a video with no state is paged through completely."""
+        client = comment_client([[comment_thread("c3", published_at="2024-01-03T00:00:00Z")],
+                                 [comment_thread("c1", published_at="2024-01-01T00:00:00Z")]])
+        with SyncStore() as store:
+            new = CommentSync(client, store, clock=lambda: 10.0).sync("vid1")
+
+            assert [c["id"] for c in new] == ["c3", "c1"]
+            assert store.get("vid1")["newest_published_at"] == "2024-01-03T00:00:00Z"
+            assert store.get("vid1")["newest_ids"] == ["c3"]
+        assert client.list_comments.call_args.kwargs["order"] == "time"
+
+    def test_stops_paging_at_already_seen_comments(self, comment_thread, comment_client):
+        """Test only comments newer than the watermark are returned and later pages are skipped."""
+        client = comment_client([
+            [comment_thread("c5", published_at="2024-01-05T00:00:00Z"),
+             comment_thread("c4", published_at="2024-01-04T00:00:00Z"),
+             comment_thread("c3", published_at="2024-01-03T00:00:00Z")],
+            [comment_thread("c2", published_at="2024-01-02T00:00:00Z")],
+        ])
+        with SyncStore() as store:
+            store.save("vid1", "2024-01-03T00:00:00Z", {"c3"}, 3, 0.0)
+
+            new = CommentSync(client, store).sync("vid1")
+
+            assert [c["id"] for c in new] == ["c5", "c4"]
+            assert client.list_comments.call_count == 1
+            assert store.get("vid1")["comment_count"] == 5
+
+    def test_keeps_new_comments_sharing_the_watermark_timestamp(self, comment_thread, comment_client):
+        """Test a new comment posted in the same second as the watermark is not lost."""
+        client = comment_client([[comment_thread("c4", published_at="2024-01-03T00:00:00Z"),
+                                  comment_thread("c3", published_at="2024-01-03T00:00:00Z"),
+                                  comment_thread("c2", published_at="2024-01-02T00:00:00Z")]])
+        with SyncStore() as store:
+            store.save("vid1", "2024-01-03T00:00:00Z", {"c3"}, 3, 0.0)
+
+            new = CommentSync(client, store).sync("vid1")
+
+            assert [c["id"] for c in new] == ["c4"]
+            assert store.get("vid1")["newest_ids"] == ["c3", "c4"]
+
+    def test_unchanged_video_returns_nothing(self, comment_thread, comment_client):
+        """Test a sync with no new comments keeps the watermark."""
+        client = comment_client([[comment_thread("c3", published_at="2024-01-03T00:00:00Z")]])
+        with SyncStore() as store:
+            store.save("vid1", "2024-01-03T00:00:00Z", {"c3"}, 3, 0.0)
+
+            assert CommentSync(client, store).sync("vid1") == []
+            assert store.get("vid1")["newest_ids"] == ["c3"]
+
+    def test_accepts_comment_records(self, comment_client):
+        """Test records-mode clients are supported."""
+        client = comment_client([[CommentRecord(id="c2", published_at="2024-01-02T00:00:00Z"),
+                           CommentRecord(id="c1", published_at="2024-01-01T00:00:00Z")]])
+        with SyncStore() as store:
+            store.save("vid1", "2024-01-01T00:00:00Z", {"c1"}, 1, 0.0)
+
+            assert [c.id for c in CommentSync(client, store).sync("vid1")] == ["c2"]
+
+    def test_sync_many(self, comment_thread, comment_client):
+        """Test several videos are synced and keyed by video ID."""
+        client = comment_client([[comment_thread("c1", published_at="2024-01-01T00:00:00Z")]])
+        with SyncStore() as store:
+            result, errors = CommentSync(client, store).sync_many(["v1", "v2", "v1"])
+
+        assert list(result) == ["v1", "v2"]
+        assert errors == {}
+
+    def test_sync_many_keeps_comments_of_videos_that_synced(self, comment_thread, comment_client):
+        """Test one failing video does not lose the comments of the others."""
+        client = comment_client([[comment_thread("c1", published_at="2024-01-01T00:00:00Z")]])
+        list_comments = client.list_comments.side_effect
+
+        def flaky(video_id, **kwargs):
+            if video_id == "bad":
+                raise RuntimeError("boom")
+            return list_comments(video_id, **kwargs)
+
+        client.list_comments.side_effect = flaky
+        with SyncStore() as store:
+            result, errors = CommentSync(client, store).sync_many(["bad", "good"])
+
+            assert [c["id"] for c in result["good"]] == ["c1"]
+            assert store.get("good")["comment_count"] == 1
+            assert str(errors["bad"]) == "boom"
+            assert store.get("bad") is None
+
+
+class TestListCommentsOrder:
+    """Test the order parameter of list_comments()."""
+
+    @patch.object(YouTubeClient, 'request')
+    def test_order_is_passed_through(self, mock_request):
+        """Test order=time reaches the commentThreads request."""
+        mock_request.return_value = {"items": []}
+
+        YouTubeClient(api_keys="test_key").list_comments("video123", order="time")
+
+        assert mock_request.call_args[0][1]["order"] == "time"
@@ -0,0 +1,101 @@
+"""Tests for the compact statistics snapshot store."""
+
+import json
+
+import pytest
+from tdd_python_demo.youtube_api.models import VideoStatistics
+from tdd_python_demo.youtube_api.timeseries import MISSING, SnapshotStore
+
+DAY = 86400
+
+
+class TestSnapshotStore:
+    """Test SnapshotStore."""
+
+    def test_round_trip(self, tmp_path):
+        """Test flushed snapshots come back as typed columns in time order."""
+        path = str(tmp_path / "stats.tsdb")
+        with SnapshotStore(path) as store:
+            store.record("vid1", {"view_count": 100, "like_count": 5}, timestamp=DAY)
+            store.record("vid1", {"view_count": 150, "like_count": None}, timestamp=2 * DAY)
+            store.record("UC1", {"subscriber_count": 10, "view_count": 7}, timestamp=DAY)
+
+        with SnapshotStore(path) as store:
+            series = store.series("vid1")
+            assert sorted(store.entities()) == ["UC1", "vid1"]
+        assert list(series["timestamp"]) == [DAY, 2 * DAY]
+        assert list(series["view_count"]) == [100, 150]
+        assert list(series["like_count"]) == [5, MISSING]
+        assert series["view_count"].typecode == "q"
+
+    def test_blocks_from_several_flushes_merge(self, tmp_path):
+        """Test appends across flushes and sessions form one series."""
+        path = str(tmp_path / "stats.tsdb")
+        store = SnapshotStore(path)
+        store.record("vid1", {"view_count": 3}, timestamp=3 * DAY)
+        store.flush()
+        store.record("vid1", {"view_count": 1}, timestamp=DAY)
+        store.close()
+        with SnapshotStore(path) as store:
+            store.record("vid1", {"view_count": 4}, timestamp=4 * DAY)
+            store.flush()
+            assert list(store.series("vid1")["view_count"]) == [1, 3, 4]
+
+    def test_range_query(self, tmp_path):
+        """Test series is limited to start <= timestamp < end."""
+        with SnapshotStore(str(tmp_path / "stats.tsdb")) as store:
+            for day in range(10):
+                store.record("vid1", {"view_count": day * 10}, timestamp=day * DAY)
+            store.flush()
+            series = store.series("vid1", start=2 * DAY, end=5 * DAY)
+            assert list(series["view_count"]) == [20, 30, 40]
+            assert len(store.series("vid1", start=20 * DAY)["timestamp"]) == 0
+            assert len(store.series("unknown")["timestamp"]) == 0
+
+    def test_rate(self, tmp_path):
+        """Test rate of change per day, skipping missing counters."""
+        with SnapshotStore(str(tmp_path / "stats.tsdb")) as store:
+            store.record("vid1", {"view_count": 100, "like_count": None}, timestamp=0)
+            store.record("vid1", {"view_count": 400, "like_count": 10}, timestamp=2 * DAY)
+            store.record("vid1", {"view_count": 700, "like_count": 40}, timestamp=4 * DAY)
+            store.record("vid2", {"view_count": 1}, timestamp=0)
+            store.flush()
+            assert store.rate("vid1", "view_count") == 150
+            assert store.rate("vid1", "like_count") == 15
+            assert store.rate("vid1", "view_count", per=3600, start=2 * DAY) == pytest.approx(6.25)
+            assert store.rates(["vid1", "vid2"], "view_count") == {"vid1": 150, "vid2": None}
+            with pytest.raises(ValueError, match="Unknown metric"):
+                store.rate("vid1", "dislikes")
+
+    def test_records_client_results(self, tmp_path):
+        """Test slotted statistics records can be recorded directly."""
+        with SnapshotStore(str(tmp_path / "stats.tsdb"), clock=lambda: 1234.9) as store:
+            store.record("vid1", VideoStatistics(view_count="42", like_count="3", comment_count="1"))
+            store.flush()
+            series = store.series("vid1")
+        assert list(series["timestamp"]) == [1234]
+        assert (series["view_count"][0], series["comment_count"][0]) == (42, 1)
+
+    def test_torn_tail_is_ignored(self, tmp_path):
+        """Test a partially written block is skipped and overwritten by the next flush."""
+        path = tmp_path / "stats.tsdb"
+        with SnapshotStore(str(path)) as store:
+            store.record("vid1", {"view_count": 1}, timestamp=0)
+        with open(path, "ab") as f:
+            f.write(b"\x40\x04vid")
+        with SnapshotStore(str(path)) as store:
+            assert list(store.series("vid1")["view_count"]) == [1]
+            store.record("vid1", {"view_count": 2}, timestamp=DAY)
+        with SnapshotStore(str(path)) as store:
+            assert list(store.series("vid1")["view_count"]) == [1, 2]
+
+    def test_much_smaller_than_json(self, tmp_path):
+        """Test hourly snapshots take a fraction of their JSON size."""
+        path = tmp_path / "stats.tsdb"
+        rows = [{"view_count": 1_000_000 + hour * 250, "like_count": 40_000 + hour * 9,
+                 "comment_count": 3_000 + hour} for hour in range(24 * 30)]
+        with SnapshotStore(str(path)) as store:
+            for hour, row in enumerate(rows):
+                store.record("vid1", row, timestamp=1_700_000_000 + hour * 3600)
+        as_json = sum(len(json.dumps(dict(row, timestamp=0))) for row in rows)
+        assert path.stat().st_size * 5 < as_json
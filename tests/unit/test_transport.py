@@ -0,0 +1,182 @@
+"""Tests for the pluggable client transports."""
+
+import shutil
+import ssl
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from tdd_python_demo.youtube_api import transport as transport_module
+from tdd_python_demo.youtube_api.archive import ResponseArchive
+from tdd_python_demo.youtube_api.client import YouTubeClient
+from tdd_python_demo.youtube_api.fake_server import FakeYouTubeServer
+from tdd_python_demo.youtube_api.transport import (
+    HTTPXTransport, RecordingTransport, ReplayTransport, RequestsTransport, Transport,
+)
+
+
+@pytest.fixture(scope="module")
+def certificate(tmp_path_factory):
+    """Create a self-signed certificate for 127.0.0.1."""
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl is not available")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+                    "-keyout", str(key), "-out", str(cert)],
+                   check=True, capture_output=True)
+    return str(cert), str(key)
+
+
+@pytest.fixture
+def tls_server(certificate):
+    """Run the fake API server over HTTPS."""
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(*certificate)
+    context.set_alpn_protocols(["http/1.1"])
+    with FakeYouTubeServer(pages=2, ssl_context=context) as server:
+        yield server
+
+
+@pytest.fixture
+def h2_server(certificate):
+    """Run the fake API server over HTTPS with HTTP/2 only."""
+    pytest.importorskip("h2")
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(*certificate)
+    with FakeYouTubeServer(pages=2, ssl_context=context, http2=True) as server:
+        yield server
+
+
+class TestRequestsTransport:
+    """Test RequestsTransport."""
+
+    def test_get_uses_session(self):
+        """Test get passes params and timeout to the session."""
+        session = Mock()
+        transport = RequestsTransport(session=session)
+
+        transport.get("https://example.com", {"a": 1}, timeout=5)
+
+        session.get.assert_called_once_with("https://example.com", params={"a": 1}, timeout=5)
+        assert transport.errors == (requests.exceptions.RequestException,)
+
+    def test_client_over_tls(self, tls_server, certificate):
+        """Test the client talks to an HTTPS server through the default transport."""
+        assert tls_server.base_url.startswith("https://")
+        with YouTubeClient("k1", base_url=tls_server.base_url,
+                           transport=RequestsTransport(verify=certificate[0])) as client:
+            assert len(client.get_all_comments("vid1", page_size=10)) == 20
+
+    def test_untrusted_certificate_is_a_network_error(self, tls_server):
+        """Test verification failures surface as retryable transport errors."""
+        transport = RequestsTransport()
+        with pytest.raises(transport.errors):
+            transport.get(f"{tls_server.base_url}/videos", {"id": "vid1"}, timeout=5)
+
+
+class TestHTTPXTransport:
+    """Test HTTPXTransport."""
+
+    def test_missing_httpx(self):
+        """Test a clear error when httpx is not installed."""
+        with patch.object(transport_module, "httpx", None):
+            with pytest.raises(RuntimeError, match="httpx is not installed"):
+                HTTPXTransport()
+
+    def test_concurrent_requests_over_tls(self, h2_server, certificate):
+        """Test many threads share one multiplexed HTTP/2 connection to the TLS server."""
+        pytest.importorskip("httpx")
+        transport = HTTPXTransport(max_connections=2, verify=certificate[0])
+        url = f"{h2_server.base_url}/videos"
+        versions = []
+
+        def get(i):
+            response = transport.get(url, {"id": f"vid{i}", "part": "statistics", "key": "k1"}, (5, 5))
+            versions.append(response.http_version)
+            return response
+
+        get(0)  # the first request opens (and negotiates) the connection
+        with YouTubeClient("k1", base_url=h2_server.base_url, transport=transport) as client:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(get, range(1, 8)))
+                stats = list(executor.map(client.get_video_statistics, [f"vid{i}" for i in range(16)]))
+        assert all(isinstance(item["view_count"], int) for item in stats)
+        assert set(versions) == {"HTTP/2"}
+        assert h2_server.connection_count == 1
+        assert h2_server.endpoint_counts == {"videos": 24}
+
+    def test_fake_server_needs_h2_for_http2(self, certificate):
+        """Test the HTTP/2 stand-in reports a missing h2 package clearly."""
+        with patch("tdd_python_demo.youtube_api.fake_server.h2", None):
+            with pytest.raises(RuntimeError, match="h2 is not installed"):
+                FakeYouTubeServer(ssl_context=ssl.create_default_context(ssl.Purpose.CLIENT_AUTH),
+                                  http2=True)
+
+
+class TestClientTransport:
+    """Test YouTubeClient with a custom transport."""
+
+    def test_uses_given_transport(self):
+        """Test requests, network-error retries and close go through the transport."""
+        class FlakyError(Exception):
+            pass
+
+        response = Mock(status_code=200, content=b'{"items": []}')
+        response.json.return_value = {"items": []}
+        transport = Mock(spec=Transport)
+        transport.errors = (FlakyError,)
+        transport.get.side_effect = [FlakyError(), response]
+        client = YouTubeClient("k1", transport=transport)
+
+        with patch("tdd_python_demo.youtube_api.client.time.sleep"):
+            assert client.request("https://example.com/videos", {"id": "x"}) == {"items": []}
+
+        assert transport.get.call_count == 2
+        assert client.session is None
+        client.close()
+        transport.close.assert_called_once()
+
+
+class TestRecordReplay:
+    """Test RecordingTransport and ReplayTransport."""
+
+    def test_replay_matches_live_crawl(self, tmp_path):
+        """Test a recorded crawl replays identically without the server."""
+        path = str(tmp_path / "crawl.arc")
+        with FakeYouTubeServer(pages=2) as server, ResponseArchive(path, mode="a") as archive:
+            base_url = server.base_url
+            transport = RecordingTransport(RequestsTransport(), archive)
+            with YouTubeClient("k1", base_url=base_url, transport=transport) as client:
+                live = (client.get_all_comments("vid1", page_size=10), client.get_video_statistics("vid1"))
+
+        with ResponseArchive(path) as archive:
+            client = YouTubeClient("other-key", base_url=base_url, transport=ReplayTransport(archive))
+            replayed = (client.get_all_comments("vid1", page_size=10), client.get_video_statistics("vid1"))
+
+        assert replayed == live
+
+    def test_replay_miss_raises(self, tmp_path):
+        """Test requests missing from the archive fail without retries."""
+        path = str(tmp_path / "crawl.arc")
+        ResponseArchive(path, mode="a").close()
+        with ResponseArchive(path) as archive:
+            client = YouTubeClient("k1", transport=ReplayTransport(archive))
+            with pytest.raises(RuntimeError, match="No archived response"):
+                client.get_video_statistics("vid1")
+
+    def test_replayed_rate_limit_keeps_retry_after(self, tmp_path):
+        """Test archived headers the client relies on survive the round trip."""
+        path = str(tmp_path / "crawl.arc")
+        inner = Mock(spec=Transport)
+        inner.errors = ()
+        inner.get.return_value = Mock(status_code=429, headers={"Retry-After": "7", "Server": "x"},
+                                      content=b"{}")
+        with ResponseArchive(path, mode="a") as archive:
+            RecordingTransport(inner, archive).get("https://x/videos", {"id": "a"}, timeout=5)
+            response = ReplayTransport(archive).get("https://x/videos", {"id": "a", "key": "k"}, timeout=5)
+        assert response.status_code == 429
+        assert response.headers == {"Retry-After": "7"}